@@ -1,18 +1,36 @@
 """DVC-OSF: Open Science Framework plugin for DVC."""
 
+import os
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import PathFinder
+
 __version__ = "1.0.4"
 
 from dvc_osf.exceptions import OSFException
-from dvc_osf.filesystem import OSFFileSystem
 
 __all__ = ["OSFFileSystem", "OSFException", "__version__"]
 
 
+def __getattr__(name):
+    """Import OSFFileSystem on first access.
+
+    Callers that only need the exceptions do not pay for importing the
+    filesystem stack (requests, fsspec, dvc-objects).
+    """
+    if name == "OSFFileSystem":
+        from dvc_osf.filesystem import OSFFileSystem
+
+        return OSFFileSystem
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _register_with_dvc():
     """Register OSF scheme with DVC's filesystem registry and config schema.
 
-    This runs at import time so that ``pip install dvc-osf`` is sufficient
-    to make ``osf://`` URLs available in DVC commands.
+    This runs as soon as DVC imports ``dvc.config_schema`` (see
+    ``_RegisterOnSchemaImport``), so that ``pip install dvc-osf`` is
+    sufficient to make ``osf://`` URLs available in DVC commands.
     """
     # 1. Register in dvc-objects known_implementations / registry
     try:
@@ -47,4 +65,52 @@ def _register_with_dvc():
         pass
 
 
-_register_with_dvc()
+class _RegisterOnSchemaImport(MetaPathFinder):
+    """Import hook that calls ``_register_with_dvc()`` once DVC needs it.
+
+    ``dvc_osf`` is imported at interpreter startup by
+    ``dvc_osf_register.pth``. Registering there would import
+    ``dvc.config_schema`` in every Python process; instead this finder
+    waits until DVC imports its config schema itself and registers
+    right after that module has executed.
+    """
+
+    target = "dvc.config_schema"
+
+    def find_spec(self, fullname, path, target=None):
+        """Wrap the loader of ``dvc.config_schema``; ignore other modules."""
+        if fullname != self.target:
+            return None
+
+        # One-shot: remove ourselves before delegating to avoid recursion.
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+        spec = PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def _exec_and_register(module):
+            exec_module(module)
+            _register_with_dvc()
+
+        spec.loader.exec_module = _exec_and_register
+        return spec
+
+
+def _install_registration_hook():
+    """Register now if DVC is already loaded, otherwise defer to import time."""
+    if _RegisterOnSchemaImport.target in sys.modules:
+        _register_with_dvc()
+        return
+
+    if not any(isinstance(f, _RegisterOnSchemaImport) for f in sys.meta_path):
+        sys.meta_path.insert(0, _RegisterOnSchemaImport())
+
+
+if os.environ.get("DVC_OSF_EAGER_REGISTER"):
+    _register_with_dvc()
+else:
+    _install_registration_hook()
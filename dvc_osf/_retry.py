@@ -0,0 +1,78 @@
+"""Retry helper for multi-request OSF operations."""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+from .config import Config
+from .exceptions import OSFException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def retry_with_backoff(
+    fn: Callable[[], T],
+    max_retries: int = Config.MAX_RETRIES,
+    base: float = Config.RETRY_BASE_DELAY,
+    cap: float = Config.RETRY_MAX_DELAY,
+    jitter: float = Config.RETRY_JITTER,
+    retry_on: Optional[Tuple[Type[OSFException], ...]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> T:
+    """
+    Call ``fn`` and retry it with exponential backoff on transient errors.
+
+    Individual HTTP requests are already retried by ``OSFAPIClient``; this
+    is for operations spanning several requests that can fail as a whole,
+    such as an upload that races OSF's eventually consistent listings.
+
+    The delay before retry ``n`` is ``min(cap, base * 2**n)`` scaled by a
+    random factor in ``[1, 1 + jitter]``, unless the error supplies its own
+    (``Retry-After`` on rate limits).
+
+    Args:
+        fn: Operation to run
+        max_retries: Retries after the first attempt
+        base: Base delay in seconds
+        cap: Maximum backoff delay in seconds
+        jitter: Maximum fractional jitter added to the backoff
+        retry_on: Exception types to retry; defaults to any OSF error
+            flagged ``retryable``
+        cancel: Event that, once set, ends the wait and re-raises the error
+
+    Returns:
+        The result of ``fn``
+
+    Raises:
+        OSFException: The last error, or any error that is not retried
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except OSFException as e:
+            if retry_on is not None:
+                should_retry = isinstance(e, retry_on)
+            else:
+                should_retry = e.retryable
+            attempt += 1
+            if not should_retry or attempt > max_retries:
+                raise
+
+            backoff = min(cap, base * 2**attempt) * (1 + random.uniform(0, jitter))
+            delay = e.delay(backoff, jitter)
+            logger.debug(
+                "Retrying after %s (attempt %d/%d, %.1fs)",
+                type(e).__name__,
+                attempt,
+                max_retries,
+                delay,
+            )
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                raise
@@ -1,28 +1,239 @@
 """OSF API client for interacting with the Open Science Framework."""
 
 import logging
+import random
+import socket
+import threading
 import time
-from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import closing
+from functools import lru_cache
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.poolmanager import PoolKey
+from urllib3.util.retry import Retry
 
 from .auth import format_auth_header
 from .config import Config
-from .exceptions import (
-    OSFAPIError,
-    OSFAuthenticationError,
-    OSFConnectionError,
-    OSFFileLockedError,
-    OSFNotFoundError,
-    OSFPermissionError,
-    OSFQuotaExceededError,
-    OSFRateLimitError,
-    OSFVersionConflictError,
-)
+from .exceptions import OSFConnectionError, OSFException, raise_for_status
+from .utils import ProgressTracker, dump_json, load_json
 
 logger = logging.getLogger(__name__)
 
+# Headers for file downloads: raw bytes, no transfer compression.
+DOWNLOAD_HEADERS = {
+    "Accept": "application/octet-stream",
+    "Accept-Encoding": "identity",
+}
+
+# Number of resolved relative URLs memoized by _resolve_url, shared by all
+# clients in the process.
+URL_CACHE_SIZE = 512
+
+# Maximum number of GET responses kept in each client's response cache.
+GET_CACHE_SIZE = 256
+
+# GET cache entry: (expires_at, etag, response)
+_CacheEntry = Tuple[float, Optional[str], requests.Response]
+
+# Error bodies larger than this are not parsed for a message; proxies and
+# load balancers can return multi-megabyte HTML pages on failure.
+MAX_ERROR_BODY_SIZE = 64 * 1024
+
+# Bytes read from an upload body per socket send. urllib3's default (16 KiB,
+# 8 KiB on 1.26) costs a Python-level read/send round per block, which
+# dominates CPU time on multi-GB uploads. Zero-copy sendfile() is not an
+# option: OSF is only served over TLS, where the kernel cannot splice file
+# pages into the socket, and upload bodies are MD5-hashed as they are read.
+UPLOAD_BLOCK_SIZE = 1024 * 1024
+
+# urllib3 2.x pools accept a per-connection block size; 1.26 rejects it.
+_POOL_SUPPORTS_BLOCKSIZE = "key_blocksize" in PoolKey._fields
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _resolve_url(base_url: str, url: str) -> str:
+    """
+    Resolve an endpoint relative to ``base_url``.
+
+    Memoized across clients, since DVC creates many filesystem instances
+    that hit the same few endpoints repeatedly.
+
+    Args:
+        base_url: API base URL without a trailing slash
+        url: Absolute URL or endpoint path starting with ``/``
+
+    Returns:
+        Absolute URL
+    """
+    if url[:1] != "/":
+        return url
+    return base_url + url
+
+
+def _error_body_parseable(headers: Mapping[str, str]) -> bool:
+    """
+    Check whether an error response body is worth parsing for a message.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        True for JSON bodies no larger than MAX_ERROR_BODY_SIZE
+    """
+    if "json" not in headers.get("Content-Type", ""):
+        return False
+
+    try:
+        content_length = int(headers.get("Content-Length", 0))
+    except (TypeError, ValueError):
+        content_length = 0
+    return content_length <= MAX_ERROR_BODY_SIZE
+
+
+def _error_message_from_data(data: Any) -> Optional[str]:
+    """
+    Pull a human-readable message out of a parsed OSF error body.
+
+    Args:
+        data: Decoded JSON error body
+
+    Returns:
+        Error message if found, None otherwise
+    """
+    if not isinstance(data, dict):
+        return None
+
+    # OSF API error format varies, try common fields
+    errors = data.get("errors")
+    first = errors[0] if isinstance(errors, list) and errors else None
+    message = (
+        (first.get("detail") if isinstance(first, dict) else None)
+        or data.get("message")
+        or data.get("detail")
+    )
+    return str(message) if message is not None else None
+
+
+def _error_message_from_body(content: bytes) -> Optional[str]:
+    """
+    Decode an error body and extract its message in one pass.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Error message if found, None for empty or undecodable bodies
+    """
+    if not content:
+        return None
+    try:
+        data = load_json(content)
+    except (ValueError, TypeError):
+        return None
+    return _error_message_from_data(data)
+
+
+def _record_upload_progress(
+    error: OSFException, bytes_uploaded: Optional[int], total_size: Optional[int]
+) -> None:
+    """
+    Fill in how far an upload got on errors that carry upload progress.
+
+    Quota, lock and version-conflict errors expose ``bytes_uploaded`` and
+    ``total_size``; the status mapping cannot know them, so the upload
+    methods add them before re-raising.
+
+    Args:
+        error: Exception raised for the upload
+        bytes_uploaded: Bytes sent before the failure, if known
+        total_size: Total upload size in bytes, if known
+    """
+    if getattr(error, "bytes_uploaded", False) is None:
+        error.bytes_uploaded = bytes_uploaded  # type: ignore[attr-defined]
+    if getattr(error, "total_size", False) is None:
+        error.total_size = total_size  # type: ignore[attr-defined]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled sockets enable TCP keepalive.
+
+    Pooled connections often sit idle between DVC's metadata calls (e.g.
+    while a caller processes a listing page). Keepalive probes stop NATs and
+    load balancers from silently dropping them, so the next request reuses
+    the warm TLS connection instead of paying a new handshake.
+    """
+
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with keepalive socket options."""
+        kwargs.setdefault("socket_options", self.socket_options)
+        if _POOL_SUPPORTS_BLOCKSIZE:
+            kwargs.setdefault("blocksize", UPLOAD_BLOCK_SIZE)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _ProgressReader:
+    """
+    File wrapper that reports upload progress as the body is read.
+
+    Passing this to ``requests`` lets urllib3 read the file with its own
+    block size instead of driving a Python generator per chunk.
+    """
+
+    def __init__(
+        self,
+        file_obj: BinaryIO,
+        callback: Callable[[int, int], None],
+        total_size: int,
+    ) -> None:
+        """
+        Wrap a file object for progress reporting.
+
+        Args:
+            file_obj: File-like object to read from
+            callback: Progress callback function (bytes_uploaded, total_bytes)
+            total_size: Total upload size in bytes
+        """
+        self._file = file_obj
+        self._tracker = ProgressTracker(total_size, callback)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped file and report the bytes read."""
+        data = self._file.read(size)
+        if data:
+            self._tracker.update(len(data))
+        return data
+
+    def __len__(self) -> int:
+        """Return the upload size, used by requests for Content-Length."""
+        return self._tracker.total_size
+
 
 class OSFAPIClient:
     """
@@ -40,6 +251,8 @@ class OSFAPIClient:
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
         upload_timeout: Optional[int] = None,
+        prewarm: bool = False,
+        pool_size: Optional[int] = None,
     ) -> None:
         """
         Initialize OSF API client.
@@ -50,34 +263,123 @@ class OSFAPIClient:
             timeout: Request timeout in seconds (defaults to Config.DEFAULT_TIMEOUT)
             max_retries: Maximum retry attempts (defaults to Config.MAX_RETRIES)
             upload_timeout: Upload timeout in seconds (defaults to Config.OSF_UPLOAD_TIMEOUT)  # noqa: E501
+            prewarm: Open a pooled connection to the API host in the background
+                so the first request skips the TCP/TLS handshake
+            pool_size: Connections kept open per host (defaults to
+                Config.CONNECTION_POOL_SIZE)
         """
         self.token = token
         self.base_url = (base_url or Config.API_BASE_URL).rstrip("/")
         self.timeout = timeout or Config.DEFAULT_TIMEOUT
-        self.max_retries = max_retries or Config.MAX_RETRIES
+        self.max_retries = Config.MAX_RETRIES if max_retries is None else max_retries
         self.upload_timeout = upload_timeout or Config.OSF_UPLOAD_TIMEOUT
 
-        # Create session with connection pooling
-        self.session = requests.Session()
+        # Settings read on hot paths, bound once per client
+        self._chunk_size = Config.CHUNK_SIZE
+        self._pool_size = pool_size or Config.CONNECTION_POOL_SIZE
+        self._retry_jitter = Config.RETRY_JITTER
+
+        # Backoff ceilings indexed by attempt number, computed once
+        self._backoff_table = [
+            min(
+                Config.RETRY_MAX_DELAY,
+                Config.RETRY_BASE_DELAY * Config.RETRY_BACKOFF**i,
+            )
+            for i in range(self.max_retries + 2)
+        ]
+
+        # Set by close() to abort any retry backoff in progress
+        self._cancel = threading.Event()
+
+        # Short-lived cache of successful GET responses, keyed by URL and
+        # params. Cleared on any write.
+        self.cache_ttl = Config.CACHE_TTL
+        self._get_cache: "OrderedDict[Any, _CacheEntry]" = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+        # Bumped by clear_cache() so callers holding derived caches (such as
+        # OSFFileSystem's directory listings) can tell a write happened.
+        self.cache_generation = 0
+
+        # Workers used by iter_pages to prefetch next pages, one per pooled
+        # connection so concurrent listings do not queue behind each other;
+        # created on first use.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Formatted once; _new_session() reuses them for every session
+        self._auth_headers = format_auth_header(token)
+        # Content-Type is set per request: JSON bodies in post()/put(),
+        # octet-stream for uploads.
+        self._default_headers = {**self._auth_headers, "Accept": "application/json"}
+
+        self.session = self._new_session()
+
+        if prewarm:
+            # On its own thread so a slow or unreachable host never holds
+            # up the first page prefetch
+            threading.Thread(
+                target=self._prewarm, name="dvc-osf-prewarm", daemon=True
+            ).start()
+
+    def _new_session(self) -> requests.Session:
+        """
+        Create an HTTP session with pooling, retries and default headers.
 
-        # Configure HTTPAdapter with retry settings
-        adapter = HTTPAdapter(
-            pool_connections=Config.CONNECTION_POOL_SIZE,
-            pool_maxsize=Config.CONNECTION_POOL_SIZE,
-            max_retries=0,  # We'll handle retries manually for more control
+        Returns:
+            Configured session
+        """
+        session = requests.Session()
+
+        # The HTTPAdapter never retries: every retry goes through _request,
+        # which bounds the total time by the request deadline, caps and
+        # jitters the backoff, and stops waiting as soon as close() is
+        # called. urllib3 sleeping out a server's Retry-After inside
+        # session.request could do none of that.
+        retry = Retry(
+            total=0,
+            connect=0,
+            read=0,
+            status=0,
+            other=0,
+            respect_retry_after_header=False,
+            raise_on_status=False,
         )
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Set default headers including authentication
-        auth_headers = format_auth_header(token)
-        self.session.headers.update(auth_headers)
-        self.session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            }
+        adapter = _KeepAliveAdapter(
+            pool_connections=self._pool_size,
+            pool_maxsize=self._pool_size,
+            max_retries=retry,
         )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers.update(self._default_headers)
+        return session
+
+    def _prewarm(self) -> None:
+        """
+        Send a HEAD request to ``base_url`` to open a pooled connection.
+
+        Best effort and never retried (the adapter does not retry): any
+        failure is left for the first real request to report.
+        """
+        try:
+            self.session.head(self.base_url + "/", timeout=self.timeout).close()
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection prewarm failed: %s", e)
+
+    def _abs(self, url: str) -> str:
+        """
+        Resolve an endpoint relative to ``base_url``.
+
+        Args:
+            url: Absolute URL or endpoint path starting with ``/``
+
+        Returns:
+            Absolute URL
+        """
+        if url[:1] != "/":
+            return url
+        return _resolve_url(self.base_url, url)
 
     def _request(
         self,
@@ -88,6 +390,7 @@ class OSFAPIClient:
         data: Any = None,
         stream: bool = False,
         headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
         """
         Make an HTTP request with retry logic and error handling.
@@ -100,6 +403,9 @@ class OSFAPIClient:
             data: Raw data payload
             stream: Enable streaming for large responses
             headers: Additional headers
+            deadline: Absolute ``time.monotonic()`` value after which no
+                further retries are attempted (defaults to
+                ``timeout * (max_retries + 1)`` seconds from now)
 
         Returns:
             Response object
@@ -112,10 +418,42 @@ class OSFAPIClient:
             OSFAPIError: Other API errors
             OSFConnectionError: Network/connection errors
         """
+        if method == "GET":
+            return self._send(
+                method, url, params, json, data, stream, headers, deadline
+            )
+
+        # Writes go to WaterButler as well as the API host and can change
+        # any listing or metadata, so drop every cached GET. Drop them again
+        # once the write is over: a GET sent while it was in flight may have
+        # cached the state from before it.
+        self.clear_cache()
+        try:
+            return self._send(
+                method, url, params, json, data, stream, headers, deadline
+            )
+        finally:
+            self.clear_cache()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        data: Any,
+        stream: bool,
+        headers: Optional[Dict[str, str]],
+        deadline: Optional[float],
+    ) -> requests.Response:
+        """Send a request for _request, retrying transient failures."""
         attempt = 0
-        last_exception: Optional[Exception] = None
 
-        while attempt <= self.max_retries:
+        if deadline is None:
+            deadline = time.monotonic() + self.timeout * (self.max_retries + 1)
+
+        while True:
+            cause: Optional[BaseException] = None
             try:
                 response = self.session.request(
                     method=method,
@@ -133,61 +471,73 @@ class OSFAPIClient:
 
                 return response
 
-            except (OSFConnectionError, OSFRateLimitError) as e:
-                # Retryable errors
-                last_exception = e
-                attempt += 1
-
-                if attempt > self.max_retries:
-                    raise
-
-                # Calculate backoff delay
-                if isinstance(e, OSFRateLimitError) and e.retry_after:
-                    delay: float = float(e.retry_after)
-                else:
-                    delay = Config.RETRY_BACKOFF**attempt
-
-                time.sleep(delay)
-
             except (
                 requests.exceptions.ConnectionError,
                 requests.exceptions.Timeout,
             ) as e:
                 # Network errors - retryable
-                last_exception = OSFConnectionError(f"Connection to OSF failed: {e}")
-                attempt += 1
+                error: OSFException = OSFConnectionError(
+                    f"Connection to OSF failed: {e}"
+                )
+                cause = e
 
-                if attempt > self.max_retries:
-                    raise last_exception
+            except OSFException as e:
+                # Rate limits and 5xx are retryable; everything else
+                # (including version conflicts) is raised immediately.
+                if not e.retryable:
+                    raise
+                error = e
 
-                delay = Config.RETRY_BACKOFF**attempt
-                time.sleep(delay)
+            attempt += 1
+            if attempt > self.max_retries:
+                raise error from cause
 
-            except OSFVersionConflictError:
-                # Version conflicts should NOT be retried
-                raise
+            # Each error picks its own delay, e.g. Retry-After for 429s
+            delay = error.delay(self._backoff_delay(attempt), self._retry_jitter)
+            if not self._sleep_before_retry(delay, deadline):
+                raise error from cause
 
-            except OSFAPIError as e:
-                # Check if this API error is retryable (5xx errors)
-                if e.retryable:
-                    last_exception = e
-                    attempt += 1
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Compute a retry delay using exponential backoff with full jitter.
 
-                    if attempt > self.max_retries:
-                        raise
+        The delay is drawn uniformly from ``[0, ceiling)`` where the ceiling
+        grows as ``RETRY_BASE_DELAY * RETRY_BACKOFF ** attempt`` and is capped
+        at ``RETRY_MAX_DELAY``.  Randomizing the whole interval spreads out
+        retries from concurrent clients instead of synchronizing them.
 
-                    delay = Config.RETRY_BACKOFF**attempt
-                    time.sleep(delay)
-                else:
-                    # Non-retryable error, raise immediately
-                    raise
+        Args:
+            attempt: Retry attempt number (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        table = self._backoff_table
+        return random.random() * table[min(attempt, len(table) - 1)]
 
-        # If we get here, we've exhausted retries
-        if last_exception:
-            raise last_exception
+    def _sleep_before_retry(self, delay: float, deadline: float) -> bool:
+        """
+        Sleep before the next retry without overrunning the request deadline.
+
+        The wait is interrupted as soon as the client is closed.
 
-        # This shouldn't happen, but just in case
-        raise OSFConnectionError("Request failed after retries")
+        Args:
+            delay: Desired backoff delay in seconds
+            deadline: Absolute ``time.monotonic()`` deadline for the request
+
+        Returns:
+            True if the caller should retry, False if the deadline has passed
+
+        Raises:
+            OSFConnectionError: The client was closed while waiting
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        if self._cancel.wait(min(delay, remaining)):
+            raise OSFConnectionError("Request cancelled: OSF client was closed.")
+        return True
 
     def _handle_response(self, response: requests.Response) -> None:
         """
@@ -206,149 +556,40 @@ class OSFAPIClient:
             OSFRateLimitError: 429 status code
             OSFAPIError: Other 4xx/5xx status codes
         """
-        if response.status_code < 400:
+        status_code = response.status_code
+        if status_code < 400:
             # Success - no error
             return
 
         # Extract error message from response if available
         error_message = self._extract_error_message(response)
-
-        status_code = response.status_code
-
-        if status_code == 400:
-            raise OSFAPIError(
-                error_message or "Bad request",
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 401:
-            raise OSFAuthenticationError(
-                error_message or "Authentication failed. Check your OSF token.",
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 403:
-            raise OSFPermissionError(
-                error_message
-                or (
-                    "Permission denied for OSF operation. "
-                    "Please check that your OSF token has the required "
-                    "permissions (osf.full_write for uploads)."
-                ),
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 404:
-            raise OSFNotFoundError(
-                error_message or "Resource not found on OSF.",
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 409:
-            logger.warning(
-                f"Version conflict detected (409): {error_message or 'File version conflict'}"  # noqa: E501
-            )
-            raise OSFVersionConflictError(
-                error_message
-                or (
-                    "File version conflict detected. "
-                    "Another process may have modified the file. "
-                    "Please retry the operation."
-                ),
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 413:
-            logger.error(
-                f"Storage quota exceeded (413): {error_message or 'OSF storage quota exceeded'}"  # noqa: E501
-            )
-            raise OSFQuotaExceededError(
-                error_message
-                or (
-                    "OSF storage quota exceeded. "
-                    "Please free up space in your OSF project or upgrade your storage plan. "  # noqa: E501
-                    "Visit https://osf.io/settings/ to manage your storage."
-                ),
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 423:
-            logger.warning(f"File locked (423): {error_message or 'File is locked'}")
-            raise OSFFileLockedError(
-                error_message
-                or (
-                    "File is locked and cannot be modified. "
-                    "Another process may be accessing the file. "
-                    "Please wait and try again."
-                ),
-                status_code=status_code,
-                response=response,
-            )
-        elif status_code == 429:
-            # Rate limit - check for Retry-After header
-            retry_after = None
-            if "Retry-After" in response.headers:
-                try:
-                    retry_after = int(response.headers["Retry-After"])
-                except (ValueError, TypeError):
-                    pass
-
-            raise OSFRateLimitError(
-                error_message or "OSF API rate limit exceeded.",
-                status_code=status_code,
-                response=response,
-                retry_after=retry_after,
-            )
-        elif status_code >= 500:
-            # Server errors - retryable
-            raise OSFAPIError(
-                error_message or f"OSF server error: {status_code}",
-                status_code=status_code,
-                response=response,
-            )
-        else:
-            # Other client errors
-            raise OSFAPIError(
-                error_message or f"OSF API error: {status_code}",
-                status_code=status_code,
-                response=response,
-            )
+        raise_for_status(status_code, error_message, response.headers, response)
 
     def _extract_error_message(self, response: requests.Response) -> Optional[str]:
         """
         Extract error message from OSF API response JSON.
 
+        Only small JSON bodies are parsed; anything else (HTML error pages
+        from proxies, oversized payloads) falls back to the caller's
+        default message.
+
         Args:
             response: HTTP response object
 
         Returns:
             Error message if found, None otherwise
         """
-        try:
-            data = response.json()
-
-            # OSF API error format varies, try common fields
-            if "errors" in data and isinstance(data["errors"], list) and data["errors"]:
-                error = data["errors"][0]
-                if "detail" in error:
-                    return str(error["detail"])
-
-            if "message" in data:
-                return str(data["message"])
+        if not _error_body_parseable(response.headers):
+            return None
 
-            if "detail" in data:
-                return str(data["detail"])
-
-        except (ValueError, KeyError, TypeError):
-            pass
-
-        return None
+        return _error_message_from_body(response.content)
 
     def get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         stream: bool = False,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
         """
         Make a GET request to the OSF API.
@@ -357,20 +598,110 @@ class OSFAPIClient:
             url: Complete URL or path (if starts with /, appended to base_url)
             params: Query parameters
             stream: Enable streaming for large responses
+            deadline: Absolute ``time.monotonic()`` retry deadline
 
         Returns:
             Response object
         """
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
+        url = self._abs(url)
+
+        key = self._cache_key(url, params) if not stream else None
+        if key is None:
+            return self._request(
+                "GET", url, params=params, stream=stream, deadline=deadline
+            )
+
+        with self._get_cache_lock:
+            # A write that clears the cache while this request is in flight
+            # makes its response stale; _cache_store skips it if so
+            generation = self.cache_generation
+            cached = self._get_cache.get(key)
+            if cached is not None:
+                self._get_cache.move_to_end(key)
+
+        headers = None
+        if cached is not None:
+            expires_at, etag, cached_response = cached
+            if expires_at > time.monotonic():
+                return cached_response
+            if etag:
+                headers = {"If-None-Match": etag}
+
+        response = self._request(
+            "GET", url, params=params, headers=headers, deadline=deadline
+        )
+        if response.status_code == 304 and cached is not None:
+            # Not modified: keep serving the cached body
+            response = cached_response
+        elif response.status_code != 200:
+            return response
+
+        self._cache_store(key, response, generation)
+        return response
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        with self._get_cache_lock:
+            self._get_cache.clear()
+            self.cache_generation += 1
+
+    def _cache_key(
+        self, url: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        """
+        Build the response cache key for a GET request.
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+
+        Returns:
+            Hashable key, or None if the request should not be cached
+        """
+        if self.cache_ttl <= 0:
+            return None
+        key = (url, tuple(sorted((params or {}).items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values (e.g. lists)
+            return None
+        return key
+
+    def _cache_store(
+        self, key: Any, response: requests.Response, generation: int
+    ) -> None:
+        """
+        Store a successful GET response in the cache.
 
-        return self._request("GET", url, params=params, stream=stream)
+        Nothing is stored if the cache was cleared since the request was
+        sent, as the response may predate the write that cleared it.
+
+        Args:
+            key: Cache key from _cache_key
+            response: Response to reuse until the TTL expires
+            generation: ``cache_generation`` read before the request
+        """
+        etag = response.headers.get("ETag")
+        entry = (
+            time.monotonic() + self.cache_ttl,
+            etag if isinstance(etag, str) else None,
+            response,
+        )
+        with self._get_cache_lock:
+            if self.cache_generation != generation:
+                return
+            self._get_cache[key] = entry
+            self._get_cache.move_to_end(key)
+            while len(self._get_cache) > GET_CACHE_SIZE:
+                self._get_cache.popitem(last=False)
 
     def post(
         self,
         url: str,
         json: Optional[Dict[str, Any]] = None,
         data: Any = None,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
         """
         Make a POST request to the OSF API.
@@ -379,20 +710,26 @@ class OSFAPIClient:
             url: Complete URL or path (if starts with /, appended to base_url)
             json: JSON payload
             data: Raw data payload
+            deadline: Absolute ``time.monotonic()`` retry deadline
 
         Returns:
             Response object
         """
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
+        url = self._abs(url)
 
-        return self._request("POST", url, json=json, data=data)
+        headers = None
+        if json is not None:
+            data = dump_json(json)
+            headers = {"Content-Type": "application/json"}
+
+        return self._request("POST", url, data=data, headers=headers, deadline=deadline)
 
     def put(
         self,
         url: str,
         json: Optional[Dict[str, Any]] = None,
         data: Any = None,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
         """
         Make a PUT request to the OSF API.
@@ -401,34 +738,74 @@ class OSFAPIClient:
             url: Complete URL or path (if starts with /, appended to base_url)
             json: JSON payload
             data: Raw data payload (for file uploads)
+            deadline: Absolute ``time.monotonic()`` retry deadline
 
         Returns:
             Response object
         """
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
+        url = self._abs(url)
+
+        headers = None
+        if json is not None:
+            data = dump_json(json)
+            headers = {"Content-Type": "application/json"}
 
-        return self._request("PUT", url, json=json, data=data)
+        return self._request("PUT", url, data=data, headers=headers, deadline=deadline)
 
-    def delete(self, url: str) -> requests.Response:
+    def delete(self, url: str, deadline: Optional[float] = None) -> requests.Response:
         """
         Make a DELETE request to the OSF API.
 
         Args:
             url: Complete URL or path (if starts with /, appended to base_url)
+            deadline: Absolute ``time.monotonic()`` retry deadline
 
         Returns:
             Response object
         """
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
+        url = self._abs(url)
 
-        return self._request("DELETE", url)
+        return self._request("DELETE", url, deadline=deadline)
+
+    def delete_many(
+        self, urls: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> List[Tuple[str, Optional[OSFException]]]:
+        """
+        Delete several resources concurrently.
+
+        A failure for one URL does not abort the others; each result pairs
+        the URL with the exception it raised, or None on success.
+
+        Args:
+            urls: Complete URLs or paths to delete
+            max_concurrency: Maximum number of deletes in flight (defaults to,
+                and is capped at, the connection pool size)
+
+        Returns:
+            ``(url, error)`` pairs in the same order as ``urls``
+        """
+        workers = max(1, min(max_concurrency or self._pool_size, self._pool_size))
+
+        def _try_delete(url: str) -> Tuple[str, Optional[OSFException]]:
+            try:
+                self.delete(url)
+            except OSFException as e:
+                return url, e
+            return url, None
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="dvc-osf-delete"
+        ) as executor:
+            return list(executor.map(_try_delete, urls))
 
     def download_file(self, url: str) -> requests.Response:
         """
         Download a file with streaming support.
 
+        The request asks for ``identity`` encoding, so the response body is
+        the raw file bytes; already-compressed data is not gzipped again in
+        transit and decoded on the client.
+
         Args:
             url: Complete download URL
 
@@ -436,7 +813,80 @@ class OSFAPIClient:
             Response object with streaming enabled
         """
         # Download URLs are typically complete URLs from OSF API
-        return self._request("GET", url, stream=True)
+        return self._request("GET", url, stream=True, headers=DOWNLOAD_HEADERS)
+
+    def iter_download(
+        self, url: str, chunk_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Download a file as an iterator of byte chunks.
+
+        Only one chunk is held in memory at a time. The response is closed
+        once the iterator is exhausted or discarded, so callers should
+        consume it fully or close it.
+
+        Args:
+            url: Complete download URL
+            chunk_size: Chunk size in bytes (defaults to Config.CHUNK_SIZE)
+
+        Yields:
+            Chunks of the file body
+        """
+        response = self.download_file(url)
+        try:
+            yield from response.iter_content(chunk_size=chunk_size or self._chunk_size)
+        finally:
+            response.close()
+
+    def iter_pages(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch each page of a paginated API response.
+
+        Follows 'links.next' until the last page. While the caller consumes
+        page N, page N+1 is fetched on the prefetch thread so the round trip
+        overlaps with their work. At most one page is in flight.
+
+        Args:
+            url: Initial URL or path
+            params: Query parameters
+
+        Yields:
+            Decoded JSON of each page
+        """
+        url = self._abs(url)
+
+        response = self.get(url, params=params)
+        pending: Optional[Future] = None
+        try:
+            while True:
+                data = load_json(response.content)
+
+                # Params are already encoded in the next URL
+                links = data.get("links")
+                next_url = links.get("next") if links else None
+                if next_url:
+                    pending = self._prefetch_executor().submit(self.get, next_url)
+
+                yield data
+
+                if pending is None:
+                    break
+                try:
+                    response = pending.result()
+                except CancelledError:
+                    # close() dropped the prefetch
+                    raise OSFConnectionError(
+                        "Request cancelled: OSF client was closed."
+                    ) from None
+                pending = None
+        finally:
+            # The caller stopped early; drop the prefetched page.
+            if pending is not None:
+                pending.cancel()
 
     def get_paginated(
         self,
@@ -446,7 +896,8 @@ class OSFAPIClient:
         """
         Fetch all pages of a paginated API response.
 
-        Automatically follows 'links.next' to fetch all pages.
+        Automatically follows 'links.next' to fetch all pages, prefetching
+        each next page (see iter_pages).
 
         Args:
             url: Initial URL or path
@@ -455,32 +906,46 @@ class OSFAPIClient:
         Yields:
             Items from all pages
         """
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
+        with closing(self.iter_pages(url, params=params)) as pages:
+            for data in pages:
+                # List endpoints always return an array; use get_single()
+                # for single-resource endpoints.
+                yield from data.get("data") or ()
+
+    def get_single(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single-resource endpoint and return its ``data`` object.
 
-        current_url: Optional[str] = url
-        current_params = params
+        Args:
+            url: URL or path of the resource
+            params: Query parameters
 
-        while current_url:
-            response = self.get(current_url, params=current_params)
-            data = response.json()
+        Returns:
+            The resource object, or an empty dict if the body has no data
+        """
+        data = load_json(self.get(url, params=params).content)
+        return data.get("data") or {}
 
-            # Yield items from current page
-            if "data" in data:
-                items = data["data"]
-                if isinstance(items, list):
-                    for item in items:
-                        yield item
-                else:
-                    yield items
+    def _prefetch_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the executor used to prefetch pages, creating it if needed.
 
-            # Check for next page
-            links = data.get("links", {})
-            current_url = links.get("next")
-            current_params = None  # Params already in next URL
+        Each listing has at most one page in flight, so sizing the pool to
+        the connection pool lets that many threads page concurrently.
 
-            if not current_url:
-                break
+        Returns:
+            Thread pool owned by this client
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size, thread_name_prefix="dvc-osf-prefetch"
+                )
+            return self._executor
 
     def upload_file(
         self,
@@ -524,7 +989,7 @@ class OSFAPIClient:
                 file_obj.seek(start_pos)
 
             if callback and callable(callback) and total_size:
-                file_data: Any = self._stream_upload(file_obj, callback, total_size)
+                file_data: Any = _ProgressReader(file_obj, callback, total_size)
             else:
                 file_data = file_obj
 
@@ -536,17 +1001,25 @@ class OSFAPIClient:
             )
 
         # Retry on transient 5xx errors (rewinds file between attempts).
-        for attempt in range(1, self.max_retries + 1):
+        for attempt in range(self.max_retries + 1):
             response = _attempt()
             if response.status_code < 500 or attempt == self.max_retries:
                 break
             logger.warning(
                 "Upload returned %s on attempt %d/%d, retrying...",
                 response.status_code,
-                attempt,
-                self.max_retries,
+                attempt + 1,
+                self.max_retries + 1,
             )
-        self._handle_response(response)
+        self.clear_cache()
+        try:
+            self._handle_response(response)
+        except OSFException as e:
+            sent = None
+            if start_pos is not None:
+                sent = file_obj.tell() - start_pos
+            _record_upload_progress(e, sent, total_size)
+            raise
         return response
 
     def upload_chunk(
@@ -582,44 +1055,68 @@ class OSFAPIClient:
             headers=headers,
         )
 
-    def _stream_upload(
+    def upload_chunks_parallel(
         self,
-        file_obj: BinaryIO,
-        callback: Callable[[int, int], None],
+        url: str,
+        chunks: Iterable[Tuple[bytes, int, int]],
         total_size: int,
-    ) -> Iterator[bytes]:
+        max_concurrency: int = 4,
+    ) -> List[requests.Response]:
         """
-        Stream file data with progress callbacks.
+        Upload several file chunks concurrently.
 
-        Args:
-            file_obj: File-like object to read from
-            callback: Progress callback function
-            total_size: Total file size
-
-        Yields:
-            Chunks of file data
-        """
-        bytes_sent = 0
-        chunk_size = Config.CHUNK_SIZE
+        Concurrency is capped at the connection pool size so every worker
+        gets its own pooled connection.
 
-        while True:
-            chunk = file_obj.read(chunk_size)
-            if not chunk:
-                break
+        Args:
+            url: Upload URL
+            chunks: ``(chunk_data, start_byte, end_byte)`` tuples
+            total_size: Total file size in bytes
+            max_concurrency: Maximum number of chunks in flight
 
-            bytes_sent += len(chunk)
+        Returns:
+            Responses in the same order as ``chunks``
 
-            # Invoke callback with progress
-            try:
-                callback(bytes_sent, total_size)
-            except Exception:
-                # Don't let callback errors fail the upload
-                pass
+        Raises:
+            OSFException: The first error raised by any chunk upload; chunks
+                not yet started are cancelled. Upload errors report the
+                bytes of completed chunks in ``bytes_uploaded``.
+        """
+        workers = max(1, min(max_concurrency, self._pool_size))
+        uploaded = 0
+        uploaded_lock = threading.Lock()
+
+        def _upload(data: bytes, start: int, end: int) -> requests.Response:
+            nonlocal uploaded
+            response = self.upload_chunk(url, data, start, end, total_size)
+            with uploaded_lock:
+                uploaded += end - start + 1
+            return response
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="dvc-osf-upload"
+        ) as executor:
+            futures = [
+                executor.submit(_upload, data, start, end)
+                for data, start, end in chunks
+            ]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
 
-            yield chunk
+        try:
+            return [future.result() for future in futures]
+        except OSFException as e:
+            _record_upload_progress(e, uploaded, total_size)
+            raise
 
     def close(self) -> None:
         """Close the session and release resources."""
+        self._cancel.set()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
         if self.session:
             self.session.close()
 
@@ -0,0 +1,689 @@
+"""Asynchronous OSF API client built on aiohttp.
+
+Requires the optional ``async`` extra: ``pip install 'dvc-osf[async]'``.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .api import (
+    DOWNLOAD_HEADERS,
+    _error_body_parseable,
+    _error_message_from_body,
+    _record_upload_progress,
+    _resolve_url,
+)
+from .auth import format_auth_header
+from .config import Config
+from .exceptions import OSFConnectionError, OSFException, raise_for_status
+from .utils import ProgressTracker, dump_json, load_json
+
+logger = logging.getLogger(__name__)
+
+# Seconds an idle pooled connection is kept open for reuse.
+KEEPALIVE_TIMEOUT = 30
+
+# Transport-level failures retried by _request and mapped to
+# OSFConnectionError.
+if aiohttp is not None:
+    _NETWORK_ERRORS: tuple = (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+else:  # pragma: no cover - optional dependency
+    _NETWORK_ERRORS = ()
+
+
+def _page_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the items of a decoded JSON:API page."""
+    return data.get("data") or []
+
+
+def _remaining_page_urls(last_url: Optional[str]) -> List[str]:
+    """
+    Build the URLs of pages 2..N from a ``links.last`` URL.
+
+    Args:
+        last_url: URL of the last page, carrying a ``page`` query parameter
+
+    Returns:
+        Page URLs in order, or an empty list if the page count is unknown
+    """
+    if not last_url:
+        return []
+
+    parts = urlsplit(last_url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    try:
+        last_page = int(dict(query)["page"])
+    except (KeyError, ValueError):
+        return []
+
+    urls = []
+    for page in range(2, last_page + 1):
+        page_query = [(k, str(page) if k == "page" else v) for k, v in query]
+        urls.append(urlunsplit(parts._replace(query=urlencode(page_query))))
+    return urls
+
+
+class AsyncOSFAPIClient:
+    """
+    Asynchronous client for the OSF API v2.
+
+    Mirrors :class:`~dvc_osf.api.OSFAPIClient` with coroutine methods, so a
+    single event loop can keep many uploads and downloads in flight without
+    a thread per transfer. Error handling is shared with the synchronous
+    client; retries use the same full-jitter backoff and deadline.
+
+    Responses returned by ``get``/``post``/``put``/``delete`` have already
+    been read, so ``await response.json()`` works after the connection has
+    been released. ``download_file`` returns an unread response that the
+    caller must release.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        upload_timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize async OSF API client.
+
+        The underlying ``aiohttp.ClientSession`` is created on first use,
+        inside the running event loop.
+
+        Args:
+            token: OSF personal access token for authentication
+            base_url: API base URL (defaults to Config.API_BASE_URL)
+            timeout: Request timeout in seconds (defaults to Config.DEFAULT_TIMEOUT)
+            max_retries: Maximum retry attempts (defaults to Config.MAX_RETRIES)
+            upload_timeout: Upload timeout in seconds (defaults to Config.OSF_UPLOAD_TIMEOUT)  # noqa: E501
+
+        Raises:
+            ImportError: aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncOSFAPIClient requires aiohttp. "
+                "Install it with: pip install 'dvc-osf[async]'"
+            )
+
+        self.token = token
+        self.base_url = (base_url or Config.API_BASE_URL).rstrip("/")
+        self.timeout = timeout or Config.DEFAULT_TIMEOUT
+        self.max_retries = Config.MAX_RETRIES if max_retries is None else max_retries
+        self.upload_timeout = upload_timeout or Config.OSF_UPLOAD_TIMEOUT
+
+        # Settings read on hot paths, bound once per client
+        self._chunk_size = Config.CHUNK_SIZE
+        self._pool_size = Config.CONNECTION_POOL_SIZE
+        self._retry_jitter = Config.RETRY_JITTER
+
+        self._headers = {**format_auth_header(token), "Accept": "application/json"}
+        self._timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._upload_timeout = aiohttp.ClientTimeout(total=self.upload_timeout)
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        self._backoff_table = [
+            min(
+                Config.RETRY_MAX_DELAY,
+                Config.RETRY_BASE_DELAY * Config.RETRY_BACKOFF**i,
+            )
+            for i in range(self.max_retries + 2)
+        ]
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Return the HTTP session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers, connector=connector, timeout=self._timeout
+            )
+        return self._session
+
+    def _abs(self, url: str) -> str:
+        """Resolve an endpoint relative to ``base_url``."""
+        if url[:1] == "/":
+            return _resolve_url(self.base_url, url)
+        return url
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Compute a retry delay using exponential backoff with full jitter.
+
+        Args:
+            attempt: Retry attempt number (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        table = self._backoff_table
+        return random.random() * table[min(attempt, len(table) - 1)]
+
+    @staticmethod
+    async def _sleep_before_retry(delay: float, deadline: float) -> bool:
+        """
+        Sleep before the next retry without overrunning the request deadline.
+
+        Args:
+            delay: Desired backoff delay in seconds
+            deadline: Absolute ``time.monotonic()`` deadline for the request
+
+        Returns:
+            True if the caller should retry, False if the deadline has passed
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        await asyncio.sleep(min(delay, remaining))
+        return True
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        deadline: Optional[float] = None,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Make an HTTP request with retry logic and error handling.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            url: Complete URL to request
+            params: Query parameters
+            data: Request body (must be replayable, e.g. bytes)
+            headers: Additional headers
+            stream: Leave the body unread for the caller
+            deadline: Absolute ``time.monotonic()`` value after which no
+                further retries are attempted (defaults to
+                ``timeout * (max_retries + 1)`` seconds from now)
+
+        Returns:
+            Response object
+
+        Raises:
+            OSFAuthenticationError: Authentication failed (401)
+            OSFPermissionError: Permission denied (403)
+            OSFNotFoundError: Resource not found (404)
+            OSFRateLimitError: Rate limit exceeded (429)
+            OSFAPIError: Other API errors
+            OSFConnectionError: Network/connection errors
+        """
+        attempt = 0
+
+        if deadline is None:
+            deadline = time.monotonic() + self.timeout * (self.max_retries + 1)
+
+        while True:
+            try:
+                response = await self.session.request(
+                    method, url, params=params, data=data, headers=headers
+                )
+                await self._handle_response(response)
+                if not stream:
+                    # Reading the whole body returns the connection to the
+                    # pool while keeping the body available to the caller.
+                    await response.read()
+                return response
+
+            except _NETWORK_ERRORS as e:
+                # Network errors (including truncated bodies) - retryable
+                error = OSFConnectionError(f"Connection to OSF failed: {e}")
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise error from e
+                if not await self._sleep_before_retry(
+                    self._backoff_delay(attempt), deadline
+                ):
+                    raise error from e
+
+            except OSFException as e:
+                # Rate limits and 5xx are retryable; everything else
+                # (including version conflicts) is raised immediately.
+                if not e.retryable:
+                    raise
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+
+                # Each error picks its own delay, e.g. Retry-After for 429s
+                delay = e.delay(self._backoff_delay(attempt), self._retry_jitter)
+                if not await self._sleep_before_retry(delay, deadline):
+                    raise
+
+    async def _handle_response(self, response: "aiohttp.ClientResponse") -> None:
+        """
+        Handle HTTP response, mapping status codes to exceptions.
+
+        Args:
+            response: HTTP response object
+
+        Raises:
+            OSFException: Subclass matching the error status
+        """
+        status_code = response.status
+        if status_code < 400:
+            return
+
+        error_message = None
+        try:
+            if _error_body_parseable(response.headers):
+                error_message = _error_message_from_body(await response.read())
+        except aiohttp.ClientError:
+            pass
+        finally:
+            response.release()
+
+        raise_for_status(status_code, error_message, response.headers, response)
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Make a GET request to the OSF API.
+
+        Args:
+            url: Complete URL or path (if starts with /, appended to base_url)
+            params: Query parameters
+            deadline: Absolute ``time.monotonic()`` retry deadline
+
+        Returns:
+            Response object
+        """
+        return await self._request(
+            "GET", self._abs(url), params=params, deadline=deadline
+        )
+
+    async def post(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        deadline: Optional[float] = None,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Make a POST request to the OSF API.
+
+        Args:
+            url: Complete URL or path (if starts with /, appended to base_url)
+            json: JSON payload
+            data: Raw data payload
+            deadline: Absolute ``time.monotonic()`` retry deadline
+
+        Returns:
+            Response object
+        """
+        headers = None
+        if json is not None:
+            data = dump_json(json)
+            headers = {"Content-Type": "application/json"}
+
+        return await self._request(
+            "POST", self._abs(url), data=data, headers=headers, deadline=deadline
+        )
+
+    async def put(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        deadline: Optional[float] = None,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Make a PUT request to the OSF API.
+
+        Args:
+            url: Complete URL or path (if starts with /, appended to base_url)
+            json: JSON payload
+            data: Raw data payload
+            deadline: Absolute ``time.monotonic()`` retry deadline
+
+        Returns:
+            Response object
+        """
+        headers = None
+        if json is not None:
+            data = dump_json(json)
+            headers = {"Content-Type": "application/json"}
+
+        return await self._request(
+            "PUT", self._abs(url), data=data, headers=headers, deadline=deadline
+        )
+
+    async def delete(
+        self, url: str, deadline: Optional[float] = None
+    ) -> "aiohttp.ClientResponse":
+        """
+        Make a DELETE request to the OSF API.
+
+        Args:
+            url: Complete URL or path (if starts with /, appended to base_url)
+            deadline: Absolute ``time.monotonic()`` retry deadline
+
+        Returns:
+            Response object
+        """
+        return await self._request("DELETE", self._abs(url), deadline=deadline)
+
+    async def delete_many(
+        self, urls: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> List[Tuple[str, Optional[OSFException]]]:
+        """
+        Delete several resources concurrently.
+
+        A failure for one URL does not abort the others; each result pairs
+        the URL with the exception it raised, or None on success.
+
+        Args:
+            urls: Complete URLs or paths to delete
+            max_concurrency: Maximum number of deletes in flight (defaults to,
+                and is capped at, the connection pool size)
+
+        Returns:
+            ``(url, error)`` pairs in the same order as ``urls``
+        """
+        limit = max(1, min(max_concurrency or self._pool_size, self._pool_size))
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _try_delete(url: str) -> Tuple[str, Optional[OSFException]]:
+            async with semaphore:
+                try:
+                    response = await self.delete(url)
+                except OSFException as e:
+                    return url, e
+                response.release()
+                return url, None
+
+        return list(await asyncio.gather(*(_try_delete(url) for url in urls)))
+
+    async def download_file(self, url: str) -> "aiohttp.ClientResponse":
+        """
+        Download a file with streaming support.
+
+        The caller must release the response (``async with`` or
+        ``response.release()``) after reading ``response.content``.
+
+        Args:
+            url: Complete download URL
+
+        Returns:
+            Response object with the body unread
+        """
+        return await self._request("GET", url, headers=DOWNLOAD_HEADERS, stream=True)
+
+    async def iter_download(
+        self, url: str, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Download a file as an async iterator of byte chunks.
+
+        The response is released once the iterator is exhausted or closed,
+        so callers should consume it fully or ``aclose()`` it.
+
+        Args:
+            url: Complete download URL
+            chunk_size: Chunk size in bytes (defaults to Config.CHUNK_SIZE)
+
+        Yields:
+            Chunks of the file body
+        """
+        response = await self.download_file(url)
+        try:
+            async for chunk in response.content.iter_chunked(
+                chunk_size or self._chunk_size
+            ):
+                yield chunk
+        finally:
+            response.release()
+
+    async def get_paginated(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch all pages of a paginated API response.
+
+        When the first page advertises ``links.last``, the remaining pages
+        are fetched concurrently (bounded by the connection pool size) and
+        yielded in page order. Otherwise 'links.next' is followed, with the
+        next page requested while the current one is being consumed.
+
+        Args:
+            url: Initial URL or path
+            params: Query parameters
+
+        Yields:
+            Items from all pages
+        """
+        data = await self._get_json(self._abs(url), params=params)
+        links = data.get("links") or {}
+        page_urls = _remaining_page_urls(links.get("last"))
+        if page_urls:
+            for item in _page_items(data):
+                yield item
+            async for page in self._fetch_pages(page_urls):
+                for item in _page_items(page):
+                    yield item
+            return
+
+        # Params are already encoded in the next URL
+        pending: Optional["asyncio.Future[Dict[str, Any]]"] = None
+        try:
+            while True:
+                next_url = links.get("next")
+                if next_url:
+                    pending = asyncio.ensure_future(self._get_json(next_url))
+
+                for item in _page_items(data):
+                    yield item
+
+                if pending is None:
+                    return
+                data = await pending
+                pending = None
+                links = data.get("links") or {}
+        finally:
+            # The caller stopped early; drop the prefetched page.
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def _get_json(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """GET ``url`` and decode the JSON body."""
+        response = await self.get(url, params=params)
+        return load_json(await response.read())
+
+    async def _fetch_pages(self, urls: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch pages concurrently, yielding decoded bodies in ``urls`` order.
+
+        Args:
+            urls: Page URLs
+
+        Yields:
+            Decoded page bodies
+        """
+        semaphore = asyncio.Semaphore(self._pool_size)
+
+        async def fetch(page_url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._get_json(page_url)
+
+        tasks = [asyncio.ensure_future(fetch(page_url)) for page_url in urls]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            # The caller stopped early or a page failed; drop the rest.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def upload_file(
+        self,
+        url: str,
+        file_obj: BinaryIO,
+        callback: Optional[Callable[[int, int], None]] = None,
+        total_size: Optional[int] = None,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Upload a file with streaming support and progress tracking.
+
+        The file is read in ``Config.OSF_UPLOAD_CHUNK_SIZE`` blocks on the
+        default executor so reads never block the event loop.
+
+        Args:
+            url: Upload URL (typically from OSF API links.upload)
+            file_obj: File-like object to upload
+            callback: Optional progress callback function (bytes_uploaded, total_bytes)
+            total_size: Total file size in bytes (sent as Content-Length)
+
+        Returns:
+            Response object
+
+        Raises:
+            OSFQuotaExceededError: Storage quota exceeded
+            OSFFileLockedError: File is locked
+            OSFVersionConflictError: Version conflict
+            OSFConnectionError: Network/connection errors
+            Other OSF exceptions
+        """
+        headers = {"Content-Type": "application/octet-stream"}
+        if total_size is not None:
+            headers["Content-Length"] = str(total_size)
+
+        start_pos = file_obj.tell() if hasattr(file_obj, "tell") else None
+
+        # Retry on transient 5xx errors (rewinds file between attempts).
+        for attempt in range(self.max_retries + 1):
+            if start_pos is not None and hasattr(file_obj, "seek"):
+                file_obj.seek(start_pos)
+
+            try:
+                response = await self.session.put(
+                    url,
+                    data=self._read_chunks(file_obj, callback, total_size),
+                    headers=headers,
+                    timeout=self._upload_timeout,
+                )
+            except _NETWORK_ERRORS as e:
+                raise OSFConnectionError(f"Connection to OSF failed: {e}") from e
+
+            if response.status < 500 or attempt == self.max_retries:
+                break
+            response.release()
+            logger.warning(
+                "Upload returned %s on attempt %d/%d, retrying...",
+                response.status,
+                attempt + 1,
+                self.max_retries + 1,
+            )
+
+        try:
+            await self._handle_response(response)
+        except OSFException as e:
+            sent = None
+            if start_pos is not None:
+                sent = file_obj.tell() - start_pos
+            _record_upload_progress(e, sent, total_size)
+            raise
+        try:
+            await response.read()
+        except _NETWORK_ERRORS as e:
+            raise OSFConnectionError(f"Connection to OSF failed: {e}") from e
+        return response
+
+    @staticmethod
+    async def _read_chunks(
+        file_obj: BinaryIO,
+        callback: Optional[Callable[[int, int], None]],
+        total_size: Optional[int],
+    ) -> AsyncIterator[bytes]:
+        """
+        Read a file in blocks off the event loop, reporting progress.
+
+        Args:
+            file_obj: File-like object to read from
+            callback: Optional progress callback function
+            total_size: Total file size
+
+        Yields:
+            Blocks of file data
+        """
+        loop = asyncio.get_running_loop()
+        tracker = ProgressTracker(total_size or 0, callback)
+
+        while True:
+            chunk = await loop.run_in_executor(
+                None, file_obj.read, Config.OSF_UPLOAD_CHUNK_SIZE
+            )
+            if not chunk:
+                break
+            tracker.update(len(chunk))
+            yield chunk
+
+    async def prewarm(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of the first request.
+
+        Sends a HEAD request to ``base_url`` so later requests skip the
+        TCP/TLS handshake. Best effort: failures are only logged.
+        """
+        try:
+            async with self.session.head(self.base_url + "/"):
+                pass
+        except _NETWORK_ERRORS as e:
+            logger.debug("Connection prewarm failed: %s", e)
+
+    async def close(self) -> None:
+        """Close the session and release resources."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncOSFAPIClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit - close session."""
+        await self.close()
@@ -1,10 +1,20 @@
 """Authentication handling for OSF."""
 
 import os
-from typing import Any, Dict, Optional
+import re
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Pattern, Set
 
 from .exceptions import OSFAuthenticationError
 
+# Every token passed to redact_token_in_message, and a single pattern
+# matching any of them (rebuilt when a new token is seen).
+_TOKENS: Set[str] = set()
+_TOKEN_PATTERN: Optional[Pattern[str]] = None
+_TOKEN_LOCK = threading.Lock()
+
 
 def get_token(
     token: Optional[str] = None,
@@ -79,6 +89,17 @@ def validate_token(token: str) -> str:
             "Invalid token format. Token must be a non-empty string."
         )
 
+    return _validate_token_str(token)
+
+
+@lru_cache(maxsize=4)
+def _validate_token_str(token: str) -> str:
+    """
+    Strip and check a string token, memoizing the result.
+
+    Filesystem instances for the same remote validate the same token over
+    and over; the handful of distinct tokens in a process fit in the cache.
+    """
     # Remove whitespace
     token = token.strip()
 
@@ -90,23 +111,56 @@ def validate_token(token: str) -> str:
     return token
 
 
-def format_auth_header(token: str) -> Dict[str, str]:
+@lru_cache(maxsize=8)
+def format_auth_header(token: str) -> Mapping[str, str]:
     """
     Format authentication header for OSF API requests.
 
+    The header is built once per token and shared, so it is returned as a
+    read-only mapping; copy it (``{**headers}``) to add entries.
+
     Args:
         token: OSF personal access token
 
     Returns:
-        Dictionary with Authorization header
+        Read-only mapping with the Authorization header
+    """
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+def _register_token(token: str) -> Pattern[str]:
+    """
+    Add a token to the redaction set and return the combined pattern.
+
+    Args:
+        token: Token to redact from now on
+
+    Returns:
+        Compiled pattern matching every registered token
     """
-    return {"Authorization": f"Bearer {token}"}
+    global _TOKEN_PATTERN
+
+    pattern = _TOKEN_PATTERN
+    if pattern is not None and token in _TOKENS:
+        return pattern
+
+    with _TOKEN_LOCK:
+        if token not in _TOKENS or _TOKEN_PATTERN is None:
+            _TOKENS.add(token)
+            # Longest first, so a token containing another is replaced whole
+            _TOKEN_PATTERN = re.compile(
+                "|".join(map(re.escape, sorted(_TOKENS, key=len, reverse=True)))
+            )
+        return _TOKEN_PATTERN
 
 
 def redact_token_in_message(message: str, token: Optional[str]) -> str:
     """
     Redact token from error messages or logs to prevent exposure.
 
+    Tokens seen by earlier calls are redacted too, in a single pass over
+    the message.
+
     Args:
         message: Message that may contain the token
         token: Token to redact
@@ -114,8 +168,12 @@ def redact_token_in_message(message: str, token: Optional[str]) -> str:
     Returns:
         Message with token redacted
     """
-    if not token:
-        return message
+    if token:
+        pattern = _register_token(token)
+    else:
+        pattern = _TOKEN_PATTERN
+        if pattern is None:
+            return message
 
     # Replace token with redacted placeholder
-    return message.replace(token, "[REDACTED]")
+    return pattern.sub("[REDACTED]", message)
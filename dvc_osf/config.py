@@ -15,13 +15,28 @@ class Config:
     # Retry configuration
     MAX_RETRIES = int(os.getenv("OSF_MAX_RETRIES", "3"))
     RETRY_BACKOFF = float(os.getenv("OSF_RETRY_BACKOFF", "2.0"))
-
-    # Streaming configuration
-    CHUNK_SIZE = int(os.getenv("OSF_CHUNK_SIZE", "8192"))
+    RETRY_BASE_DELAY = float(os.getenv("OSF_RETRY_BASE_DELAY", "1.0"))
+    RETRY_MAX_DELAY = float(os.getenv("OSF_RETRY_MAX_DELAY", "30"))
+    # Maximum random delay in seconds added on top of a Retry-After value
+    RETRY_JITTER = float(os.getenv("OSF_RETRY_JITTER", "0.5"))
+
+    # Streaming configuration. Download throughput levels off between about
+    # 100 KiB and 1 MiB per read; smaller reads spend most of their time in
+    # per-chunk Python overhead (iter_content steps, MD5 update calls).
+    CHUNK_MIN_SIZE = 4 * 1024  # 4KB minimum
+    CHUNK_MAX_SIZE = 64 * 1024 * 1024  # 64MB maximum
+    CHUNK_SIZE = min(
+        max(int(os.getenv("OSF_CHUNK_SIZE", str(1024 * 1024))), CHUNK_MIN_SIZE),
+        CHUNK_MAX_SIZE,
+    )  # 1MB default
 
     # Connection pooling
     CONNECTION_POOL_SIZE = int(os.getenv("OSF_POOL_SIZE", "10"))
 
+    # Seconds a successful GET response is reused before revalidation
+    # (0 disables the cache)
+    CACHE_TTL = float(os.getenv("OSF_CACHE_TTL", "10"))
+
     # Storage provider default
     DEFAULT_PROVIDER = "osfstorage"
 
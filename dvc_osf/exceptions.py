@@ -1,125 +1,124 @@
 """Custom exceptions for DVC-OSF."""
 
-from typing import Any, Optional
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
 
+logger = logging.getLogger(__name__)
 
-class OSFException(Exception):
-    """Base exception for all OSF-related errors."""
-
-    retryable: bool = False
-
-    def __init__(self, message: str) -> None:
-        """
-        Initialize OSF exception.
-
-        Args:
-            message: Error message
-        """
-        super().__init__(message)
-        self.message = message
 
+class OSFException(Exception):
+    """
+    Base exception for all OSF-related errors.
 
-class OSFAuthenticationError(OSFException, PermissionError):
-    """Raised when authentication with OSF fails (401)."""
+    Subclasses only set ``default_message`` and ``retryable``; the common
+    ``(message, status_code, response)`` fields are handled here so HTTP
+    errors can be raised uniformly from a status code.
+    """
 
+    default_message: str = "OSF operation failed."
     retryable: bool = False
 
     def __init__(
         self,
-        message: str = "Authentication failed. Check your OSF token.",
+        message: Optional[str] = None,
         status_code: Optional[int] = None,
         response: Optional[Any] = None,
     ) -> None:
         """
-        Initialize authentication error.
+        Initialize OSF exception.
 
         Args:
-            message: Error message
-            status_code: HTTP status code (401)
+            message: Error message (defaults to the class's ``default_message``)
+            status_code: HTTP status code, if raised for a response
             response: HTTP response object
         """
+        if message is None:
+            message = self.default_message
         super().__init__(message)
+        self.message = message
         self.status_code = status_code
         self.response = response
 
+    def delay(self, backoff: float, jitter: float = 0.0) -> float:
+        """
+        Return how long to wait before retrying after this error.
 
-class OSFNotFoundError(OSFException, FileNotFoundError):
-    """Raised when a file or resource is not found (404)."""
+        Args:
+            backoff: The client's backoff delay for this attempt
+            jitter: Maximum random delay added to a server-provided wait
+
+        Returns:
+            Delay in seconds (the backoff delay by default)
+        """
+        return backoff
 
-    retryable: bool = False
+
+class _UploadErrorMixin:
+    """Adds upload progress to errors that can interrupt a transfer."""
 
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         status_code: Optional[int] = None,
         response: Optional[Any] = None,
+        bytes_uploaded: Optional[int] = None,
+        total_size: Optional[int] = None,
     ) -> None:
         """
-        Initialize not found error.
+        Initialize upload error.
 
         Args:
             message: Error message
-            status_code: HTTP status code (404)
+            status_code: HTTP status code
             response: HTTP response object
+            bytes_uploaded: Number of bytes uploaded before failure
+            total_size: Total size of file being uploaded
         """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
+        super().__init__(message, status_code, response)  # type: ignore[call-arg]
+        self.bytes_uploaded = bytes_uploaded
+        self.total_size = total_size
 
 
-class OSFPermissionError(OSFException, PermissionError):
-    """Raised when user lacks permission for an OSF operation (403)."""
+class OSFAuthenticationError(OSFException, PermissionError):
+    """Raised when authentication with OSF fails (401)."""
 
-    retryable: bool = False
+    default_message = "Authentication failed. Check your OSF token."
 
-    def __init__(
-        self,
-        message: str = "Permission denied for OSF operation.",
-        status_code: Optional[int] = None,
-        response: Optional[Any] = None,
-    ) -> None:
-        """
-        Initialize permission error.
 
-        Args:
-            message: Error message
-            status_code: HTTP status code (403)
-            response: HTTP response object
-        """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
+class OSFNotFoundError(OSFException, FileNotFoundError):
+    """Raised when a file or resource is not found (404)."""
 
+    default_message = "OSF resource not found."
 
-class OSFConnectionError(OSFException, ConnectionError):
-    """Raised when connection to OSF fails (network issues)."""
 
-    retryable: bool = True
+class OSFPermissionError(OSFException, PermissionError):
+    """Raised when user lacks permission for an OSF operation (403)."""
 
-    def __init__(
-        self,
-        message: str = "Failed to connect to OSF. Check your network connection.",
-    ) -> None:
-        """
-        Initialize connection error.
+    default_message = "Permission denied for OSF operation."
 
-        Args:
-            message: Error message
-        """
-        super().__init__(message)
+
+class OSFConnectionError(OSFException, ConnectionError):
+    """Raised when connection to OSF fails (network issues)."""
+
+    default_message = "Failed to connect to OSF. Check your network connection."
+    retryable = True
 
 
 class OSFRateLimitError(OSFException, ConnectionError):
     """Raised when OSF API rate limit is hit (429)."""
 
-    retryable: bool = True
+    default_message = "OSF API rate limit exceeded. Retry after backoff."
+    retryable = True
 
     def __init__(
         self,
-        message: str = "OSF API rate limit exceeded. Retry after backoff.",
+        message: Optional[str] = None,
         status_code: Optional[int] = None,
         response: Optional[Any] = None,
-        retry_after: Optional[int] = None,
+        retry_after: Optional[float] = None,
     ) -> None:
         """
         Initialize rate limit error.
@@ -130,20 +129,36 @@ class OSFRateLimitError(OSFException, ConnectionError):
             response: HTTP response object
             retry_after: Seconds to wait before retrying (from Retry-After header)
         """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
+        super().__init__(message, status_code, response)
         self.retry_after = retry_after
 
+    def delay(self, backoff: float, jitter: float = 0.0) -> float:
+        """
+        Honor ``Retry-After`` when the server sent one.
+
+        A little jitter is added so clients throttled together don't all
+        wake up on the same second.
+
+        Args:
+            backoff: The client's backoff delay for this attempt
+            jitter: Maximum random delay added to ``retry_after``
+
+        Returns:
+            Delay in seconds
+        """
+        if self.retry_after:
+            return float(self.retry_after) + random.uniform(0, jitter)
+        return backoff
+
 
 class OSFAPIError(OSFException):
     """Raised when OSF API returns an error response."""
 
-    retryable: bool = False
+    default_message = "OSF API error"
 
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         status_code: Optional[int] = None,
         response: Optional[Any] = None,
     ) -> None:
@@ -155,9 +170,7 @@ class OSFAPIError(OSFException):
             status_code: HTTP status code
             response: HTTP response object
         """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
+        super().__init__(message, status_code, response)
 
         # Server errors (5xx) are retryable
         if status_code and status_code >= 500:
@@ -167,11 +180,12 @@ class OSFAPIError(OSFException):
 class OSFIntegrityError(OSFException):
     """Raised when file checksum verification fails."""
 
-    retryable: bool = True  # May be transient corruption
+    default_message = "File checksum verification failed."
+    retryable = True  # May be transient corruption
 
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         expected_checksum: Optional[str] = None,
         actual_checksum: Optional[str] = None,
     ) -> None:
@@ -188,129 +202,43 @@ class OSFIntegrityError(OSFException):
         self.actual_checksum = actual_checksum
 
 
-class OSFQuotaExceededError(OSFException):
+class OSFQuotaExceededError(_UploadErrorMixin, OSFException):
     """Raised when OSF storage quota is exceeded (413)."""
 
-    retryable: bool = False
+    default_message = "OSF storage quota exceeded."
 
-    def __init__(
-        self,
-        message: str = "OSF storage quota exceeded.",
-        status_code: Optional[int] = None,
-        response: Optional[Any] = None,
-        bytes_uploaded: Optional[int] = None,
-        total_size: Optional[int] = None,
-    ) -> None:
-        """
-        Initialize quota exceeded error.
 
-        Args:
-            message: Error message
-            status_code: HTTP status code (413)
-            response: HTTP response object
-            bytes_uploaded: Number of bytes uploaded before failure
-            total_size: Total size of file being uploaded
-        """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
-        self.bytes_uploaded = bytes_uploaded
-        self.total_size = total_size
-
-
-class OSFFileLockedError(OSFPermissionError):
+class OSFFileLockedError(_UploadErrorMixin, OSFPermissionError):
     """Raised when file is locked for modification (423)."""
 
-    retryable: bool = False
-
-    def __init__(
-        self,
-        message: str = "File is locked and cannot be modified.",
-        status_code: Optional[int] = None,
-        response: Optional[Any] = None,
-        bytes_uploaded: Optional[int] = None,
-        total_size: Optional[int] = None,
-    ) -> None:
-        """
-        Initialize file locked error.
-
-        Args:
-            message: Error message
-            status_code: HTTP status code (423)
-            response: HTTP response object
-            bytes_uploaded: Number of bytes uploaded before failure
-            total_size: Total size of file being uploaded
-        """
-        super().__init__(message, status_code, response)
-        self.bytes_uploaded = bytes_uploaded
-        self.total_size = total_size
+    default_message = "File is locked and cannot be modified."
 
 
-class OSFVersionConflictError(OSFException):
+class OSFVersionConflictError(_UploadErrorMixin, OSFException):
     """Raised when file version conflict occurs (409)."""
 
-    retryable: bool = False
-
-    def __init__(
-        self,
-        message: str = "File version conflict detected.",
-        status_code: Optional[int] = None,
-        response: Optional[Any] = None,
-        bytes_uploaded: Optional[int] = None,
-        total_size: Optional[int] = None,
-    ) -> None:
-        """
-        Initialize version conflict error.
-
-        Args:
-            message: Error message
-            status_code: HTTP status code (409)
-            response: HTTP response object
-            bytes_uploaded: Number of bytes uploaded before failure
-            total_size: Total size of file being uploaded
-        """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
-        self.bytes_uploaded = bytes_uploaded
-        self.total_size = total_size
+    default_message = "File version conflict detected."
 
 
 class OSFConflictError(OSFException, FileExistsError):
-    """Raised when destination file already exists during copy/move operations."""
+    """
+    Raised when destination file already exists during copy/move operations.
 
-    retryable: bool = False
+    Example:
+        >>> raise OSFConflictError("Cannot copy: /data.csv already exists")
+    """
 
-    def __init__(
-        self,
-        message: str = "Destination file already exists.",
-        status_code: Optional[int] = None,
-        response: Optional[Any] = None,
-    ) -> None:
-        """
-        Initialize conflict error.
-
-        Args:
-            message: Error message
-            status_code: HTTP status code (if from API)
-            response: HTTP response object
-
-        Example:
-            >>> raise OSFConflictError("Cannot copy: /data.csv already exists")
-        """
-        super().__init__(message)
-        self.status_code = status_code
-        self.response = response
+    default_message = "Destination file already exists."
 
 
 class OSFOperationNotSupportedError(OSFException):
     """Raised when an operation is not supported by OSF or this implementation."""
 
-    retryable: bool = False
+    default_message = "Operation not supported."
 
     def __init__(
         self,
-        message: str = "Operation not supported.",
+        message: Optional[str] = None,
         operation: Optional[str] = None,
     ) -> None:
         """
@@ -328,3 +256,158 @@ class OSFOperationNotSupportedError(OSFException):
         """
         super().__init__(message)
         self.operation = operation
+
+
+# Status code -> (exception class, default message, log level, log label)
+# for error responses that map directly onto an exception. Other 4xx/5xx
+# responses fall back to a generic OSFAPIError in raise_for_status. Dispatch
+# is a single dict lookup since it runs for every error reply.
+_STATUS_MAP: Dict[int, Tuple[Type[OSFException], str, int, str]] = {
+    400: (OSFAPIError, "Bad request", logging.NOTSET, ""),
+    401: (
+        OSFAuthenticationError,
+        "Authentication failed. Check your OSF token.",
+        logging.NOTSET,
+        "",
+    ),
+    403: (
+        OSFPermissionError,
+        "Permission denied for OSF operation. "
+        "Please check that your OSF token has the required "
+        "permissions (osf.full_write for uploads).",
+        logging.NOTSET,
+        "",
+    ),
+    404: (OSFNotFoundError, "Resource not found on OSF.", logging.NOTSET, ""),
+    409: (
+        OSFVersionConflictError,
+        "File version conflict detected. "
+        "Another process may have modified the file. "
+        "Please retry the operation.",
+        logging.WARNING,
+        "Version conflict detected",
+    ),
+    413: (
+        OSFQuotaExceededError,
+        "OSF storage quota exceeded. "
+        "Please free up space in your OSF project or upgrade your storage plan. "
+        "Visit https://osf.io/settings/ to manage your storage.",
+        logging.ERROR,
+        "Storage quota exceeded",
+    ),
+    423: (
+        OSFFileLockedError,
+        "File is locked and cannot be modified. "
+        "Another process may be accessing the file. "
+        "Please wait and try again.",
+        logging.WARNING,
+        "File locked",
+    ),
+    429: (
+        OSFRateLimitError,
+        "OSF API rate limit exceeded.",
+        logging.NOTSET,
+        "",
+    ),
+}
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into a delay in seconds.
+
+    The header may carry either delay-seconds or an HTTP-date (RFC 7231).
+    Dates are measured against the response's ``Date`` header when present,
+    so a skewed local clock does not stretch or shorten the wait.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return float(max(0, int(value)))
+    except (ValueError, TypeError):
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (ValueError, TypeError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    now = None
+    server_date = headers.get("Date")
+    if server_date:
+        try:
+            now = parsedate_to_datetime(server_date)
+        except (ValueError, TypeError, IndexError):
+            pass
+        if now is not None and now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+    if now is None:
+        now = datetime.now(tz=timezone.utc)
+
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+def raise_for_status(
+    status_code: int,
+    error_message: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    response: Optional[Any] = None,
+) -> None:
+    """
+    Raise the OSF exception matching an HTTP error status.
+
+    Does nothing for status codes below 400. Shared by the synchronous and
+    asynchronous clients.
+
+    Args:
+        status_code: HTTP status code
+        error_message: Message extracted from the body, if any
+        headers: Response headers (used for ``Retry-After``)
+        response: Response object attached to the exception
+
+    Raises:
+        OSFAuthenticationError: 401 status code
+        OSFPermissionError: 403 status code
+        OSFNotFoundError: 404 status code
+        OSFVersionConflictError: 409 status code
+        OSFQuotaExceededError: 413 status code
+        OSFFileLockedError: 423 status code
+        OSFRateLimitError: 429 status code
+        OSFAPIError: Other 4xx/5xx status codes
+    """
+    if status_code < 400:
+        return
+
+    entry = _STATUS_MAP.get(status_code)
+    if entry is None:
+        # Server errors are retryable (OSFAPIError.retryable); other client
+        # errors are not.
+        kind = "server error" if status_code >= 500 else "API error"
+        raise OSFAPIError(
+            error_message or f"OSF {kind}: {status_code}",
+            status_code=status_code,
+            response=response,
+        )
+
+    exc_class, default_message, level, log_label = entry
+    message = error_message or default_message
+    if level:
+        logger.log(level, "%s (%d): %s", log_label, status_code, message)
+    if exc_class is OSFRateLimitError:
+        raise OSFRateLimitError(
+            message,
+            status_code=status_code,
+            response=response,
+            retry_after=parse_retry_after(headers or {}),
+        )
+    raise exc_class(message, status_code=status_code, response=response)
@@ -1,20 +1,49 @@
 """OSF filesystem implementation for DVC."""
 
+import functools
 import hashlib
 import io
+import itertools
 import logging
 import os
+import queue
 import re
+import shutil
 import tempfile
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-import requests
 from dvc_objects.fs.base import ObjectFileSystem
 
-from .api import OSFAPIClient
+from ._retry import retry_with_backoff
 from .auth import get_token
 from .config import Config
 from .exceptions import (
+    OSFAPIError,
     OSFConflictError,
     OSFIntegrityError,
     OSFNotFoundError,
@@ -27,168 +56,548 @@ from .utils import (
     get_directory,
     get_file_size,
     get_filename,
+    load_json,
     normalize_path,
     parse_osf_url,
     path_to_api_url,
     serialize_path,
 )
 
+if TYPE_CHECKING:
+    # The HTTP stack (requests, urllib3, ...) is imported when the first
+    # filesystem is created, not when DVC loads this plugin.
+    import requests
+
+    from .api import OSFAPIClient
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+
 EMPTY_FILE_MD5 = "d41d8cd98f00b204e9800998ecf8427e"
 
+# API clients shared by filesystems with the same credentials, endpoint and
+# pool size, so the several OSFFileSystem instances DVC creates for one
+# remote reuse a single pooled session. Values are [client, users]; a client
+# is closed when its last filesystem is closed or collected.
+_shared_clients: Dict[Tuple[Any, ...], List[Any]] = {}
+# Re-entrant: a filesystem's finalizer can run from garbage collection
+# triggered while another thread (or this one) holds the lock.
+_shared_clients_lock = threading.RLock()
+
+# Marks threads that are already workers of a concurrent fan-out (a batch or
+# _map_paths). Fan-out they start runs inline instead of opening another
+# pool, so a batch of recursive copies stays within the pool size rather
+# than reaching pool_size * pool_size concurrent requests.
+_fanout = threading.local()
+
+
+def _fanout_worker(func: Callable[..., _T]) -> Callable[..., _T]:
+    """Wrap ``func`` to run as a fan-out worker (see ``_fanout``)."""
+
+    @functools.wraps(func)
+    def run(*args: Any) -> _T:
+        _fanout.active = True
+        try:
+            return func(*args)
+        finally:
+            _fanout.active = False
+
+    return run
+
+
+def _acquire_client(key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+    """
+    Return the shared client for ``key``, creating it on first use.
+
+    Args:
+        key: Client identity (class, token, endpoint, pool size)
+        factory: Builds a new client
+
+    Returns:
+        API client
+    """
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is not None:
+            entry[1] += 1
+            return entry[0]
+
+    client = factory()
+    with _shared_clients_lock:
+        entry = _shared_clients.setdefault(key, [client, 0])
+        entry[1] += 1
+    if entry[0] is not client:
+        # Another thread created one first
+        client.close()
+    return entry[0]
+
+
+def _release_client(key: Tuple[Any, ...]) -> None:
+    """
+    Drop one user of a shared client, closing it after the last one.
+
+    Args:
+        key: Key passed to _acquire_client
+    """
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_clients[key]
+    entry[0].close()
+
+
+# Maximum number of directory listings cached per filesystem
+DIR_CACHE_SIZE = 1024
+
+
+class _DirListing(NamedTuple):
+    """A directory's entries, keyed by name."""
+
+    # Filesystem metadata as returned by info()
+    entries: Dict[str, Dict[str, Any]]
+    # Raw API ``links`` (upload/download/move URLs) for each entry
+    links: Dict[str, Dict[str, Any]]
+    # WaterButler URL of the directory itself, for creating new files
+    waterbutler_url: str
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one item of a batch_*_iter operation."""
+
+    # Source path (the deleted path for deletes)
+    source: str
+    # Destination path, or None for deletes
+    destination: Optional[str]
+    # Failure message, or None if the item succeeded
+    error: Optional[str]
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+# (expires_at, client cache generation, listing)
+_DirCacheEntry = Tuple[float, int, _DirListing]
+
+# Paths memoized by OSFFileSystem._resolve_path before the memo is reset
+RESOLVE_CACHE_SIZE = 8192
+
+# OSFFile reads bodies up to this size (by Content-Length) in a single chunk
+SMALL_READ_SIZE = 64 * 1024
+
+# Bodies at least this large are read in LARGE_READ_CHUNK_SIZE chunks, so
+# fewer Python iterations are spent per megabyte
+LARGE_READ_THRESHOLD = 16 * 1024 * 1024
+LARGE_READ_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Chunks read ahead of the local disk writer in get_file
+DOWNLOAD_QUEUE_DEPTH = 8
+
+# Read size for get_file when there is no checksum to verify and the raw
+# response stream is copied straight to disk
+RAW_DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+
+# cp's download-and-reupload fallback holds files up to this size in memory
+# and spills larger ones to a temporary file
+COPY_SPOOL_SIZE = 64 * 1024 * 1024
+
+# put() spools file objects it cannot seek in memory up to this size, and
+# to a temporary file beyond it, to learn their length before uploading
+UPLOAD_SPOOL_SIZE = 64 * 1024 * 1024
+
+# Extra attempts batch_copy/move give an item whose result failed
+# verification. Errors on individual requests (429, 5xx, connection errors)
+# are already retried by the client and are not retried again per item.
+BATCH_RETRIES = 2
+
+# Idle copy buffers kept for reuse by batch copies that fall back to
+# downloading. Buffers that spilled to disk are closed rather than pooled.
+COPY_BUFFER_POOL_SIZE = 4
+_copy_buffer_pool: "queue.LifoQueue[BinaryIO]" = queue.LifoQueue(
+    maxsize=COPY_BUFFER_POOL_SIZE
+)
+
+# Idle write buffers kept for reuse by OSFWriteFile. Buffers that grew past
+# Config.OSF_UPLOAD_CHUNK_SIZE are dropped rather than pooled.
+WRITE_BUFFER_POOL_SIZE = 4
+_write_buffer_pool: "queue.LifoQueue[bytearray]" = queue.LifoQueue(
+    maxsize=WRITE_BUFFER_POOL_SIZE
+)
+
+
+class _MemoryReader(io.RawIOBase):
+    """Seekable read-only file over a memoryview, without copying it."""
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        n = min(len(b), len(self._view) - self._pos)
+        if n <= 0:
+            return 0
+        b[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class _HashingReader:
+    """
+    File wrapper that MD5-hashes an upload body as it is read.
+
+    Seeking back (as upload retries do) rewinds the read position but not
+    the hash: bytes are hashed the first time they are read, so the digest
+    is only complete once every byte has been read at least once.
+    """
+
+    def __init__(self, file_obj: BinaryIO) -> None:
+        self._file = file_obj
+        self._md5 = hashlib.md5()
+        self._pos = file_obj.tell()
+        self._hashed = self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        end = self._pos + len(data)
+        if self._pos <= self._hashed < end:
+            with memoryview(data) as view:
+                self._md5.update(view[self._hashed - self._pos :])
+            self._hashed = end
+        self._pos = end
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._pos = self._file.seek(offset, whence)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def hexdigest(self, size: int) -> Optional[str]:
+        """Return the MD5 of the first ``size`` bytes, if all were read."""
+        return self._md5.hexdigest() if self._hashed == size else None
+
+
+def _copy_with_writer_thread(
+    src: Any, dst: BinaryIO, chunk_size: int, depth: int = DOWNLOAD_QUEUE_DEPTH
+) -> None:
+    """
+    Copy ``src`` to ``dst``, writing on a background thread.
+
+    The calling thread only reads (draining the socket and hashing in
+    OSFFile) while a writer thread flushes chunks to disk, so network and
+    disk time overlap instead of adding up. At most ``depth`` chunks are
+    held in memory. Sources with ``read1`` (OSFFile, buffered files) hand
+    over each chunk as it arrived rather than copying it into a new
+    ``chunk_size`` buffer.
+
+    Args:
+        src: Readable file object
+        dst: Writable binary file object
+        chunk_size: Maximum bytes per read
+        depth: Maximum chunks queued for the writer
+
+    Raises:
+        Exception: Any error from reading, or the first error from writing
+    """
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=depth)
+    errors: List[BaseException] = []
+
+    def _write() -> None:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            # After a failed write keep draining so the reader never blocks
+            if not errors:
+                try:
+                    dst.write(chunk)
+                except BaseException as e:
+                    errors.append(e)
+
+    writer = threading.Thread(
+        target=_write, name="dvc-osf-download-writer", daemon=True
+    )
+    read = getattr(src, "read1", src.read)
+    writer.start()
+    try:
+        while not errors:
+            chunk = read(chunk_size)
+            if not chunk:
+                break
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
 
 class OSFFile(io.IOBase):
     """
-    File-like object for reading OSF files with streaming support.
+    Binary file-like object for reading OSF files with streaming support.
 
-    Supports reading in both binary and text modes, with limited seeking
-    (forward seeks only) and position tracking.
+    Supports limited seeking (forward seeks only) and position tracking.
+    Text mode is provided by wrapping it in ``io.TextIOWrapper`` (see
+    OSFFileSystem.open). When an expected MD5 is given, chunks are hashed as
+    they stream past and the digest is checked once the body is exhausted.
     """
 
     def __init__(
         self,
-        response: requests.Response,
+        response: "requests.Response",
         mode: str = "rb",
         chunk_size: Optional[int] = None,
+        expected_checksum: Optional[str] = None,
     ) -> None:
         """
         Initialize OSF file wrapper.
 
         Args:
             response: Streaming HTTP response from OSF API
-            mode: File mode ('rb' for binary, 'r' for text)
-            chunk_size: Chunk size for reading (defaults to Config.CHUNK_SIZE)
-        """
+            mode: File mode; must be binary ('rb')
+            chunk_size: Chunk size for reading (defaults to Config.CHUNK_SIZE,
+                scaled to the response's Content-Length)
+            expected_checksum: MD5 hex digest to verify the body against
+        """
+        if "b" not in mode:
+            raise ValueError(
+                "OSFFile is binary; wrap it in io.TextIOWrapper for text mode"
+            )
         self.response = response
         self.mode = mode
-        self.chunk_size = chunk_size or Config.CHUNK_SIZE
+        self.chunk_size = chunk_size or self._default_chunk_size(response)
+        self.expected_checksum = expected_checksum
         self._position = 0
         self._closed = False
-        self._iterator = response.iter_content(chunk_size=self.chunk_size)
+        self._iterator: Iterator[bytes] = response.iter_content(
+            chunk_size=self.chunk_size
+        )
+        if expected_checksum:
+            self._iterator = self._verified(self._iterator, expected_checksum)
+        # Current chunk and the offset of its first unread byte; advancing
+        # the offset avoids re-slicing the chunk after every partial read
         self._buffer = b""
+        self._buf_pos = 0
+
+    @staticmethod
+    def _default_chunk_size(response: "requests.Response") -> int:
+        """
+        Pick a read chunk size from the response's Content-Length.
+
+        Small bodies are read in one chunk and large ones in
+        LARGE_READ_CHUNK_SIZE chunks; anything else, or a body of unknown
+        length, uses Config.CHUNK_SIZE.
+        """
+        try:
+            length = int(response.headers.get("Content-Length", 0))
+        except (TypeError, ValueError):
+            length = 0
+
+        chunk_size = Config.CHUNK_SIZE
+        if 0 < length <= SMALL_READ_SIZE:
+            return max(chunk_size, length)
+        if length >= LARGE_READ_THRESHOLD:
+            return max(chunk_size, LARGE_READ_CHUNK_SIZE)
+        return chunk_size
+
+    @staticmethod
+    def _verified(chunks: Iterator[bytes], expected: str) -> Iterator[bytes]:
+        """
+        Hash chunks as they are read and check the digest at end of body.
+
+        Hashing in the same pass as the read avoids buffering or re-reading
+        the file just to verify it.
+
+        Raises:
+            OSFIntegrityError: If the body does not match ``expected``
+        """
+        md5_hash = hashlib.md5()
+        for chunk in chunks:
+            md5_hash.update(chunk)
+            yield chunk
 
-    def read(self, size: int = -1) -> Union[bytes, str]:
+        actual = md5_hash.hexdigest()
+        if actual != expected:
+            raise OSFIntegrityError(
+                f"Checksum mismatch: expected {expected}, got {actual}",
+                expected_checksum=expected,
+                actual_checksum=actual,
+            )
+
+    def _fill(self) -> bool:
+        """
+        Ensure the buffered chunk has unread bytes, fetching the next one.
+
+        Returns:
+            False once the body is exhausted
+        """
+        while self._buf_pos >= len(self._buffer):
+            try:
+                self._buffer = next(self._iterator)
+            except StopIteration:
+                self._buffer = b""
+                self._buf_pos = 0
+                return False
+            self._buf_pos = 0
+        return True
+
+    def readable(self) -> bool:
+        """Check if file is readable."""
+        return not self._closed
+
+    def read(self, size: int = -1) -> bytes:
         """
-        Read bytes or characters from the file.
+        Read bytes from the file.
 
         Args:
-            size: Number of bytes/chars to read (-1 for all)
+            size: Number of bytes to read (-1 for all)
 
         Returns:
-            Bytes if binary mode, str if text mode
+            Bytes read
         """
         if self._closed:
             raise ValueError("I/O operation on closed file")
 
         if size == 0:
-            return b"" if "b" in self.mode else ""
-
-        chunks = []
-        bytes_read = 0
+            return b""
 
         try:
             if size < 0:
                 # Read all remaining data
-                if self._buffer:
-                    chunks.append(self._buffer)
-                    bytes_read += len(self._buffer)
-                    self._buffer = b""
+                buf = bytearray(memoryview(self._buffer)[self._buf_pos :])
+                self._buffer = b""
+                self._buf_pos = 0
 
                 for chunk in self._iterator:
-                    chunks.append(chunk)
-                    bytes_read += len(chunk)
+                    buf += chunk
             else:
-                # Read specific number of bytes
-                while bytes_read < size:
-                    if not self._buffer:
-                        try:
-                            self._buffer = next(self._iterator)
-                        except StopIteration:
-                            break
+                # Read specific number of bytes into a preallocated buffer,
+                # trimmed below if the body ends first
+                buf = bytearray(size)
+                bytes_read = 0
+                while bytes_read < size and self._fill():
+                    start = self._buf_pos
+                    take = min(size - bytes_read, len(self._buffer) - start)
+                    end = bytes_read + take
+                    buf[bytes_read:end] = memoryview(self._buffer)[start : start + take]
+                    self._buf_pos = start + take
+                    bytes_read = end
+                del buf[bytes_read:]
+
+        except Exception:
+            self.close()
+            raise
+
+        data = bytes(buf)
+        self._position += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        """
+        Read up to ``size`` bytes with at most one chunk fetched.
+
+        Returns whatever is buffered, or the next downloaded chunk, without
+        waiting to fill ``size``; io.TextIOWrapper reads through this.
 
-                    needed = size - bytes_read
-                    chunk = self._buffer[:needed]
-                    self._buffer = self._buffer[needed:]
+        Args:
+            size: Maximum number of bytes to read (-1 for one chunk)
 
-                    chunks.append(chunk)
-                    bytes_read += len(chunk)
+        Returns:
+            Bytes read; empty at end of file
+        """
+        if self._closed:
+            raise ValueError("I/O operation on closed file")
 
+        try:
+            if not self._fill():
+                return b""
         except Exception:
             self.close()
             raise
 
-        data = b"".join(chunks)
+        start = self._buf_pos
+        available = len(self._buffer) - start
+        take = available if size < 0 else min(size, available)
+        # A whole unread chunk is returned as is, without copying
+        data = self._buffer[start : start + take]
+        self._buf_pos = start + take
         self._position += len(data)
+        return data
 
-        if "b" in self.mode:
-            return data
-        else:
-            return data.decode("utf-8")
-
-    def readline(self, size: int = -1) -> Union[bytes, str]:  # type: ignore[override]
+    def readline(self, size: int = -1) -> bytes:  # type: ignore[override]
         """
         Read a single line from the file.
 
         Args:
-            size: Maximum number of bytes/chars to read
+            size: Maximum number of bytes to read
 
         Returns:
-            Line as bytes or str
+            Line including its newline, if any
         """
         if self._closed:
             raise ValueError("I/O operation on closed file")
 
-        # Simple implementation: read chunks until we find a newline
-        line_parts = []
-        bytes_read = 0
-
-        while True:
-            if size > 0 and bytes_read >= size:
-                break
+        if size == 0:
+            return b""
 
-            chunk = self.read(self.chunk_size)
-            if not chunk:
-                break
+        # Scan buffered bytes for the newline without re-reading through read()
+        line_parts = []
+        remaining = size if size > 0 else -1
 
-            # Look for newline
-            if "b" in self.mode:
-                bchunk = chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
-                newline_pos = bchunk.find(b"\n")
-            else:
-                schunk = chunk if isinstance(chunk, str) else chunk.decode("utf-8")
-                newline_pos = schunk.find("\n")
-
-            if newline_pos >= 0:
-                # Found newline - include it and stop
-                line_parts.append(chunk[: newline_pos + 1])
-                # Put the rest back in the buffer
-                remaining = chunk[newline_pos + 1 :]
-                remaining_bytes = (
-                    remaining
-                    if isinstance(remaining, bytes)
-                    else remaining.encode("utf-8")
-                )
-                self._buffer = remaining_bytes + self._buffer
-                if "b" in self.mode:
-                    self._position -= len(remaining_bytes)
-                else:
-                    self._position -= len(remaining)
-                break
-            else:
-                line_parts.append(chunk)
-                bytes_read += len(chunk)
+        try:
+            while remaining != 0 and self._fill():
+                start = self._buf_pos
+                limit = len(self._buffer)
+                if remaining > 0:
+                    limit = min(limit, start + remaining)
+                newline_pos = self._buffer.find(b"\n", start, limit)
+                end = newline_pos + 1 if newline_pos >= 0 else limit
+
+                line_parts.append(self._buffer[start:end])
+                self._buf_pos = end
+                if remaining > 0:
+                    remaining -= end - start
+                if newline_pos >= 0:
+                    break
+        except Exception:
+            self.close()
+            raise
 
-        if "b" in self.mode:
-            return b"".join(line_parts)  # type: ignore
-        else:
-            return "".join(line_parts)  # type: ignore
+        data = b"".join(line_parts)
+        self._position += len(data)
+        return data
 
     def __iter__(self) -> "OSFFile":  # type: ignore[override]
         """Return iterator for line-by-line reading."""
         return self
 
-    def __next__(self) -> Union[bytes, str]:  # type: ignore[override]
+    def __next__(self) -> bytes:  # type: ignore[override]
         """Read next line when iterating."""
         line = self.readline()
         if not line:
@@ -227,13 +636,28 @@ class OSFFile(io.IOBase):
         else:
             raise OSError("Seeking from end not supported on streaming files")
 
-        # Read and discard data to simulate seek
-        while skip > 0:
-            chunk_size = min(skip, self.chunk_size)
-            data = self.read(chunk_size)
-            if not data:
-                break
-            skip -= len(data)
+        # Discard buffered and streamed chunks without copying them
+        drop = min(skip, len(self._buffer) - self._buf_pos)
+        if drop > 0:
+            self._buf_pos += drop
+            self._position += drop
+            skip -= drop
+
+        try:
+            while skip > 0:
+                try:
+                    chunk = next(self._iterator)
+                except StopIteration:
+                    break
+                take = min(len(chunk), skip)
+                self._position += take
+                skip -= take
+                if take < len(chunk):
+                    self._buffer = chunk
+                    self._buf_pos = take
+        except Exception:
+            self.close()
+            raise
 
         return self._position
 
@@ -271,13 +695,14 @@ class OSFWriteFile(io.IOBase):
     """
     File-like object for writing to OSF files.
 
-    Buffers data and uploads on close or explicit flush.
-    Supports both binary and text write modes.
+    Buffers data in memory up to ``chunk_size`` bytes, then spills to a
+    temporary file, and uploads on close. Supports both binary and text
+    write modes.
     """
 
     def __init__(
         self,
-        api_client: OSFAPIClient,
+        api_client: "OSFAPIClient",
         upload_url: str,
         mode: str = "wb",
         chunk_size: Optional[int] = None,
@@ -295,7 +720,14 @@ class OSFWriteFile(io.IOBase):
         self.upload_url = upload_url
         self.mode = mode
         self.chunk_size = chunk_size or Config.OSF_UPLOAD_CHUNK_SIZE
-        self._buffer = io.BytesIO()
+        # Pooled buffers keep their length (clearing would free the
+        # allocation), so only the first _bytes_written bytes are data.
+        try:
+            self._buffer = _write_buffer_pool.get_nowait()
+        except queue.Empty:
+            self._buffer = bytearray()
+        # Disk-backed buffer once more than chunk_size bytes are written
+        self._spill: Optional[BinaryIO] = None
         self._closed = False
         self._bytes_written = 0
 
@@ -325,9 +757,18 @@ class OSFWriteFile(io.IOBase):
                 raise TypeError("write() argument must be str, not 'bytes'")
             data_bytes = data
 
-        # Write to buffer
-        bytes_written = self._buffer.write(data_bytes)
-        self._bytes_written += bytes_written
+        bytes_written = len(data_bytes)
+        end = self._bytes_written + bytes_written
+        if self._spill is None and end > self.chunk_size:
+            self._spill = tempfile.TemporaryFile()
+            with memoryview(self._buffer)[: self._bytes_written] as view:
+                self._spill.write(view)
+        if self._spill is not None:
+            self._spill.write(data_bytes)
+        else:
+            # Overwrite stale bytes from a pooled buffer
+            self._buffer[self._bytes_written : end] = data_bytes
+        self._bytes_written = end
 
         return len(data) if isinstance(data, str) else bytes_written
 
@@ -340,22 +781,35 @@ class OSFWriteFile(io.IOBase):
         if self._closed:
             return
 
+        buffer = self._buffer
         try:
-            # Get buffered data
-            self._buffer.seek(0)
-            file_data = self._buffer.read()
-
-            if file_data:
-                # Upload the data
+            if self._spill is not None:
+                self._spill.seek(0)
                 self.api_client.upload_file(
                     self.upload_url,
-                    io.BytesIO(file_data),
+                    self._spill,
                     callback=None,
-                    total_size=len(file_data),
+                    total_size=self._bytes_written,
                 )
+            elif self._bytes_written:
+                # Upload straight from the buffer instead of a bytes copy
+                with memoryview(buffer)[: self._bytes_written] as view:
+                    self.api_client.upload_file(
+                        self.upload_url,
+                        _MemoryReader(view),
+                        callback=None,
+                        total_size=self._bytes_written,
+                    )
         finally:
             self._closed = True
-            self._buffer.close()
+            self._buffer = bytearray()
+            if self._spill is not None:
+                self._spill.close()
+            if len(buffer) <= Config.OSF_UPLOAD_CHUNK_SIZE:
+                try:
+                    _write_buffer_pool.put_nowait(buffer)
+                except queue.Full:
+                    pass
 
     def writable(self) -> bool:
         """Check if file is writable."""
@@ -418,6 +872,7 @@ class OSFFileSystem(ObjectFileSystem):
         project_id: Optional[str] = None,
         provider: Optional[str] = None,
         endpoint_url: Optional[str] = None,
+        connection_pool_size: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -431,6 +886,8 @@ class OSFFileSystem(ObjectFileSystem):
             project_id: OSF project ID (alternative to URL)
             provider: OSF storage provider (default: osfstorage)
             endpoint_url: Custom OSF API endpoint URL
+            connection_pool_size: Keep-alive connections per host (defaults to
+                Config.CONNECTION_POOL_SIZE, or DVC's ``jobs`` if larger)
             **kwargs: Additional arguments (may include fs_args, host, etc.)
         """
         super().__init__(*args, **kwargs)
@@ -467,8 +924,45 @@ class OSFFileSystem(ObjectFileSystem):
         if creds.get("endpoint_url"):
             Config.API_BASE_URL = creds["endpoint_url"]
 
-        # Initialize API client
-        self.client = OSFAPIClient(token=self.token)
+        # Initialize API client.  Its pooled session is shared by every
+        # operation on this filesystem, and by other filesystems for the same
+        # account and endpoint; it is closed once they are all closed or
+        # collected.
+        from .api import OSFAPIClient
+
+        # DVC runs up to ``jobs`` transfers at once; a smaller pool would
+        # open and discard a connection (and TLS handshake) per extra
+        # request instead of keeping it alive.
+        self._pool_size = int(
+            connection_pool_size or max(Config.CONNECTION_POOL_SIZE, self.jobs)
+        )
+        client_key = (OSFAPIClient, self.token, Config.API_BASE_URL, self._pool_size)
+        # A new client opens its first connection in the background while
+        # the caller is still resolving paths.
+        self.client = _acquire_client(
+            client_key,
+            lambda: OSFAPIClient(
+                token=self.token, pool_size=self._pool_size, prewarm=True
+            ),
+        )
+        self._finalizer = weakref.finalize(self, _release_client, client_key)
+
+        # Parent directory listings used by info(), open() and uploads, keyed by
+        # (project_id, provider, dir_path). Invalidated by client writes.
+        self._dir_cache: "OrderedDict[Tuple[str, str, str], _DirCacheEntry]" = (
+            OrderedDict()
+        )
+        self._dir_cache_lock = threading.Lock()
+        self._dir_fetch_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+
+        # _resolve_path results; the project, provider and base path are
+        # fixed for the filesystem's lifetime.
+        self._resolve_cache: Dict[str, Tuple[str, str, str]] = {}
+        self._base_prefix = f"{self.base_path}/" if self.base_path else ""
+
+    def close(self) -> None:
+        """Release the API client, closing it if no other filesystem uses it."""
+        self._finalizer()
 
     def _prepare_credentials(self, **config: Any) -> Dict[str, Any]:
         """
@@ -563,6 +1057,19 @@ class OSFFileSystem(ObjectFileSystem):
         Returns:
             Tuple of (project_id, provider, full_path)
         """
+        try:
+            return self._resolve_cache[path]
+        except KeyError:
+            pass
+
+        resolved = self._resolve_uncached(path)
+        if len(self._resolve_cache) >= RESOLVE_CACHE_SIZE:
+            self._resolve_cache.clear()
+        self._resolve_cache[path] = resolved
+        return resolved
+
+    def _resolve_uncached(self, path: str) -> tuple[str, str, str]:
+        """Resolve a path for _resolve_path without consulting its memo."""
         # Remove protocol prefix if present
         path = self._strip_protocol(path)
 
@@ -579,11 +1086,7 @@ class OSFFileSystem(ObjectFileSystem):
                 return project_id, provider, file_path
 
         # Relative path - use instance's project and provider
-        if self.base_path:
-            full_path = normalize_path(f"{self.base_path}/{path}")
-        else:
-            full_path = normalize_path(path)
-
+        full_path = normalize_path(self._base_prefix + path)
         return self.project_id, self.provider, full_path
 
     @staticmethod
@@ -606,26 +1109,119 @@ class OSFFileSystem(ObjectFileSystem):
             return path[6:]
         return path
 
+    def _map_paths(
+        self,
+        func: Callable[[_K], _T],
+        paths: List[_K],
+        batch_size: Optional[int] = None,
+        thread_name_prefix: str = "dvc-osf-info",
+    ) -> List[_T]:
+        """
+        Apply ``func`` to each path concurrently, preserving order.
+
+        Metadata probes are independent round trips, so they are spread
+        over the client's connection pool instead of run one by one. Called
+        from a worker of another fan-out, it runs inline, since that
+        fan-out already fills the pool.
+
+        Args:
+            func: Per-path function
+            paths: Paths to process
+            batch_size: Maximum calls in flight (defaults to, and is capped
+                at, the pool size)
+            thread_name_prefix: Name prefix for the worker threads
+
+        Returns:
+            Results in the same order as ``paths``
+
+        Raises:
+            Exception: The first error raised by ``func``; calls that had
+                not started by then are cancelled
+        """
+        if len(paths) < 2 or getattr(_fanout, "active", False):
+            return [func(p) for p in paths]
+
+        workers = max(
+            1, min(batch_size or self._pool_size, self._pool_size, len(paths))
+        )
+        run = _fanout_worker(func)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=thread_name_prefix
+        ) as executor:
+            futures = [executor.submit(run, p) for p in paths]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+
+        for future in futures:
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                raise error
+        return [future.result() for future in futures]
+
     def exists(self, path: str, **kwargs: Any) -> bool:  # type: ignore[override]
         """
         Check if a path exists on OSF.
 
         Args:
             path: Path to check
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (``batch_size`` bounds concurrency
+                for lists)
 
         Returns:
             True if path exists, False otherwise.
-            If path is a list, returns a list of booleans (dvc-objects batch API).
+            If path is a list, returns a list of booleans (dvc-objects batch API),
+            probed concurrently.
         """
         if isinstance(path, list):
-            return [self.exists(p) for p in path]
+            found = self.exists_many(path, batch_size=kwargs.get("batch_size"))
+            return [found[p] for p in path]  # type: ignore[return-value]
         try:
             self.info(path)
             return True
         except OSFNotFoundError:
             return False
 
+    def exists_many(
+        self, paths: List[str], batch_size: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """
+        Check many paths with one listing per parent directory.
+
+        DVC checks objects in batches that mostly share a few parent
+        directories, so the paths are grouped by parent and each group is
+        answered from a single (cached) listing. Listings of different
+        parents are fetched concurrently.
+
+        Args:
+            paths: Paths to check
+            batch_size: Maximum listings in flight (defaults to the pool size)
+
+        Returns:
+            Mapping of each path to whether it exists
+        """
+        found: Dict[str, bool] = {}
+        groups: Dict[Tuple[str, str, str], List[Tuple[str, str]]] = {}
+        for p in paths:
+            project_id, provider, file_path = self._resolve_path(p)
+            if not file_path:
+                # The provider root always exists
+                found[p] = True
+                continue
+            key = (project_id, provider, get_directory(file_path))
+            groups.setdefault(key, []).append((p, get_filename(file_path)))
+
+        def _check_group(key: Tuple[str, str, str]) -> None:
+            try:
+                entries = self._list_dir(*key).entries
+            except OSFNotFoundError:
+                entries = {}
+            for p, name in groups[key]:
+                found[p] = name in entries
+
+        self._map_paths(_check_group, list(groups), batch_size)
+        return found
+
     def isfile(self, path: str) -> bool:  # type: ignore[override]
         """Return True if *path* is a file on OSF.
 
@@ -840,10 +1436,7 @@ class OSFFileSystem(ObjectFileSystem):
         results: List = []
 
         def _collect(listing_url: str, current_dir: str, depth: int) -> None:
-            next_url: Optional[str] = listing_url
-            while next_url and isinstance(next_url, str):
-                response = self.client.get(next_url)
-                data = response.json()
+            for data in self.client.iter_pages(listing_url):
                 for item in data.get("data", []):
                     attrs = item.get("attributes", {})
                     name = attrs.get("name", "")
@@ -887,8 +1480,6 @@ class OSFFileSystem(ObjectFileSystem):
                             if sub_listing:
                                 _collect(sub_listing, item_dir, depth + 1)
 
-                next_url = data.get("links", {}).get("next")
-
         _collect(listing_url, dir_path, 1)
 
         # ObjectDB.path_to_oid expects result paths to use the same format as
@@ -989,11 +1580,30 @@ class OSFFileSystem(ObjectFileSystem):
 
         Args:
             path: Path to query
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (``batch_size`` and
+                ``return_exceptions`` apply to lists)
 
         Returns:
-            Dictionary with file/directory metadata
+            Dictionary with file/directory metadata.
+            If path is a list, returns a list of results fetched concurrently;
+            with ``return_exceptions=True`` failures are returned in place.
         """
+        if isinstance(path, list):
+            batch_size = kwargs.pop("batch_size", None)
+            return_exceptions = kwargs.pop("return_exceptions", False)
+
+            def _info_one(p: str) -> Any:
+                try:
+                    return self.info(p, **kwargs)
+                except Exception as e:
+                    if return_exceptions:
+                        return e
+                    raise
+
+            return self._map_paths(  # type: ignore[return-value]
+                _info_one, path, batch_size
+            )
+
         project_id, provider, file_path = self._resolve_path(path)
 
         # For empty path (root directory), list it
@@ -1007,43 +1617,134 @@ class OSFFileSystem(ObjectFileSystem):
                 "checksum": None,
             }
 
-        # Need to search for file by listing parent directory.
-        # OSF uses internal IDs for nested paths, so we navigate using
-        # _navigate_to_dir instead of constructing the URL by string concatenation.
-        parent_path = get_directory(file_path)
-        filename = get_filename(file_path)
+        metadata, _ = self._find_item(path, project_id, provider, file_path)
+        return dict(metadata)
+
+    def _find_item(
+        self, path: str, project_id: str, provider: str, file_path: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Look an item up in its parent directory's listing.
+
+        DVC probes many siblings at once (one per object hash), so the
+        listing is fetched once and cached rather than walked per path.
 
+        Returns:
+            The item's metadata (as returned by info()) and its API links
+
+        Raises:
+            OSFNotFoundError: If the item or its parent does not exist
+        """
         try:
-            listing_url, _ = self._navigate_to_dir(
-                project_id, provider, parent_path, create_missing=False
-            )
+            listing = self._list_dir(project_id, provider, get_directory(file_path))
         except OSFNotFoundError:
             raise OSFNotFoundError(f"File not found: {path}")
 
-        next_url: Optional[str] = listing_url
-        while next_url and isinstance(next_url, str):
-            response = self.client.get(next_url)
-            data = response.json()
-
-            if "data" in data:
-                for item in data["data"]:
-                    item_name = item.get("attributes", {}).get("name", "")
-                    if item_name == filename:
-                        return self._parse_metadata(
-                            project_id, provider, parent_path, item
-                        )
+        filename = get_filename(file_path)
+        try:
+            metadata = listing.entries[filename]
+        except KeyError:
+            raise OSFNotFoundError(f"File not found: {path}") from None
+        return metadata, listing.links.get(filename, {})
+
+    def _list_dir(self, project_id: str, provider: str, dir_path: str) -> _DirListing:
+        """
+        Return a directory's entries and their API links, cached.
+
+        Listings are reused for ``Config.CACHE_TTL`` seconds and dropped as
+        soon as the client performs a write. Concurrent misses for the same
+        directory wait for a single fetch.
+
+        Args:
+            project_id: OSF project ID
+            provider: Storage provider
+            dir_path: Directory path within the provider
 
-            next_url = data.get("links", {}).get("next")
+        Returns:
+            Metadata and links for each entry, keyed by name
+
+        Raises:
+            OSFNotFoundError: If the directory does not exist
+        """
+        key = (project_id, provider, dir_path)
+        ttl = Config.CACHE_TTL
+        if ttl <= 0:
+            return self._fetch_dir(project_id, provider, dir_path)
+
+        with self._dir_cache_lock:
+            fetch_lock = self._dir_fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            generation = self.client.cache_generation
+            with self._dir_cache_lock:
+                cached = self._dir_cache.get(key)
+                if cached is not None:
+                    expires_at, cached_generation, listing = cached
+                    if (
+                        expires_at > time.monotonic()
+                        and cached_generation == generation
+                    ):
+                        self._dir_cache.move_to_end(key)
+                        return listing
+
+            listing = self._fetch_dir(project_id, provider, dir_path)
+
+            with self._dir_cache_lock:
+                # A write that finished during the fetch may not be reflected
+                # in the listing; return it but don't keep it. The client
+                # clears again once each write is over, so a fetch that
+                # overlapped a write always fails this check.
+                if self.client.cache_generation != generation:
+                    return listing
+                self._dir_cache[key] = (time.monotonic() + ttl, generation, listing)
+                self._dir_cache.move_to_end(key)
+                while len(self._dir_cache) > DIR_CACHE_SIZE:
+                    evicted, _ = self._dir_cache.popitem(last=False)
+                    self._dir_fetch_locks.pop(evicted, None)
+        return listing
+
+    def _fetch_dir(self, project_id: str, provider: str, dir_path: str) -> _DirListing:
+        """
+        List a directory from OSF, following pagination.
+
+        OSF uses internal IDs for nested paths, so the listing URL comes from
+        _navigate_to_dir rather than string concatenation.
+
+        Args:
+            project_id: OSF project ID
+            provider: Storage provider
+            dir_path: Directory path within the provider
+
+        Returns:
+            Metadata and links for each entry, keyed by name
+
+        Raises:
+            OSFNotFoundError: If the directory does not exist
+        """
+        listing_url, waterbutler_url = self._navigate_to_dir(
+            project_id, provider, dir_path, create_missing=False
+        )
 
-        # File not found
-        raise OSFNotFoundError(f"File not found: {path}")
+        listing = _DirListing({}, {}, waterbutler_url)
+        for data in self.client.iter_pages(listing_url):
+            for item in data.get("data") or ():
+                name = item.get("attributes", {}).get("name", "")
+                listing.entries[name] = self._parse_metadata(
+                    project_id, provider, dir_path, item
+                )
+                listing.links[name] = item.get("links") or {}
+        return listing
 
     def open(  # type: ignore[override]
         self, path: str, mode: str = "rb", **kwargs: Any
-    ) -> Union[OSFFile, OSFWriteFile]:
+    ) -> Union[OSFFile, OSFWriteFile, io.TextIOWrapper]:
         """
         Open a file on OSF.
 
+        Text read mode ('r') wraps the binary OSFFile in a UTF-8
+        io.TextIOWrapper, which decodes incrementally and handles universal
+        newlines and multi-byte characters split across chunks.
+
         Args:
             path: Path to the file
             mode: File mode ('rb', 'r' for read, 'wb', 'w' for write)
@@ -1076,53 +1777,42 @@ class OSFFileSystem(ObjectFileSystem):
 
             return OSFWriteFile(self.client, upload_url, mode=mode)
 
-        # Handle read modes (existing logic)
-        # Get file info (which finds the file and gets its metadata)
-        _ = self.info(path)
-
-        # We need to get the full item to extract download URL
-        # Re-query to get the full item with links
+        # Handle read modes. The parent listing holds both the file's
+        # metadata and its download link.
         project_id, provider, file_path = self._resolve_path(path)
-        parent_path = get_directory(file_path)
-        filename = get_filename(file_path)
-
-        # Navigate to parent directory using IDs (handles nested paths + pagination)
-        try:
-            listing_url, _ = self._navigate_to_dir(
-                project_id, provider, parent_path, create_missing=False
-            )
-        except OSFNotFoundError:
+        if not file_path:
             raise OSFNotFoundError(f"Download URL not found for path: {path}")
+        file_info, links = self._find_item(path, project_id, provider, file_path)
 
-        # Search the listing for the file, following pagination
-        download_url = None
-        next_url: Optional[str] = listing_url
-        while next_url and isinstance(next_url, str) and download_url is None:
-            response = self.client.get(next_url)
-            data = response.json()
-            for item in data.get("data", []):
-                item_name = item.get("attributes", {}).get("name", "")
-                if item_name == filename:
-                    links = item.get("links", {})
-                    # Use 'upload' link which supports authentication for downloads
-                    # The 'download' link goes to osf.io which doesn't support API auth
-                    download_url = links.get("upload") or links.get("move")
-                    break
-            next_url = data.get("links", {}).get("next")
-
+        # Use 'upload' link which supports authentication for downloads
+        # The 'download' link goes to osf.io which doesn't support API auth
+        download_url = links.get("upload") or links.get("move")
         if not download_url:
             raise OSFNotFoundError(f"Download URL not found for path: {path}")
 
         # Download file with streaming
         stream_response = self.client.download_file(download_url)
 
-        return OSFFile(stream_response, mode=mode)
+        f = OSFFile(
+            stream_response,
+            mode="rb",
+            expected_checksum=file_info.get("checksum"),
+        )
+        if "b" in mode:
+            return f
+
+        text = io.TextIOWrapper(f, encoding="utf-8")
+        text.mode = mode  # type: ignore[misc]
+        return text
 
     def get_file(self, rpath: str, lpath: str, **kwargs: Any) -> None:  # type: ignore[override] # noqa: E501
         """
         Download a file from OSF to local path.
 
-        Downloads with streaming, computes MD5 checksum, and verifies integrity.
+        Downloads with streaming; the MD5 checksum is computed as the bytes
+        are read (see :class:`OSFFile`) and verified at end of file, while a
+        writer thread saves earlier chunks to disk. Files without a checksum
+        are copied from the raw response in large reads instead.
 
         Args:
             rpath: Remote path on OSF
@@ -1132,39 +1822,46 @@ class OSFFileSystem(ObjectFileSystem):
         Raises:
             OSFIntegrityError: If checksum verification fails
         """
-        # Get file metadata for expected checksum
-        file_info = self.info(rpath)
-        expected_checksum = file_info.get("checksum")
-
         # Create parent directories if needed
         os.makedirs(os.path.dirname(os.path.abspath(lpath)), exist_ok=True)
 
-        # Download and compute checksum
-        md5_hash = hashlib.md5()
-
-        with self.open(rpath, mode="rb") as remote_file:
+        try:
             with open(lpath, "wb") as local_file:
-                while True:
-                    chunk = remote_file.read(Config.CHUNK_SIZE)
-                    if not chunk:
-                        break
+                self._download_to_fileobj(rpath, local_file)
+        except OSFIntegrityError as e:
+            # Remove corrupted file, without letting a failed cleanup mask
+            # the checksum error
+            try:
+                os.unlink(lpath)
+            except FileNotFoundError:
+                pass
+            except OSError as cleanup_error:
+                logger.warning(f"Failed to remove {lpath}: {cleanup_error}")
+            raise OSFIntegrityError(
+                f"Checksum mismatch for {rpath}: "
+                f"expected {e.expected_checksum}, got {e.actual_checksum}",
+                expected_checksum=e.expected_checksum,
+                actual_checksum=e.actual_checksum,
+            ) from e
 
-                    chunk_bytes = chunk if isinstance(chunk, bytes) else chunk.encode()
-                    local_file.write(chunk_bytes)
-                    md5_hash.update(chunk_bytes)
+    def _download_to_fileobj(self, rpath: str, fileobj: BinaryIO) -> None:
+        """
+        Stream a remote file into a writable binary file object.
 
-        # Verify checksum if available
-        if expected_checksum:
-            actual_checksum = md5_hash.hexdigest()
-            if actual_checksum != expected_checksum:
-                # Remove corrupted file
-                os.remove(lpath)
-                raise OSFIntegrityError(
-                    f"Checksum mismatch for {rpath}: "
-                    f"expected {expected_checksum}, got {actual_checksum}",
-                    expected_checksum=expected_checksum,
-                    actual_checksum=actual_checksum,
-                )
+        Raises:
+            OSFIntegrityError: If checksum verification fails
+        """
+        with self.open(rpath, mode="rb") as remote_file:
+            if remote_file.expected_checksum is None:
+                # Nothing to hash: skip the chunk iterator and let urllib3
+                # fill large buffers (still decoding any Content-Encoding)
+                raw = remote_file.response.raw
+                raw.decode_content = True
+                shutil.copyfileobj(raw, fileobj, RAW_DOWNLOAD_BUFFER_SIZE)
+            else:
+                # Each chunk is hashed once as it is read and then passed
+                # whole to the writer: one MD5 update and one write per chunk
+                _copy_with_writer_thread(remote_file, fileobj, remote_file.chunk_size)
 
     def put_file(  # type: ignore[override]
         self,
@@ -1193,37 +1890,37 @@ class OSFFileSystem(ObjectFileSystem):
             file_size, Config.OSF_UPLOAD_CHUNK_SIZE
         )
 
+        def _upload() -> Tuple[Optional[str], Optional[str]]:
+            if upload_strategy == "single":
+                return self._put_file_simple(lpath, rpath, callback)
+            return self._put_file_chunked(lpath, rpath, callback)
+
         # OSF / WaterButler have eventual consistency: directories created
         # during put may not be visible in the listing API for a few seconds.
-        # Retry once on OSFNotFoundError with a short backoff.
-        import time as _time
+        # Retry on OSFNotFoundError after ~2s, then ~4s.
+        try:
+            checksums = retry_with_backoff(
+                _upload, max_retries=2, base=1.0, retry_on=(OSFNotFoundError,)
+            )
+        except OSFVersionConflictError:
+            # 409: file already exists at target location.
+            # For DVC's content-addressed cache, filename == MD5, so same
+            # name means same content — treat as success without checking.
+            return
 
-        max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
-            try:
-                if upload_strategy == "single":
-                    remote_md5 = self._put_file_simple(lpath, rpath, callback)
-                else:
-                    remote_md5 = self._put_file_chunked(lpath, rpath, callback)
-                break  # success
-            except OSFVersionConflictError:
-                # 409: file already exists at target location.
-                # For DVC's content-addressed cache, filename == MD5, so same
-                # name means same content — treat as success without checking.
-                return
-            except OSFNotFoundError:
-                if attempt < max_attempts:
-                    _time.sleep(2 * attempt)  # 2s, 4s
-                else:
-                    raise
+        # The local MD5 was computed while the body was read for upload, so
+        # the file is only read once; it is None if the upload did not read
+        # the whole file.
+        remote_md5, local_md5 = checksums
+        if local_md5 is None:
+            with open(lpath, "rb") as f:
+                local_md5 = compute_upload_checksum(f)
 
         # Verify checksum using MD5 returned directly in the upload response.
         # This avoids a second OSF API round-trip (info() → _navigate_to_dir)
         # which is unreliable for freshly created WaterButler paths whose
         # parent directories may not yet appear in the OSF listing API.
         if remote_md5:
-            with open(lpath, "rb") as f:
-                local_md5 = compute_upload_checksum(f)
             if local_md5 != remote_md5:
                 raise OSFIntegrityError(
                     f"Checksum mismatch after upload for {rpath}: "
@@ -1234,18 +1931,19 @@ class OSFFileSystem(ObjectFileSystem):
                 )
         else:
             # Response did not include MD5 — fall back to info()-based check.
-            self._verify_upload_checksum(lpath, rpath)
+            self._verify_upload_checksum(lpath, rpath, local_md5)
 
     def _put_file_simple(
         self,
         lpath: str,
         rpath: str,
         callback: Optional[Callable[[int, int], None]] = None,
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Optional[str]]:
         """Upload a small file using single PUT request.
 
         Returns:
-            MD5 checksum from upload response, or None if not available.
+            ``(remote_md5, local_md5)``: the MD5 from the upload response and
+            the MD5 of the bytes sent, each None if not available.
         """
         project_id, provider, file_path = self._resolve_path(rpath)
 
@@ -1254,8 +1952,9 @@ class OSFFileSystem(ObjectFileSystem):
 
         # Upload file
         file_size = os.path.getsize(lpath)
-        with open(lpath, "rb") as f:
-            response = self.client.upload_file(upload_url, f, callback, file_size)
+        response, local_md5 = self._upload_hashed(
+            upload_url, lpath, callback, file_size
+        )
 
         # Invoke final callback if provided (only if directly callable;
         # DVC may pass fsspec Callback objects which are not callable)
@@ -1266,30 +1965,22 @@ class OSFFileSystem(ObjectFileSystem):
                 pass
 
         # Return MD5 from upload response to avoid a second API round-trip.
-        try:
-            return (
-                str(
-                    response.json().get("data", {}).get("attributes", {}).get("md5")
-                    or ""
-                )
-                or None
-            )
-        except Exception:
-            return None
+        return self._response_md5(response), local_md5
 
     def _put_file_chunked(
         self,
         lpath: str,
         rpath: str,
         callback: Optional[Callable[[int, int], None]] = None,
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Optional[str]]:
         """Upload a large file using streaming PUT (not multi-request chunking).
 
         Note: OSF doesn't support true multi-request chunked uploads. Instead,
         we stream the file in a single PUT request for memory efficiency.
 
         Returns:
-            MD5 checksum from upload response, or None if not available.
+            ``(remote_md5, local_md5)``: the MD5 from the upload response and
+            the MD5 of the bytes sent, each None if not available.
         """
         project_id, provider, file_path = self._resolve_path(rpath)
 
@@ -1300,19 +1991,84 @@ class OSFFileSystem(ObjectFileSystem):
         file_size = os.path.getsize(lpath)
 
         # Upload file with streaming for memory efficiency
+        response, local_md5 = self._upload_hashed(
+            upload_url, lpath, callback, file_size
+        )
+        return self._response_md5(response), local_md5
+
+    def _upload_fileobj(
+        self, fileobj: BinaryIO, rpath: str, size: int
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Upload ``size`` bytes from a seekable file object, starting at 0.
+
+        Returns:
+            ``(remote_md5, local_md5)``: the MD5 reported by WaterButler and
+            the MD5 of the bytes sent, each None if not available.
+
+        Raises:
+            OSFIntegrityError: If the two MD5s differ
+        """
+        project_id, provider, file_path = self._resolve_path(rpath)
+
+        def _upload() -> Tuple[Optional[str], Optional[str]]:
+            fileobj.seek(0)
+            upload_url = self._get_upload_url(project_id, provider, file_path)
+            reader = _HashingReader(fileobj)
+            response = self.client.upload_file(
+                upload_url, reader, None, size  # type: ignore[arg-type]
+            )
+            return self._response_md5(response), reader.hexdigest(size)
+
+        # Retry while freshly created parent directories become visible
+        remote_md5, local_md5 = retry_with_backoff(
+            _upload, max_retries=2, base=1.0, retry_on=(OSFNotFoundError,)
+        )
+        if remote_md5 and local_md5 and remote_md5 != local_md5:
+            raise OSFIntegrityError(
+                f"Checksum mismatch after upload for {rpath}: "
+                f"expected {local_md5}, got {remote_md5}",
+                expected_checksum=local_md5,
+                actual_checksum=remote_md5,
+            )
+        return remote_md5, local_md5
+
+    def _upload_hashed(
+        self,
+        upload_url: str,
+        lpath: str,
+        callback: Optional[Callable[[int, int], None]],
+        file_size: int,
+    ) -> Tuple[Any, Optional[str]]:
+        """Upload a local file, hashing it in the same pass.
+
+        Returns:
+            The upload response and the local file's MD5 (None if the upload
+            did not read the whole file).
+        """
         with open(lpath, "rb") as f:
-            response = self.client.upload_file(upload_url, f, callback, file_size)
+            reader = _HashingReader(f)
+            response = self.client.upload_file(
+                upload_url, reader, callback, file_size  # type: ignore[arg-type]
+            )
+        return response, reader.hexdigest(file_size)
+
+    @staticmethod
+    def _response_md5(response: Any) -> Optional[str]:
+        """Return the MD5 reported in an upload response, if any.
 
+        WaterButler returns the stored file's metadata, with the hash under
+        ``attributes.extra.hashes.md5`` (some providers use
+        ``attributes.md5``).
+        """
         try:
-            return (
-                str(
-                    response.json().get("data", {}).get("attributes", {}).get("md5")
-                    or ""
-                )
-                or None
-            )
+            attributes = load_json(response.content)["data"]["attributes"]
         except Exception:
             return None
+        md5 = ((attributes.get("extra") or {}).get("hashes") or {}).get(
+            "md5"
+        ) or attributes.get("md5")
+        return str(md5) if md5 else None
 
     def _navigate_to_dir(
         self,
@@ -1368,7 +2124,7 @@ class OSFFileSystem(ObjectFileSystem):
                     # via WB and isn't reflected in OSF metadata API yet.
                     listing_404 = True
                     break
-                data = response.json()
+                data = load_json(response.content)
                 for item in data.get("data", []):
                     if item.get("attributes", {}).get("name") == part:
                         found_item = item
@@ -1531,37 +2287,37 @@ class OSFFileSystem(ObjectFileSystem):
         parent_path = get_directory(file_path)
         filename = get_filename(file_path)
 
-        # Navigate to parent directory, creating it if needed; get both URLs in one pass
-        current_listing_url, parent_wb_url = self._navigate_to_dir(
-            project_id, provider, parent_path, create_missing=True
-        )
-
-        # Search the parent listing for the file.  The listing URL may 404
-        # if the parent dir was just created via WB and the OSF metadata API
-        # hasn't caught up yet — treat that as "file doesn't exist yet".
-        next_url: Optional[str] = current_listing_url
-        while next_url and isinstance(next_url, str):
-            try:
-                response = self.client.get(next_url)
-            except OSFNotFoundError:
-                break  # Newly-created dir not in OSF API yet → file absent.
-            data = response.json()
-            for item in data.get("data") or []:
-                if item.get("attributes", {}).get("name", "") == filename:
-                    upload_url = item.get("links", {}).get("upload")
-                    if upload_url:
-                        return str(upload_url)
-            raw_next = (data.get("links") or {}).get("next")
-            next_url = raw_next if isinstance(raw_next, str) else None
+        # Existing files are updated through their own upload link, found
+        # in the (cached) parent listing.  The listing URL may 404 if the
+        # parent dir was just created via WB and the OSF metadata API hasn't
+        # caught up yet — treat that as "file doesn't exist yet".
+        try:
+            listing = self._list_dir(project_id, provider, parent_path)
+        except OSFNotFoundError:
+            # Navigate to parent directory, creating it if needed
+            _, parent_wb_url = self._navigate_to_dir(
+                project_id, provider, parent_path, create_missing=True
+            )
+        else:
+            upload_url = listing.links.get(filename, {}).get("upload")
+            if upload_url:
+                return str(upload_url)
+            parent_wb_url = listing.waterbutler_url
 
         # File doesn't exist — return new-file creation URL using parent WaterButler URL
         return f"{parent_wb_url.rstrip('/')}/?kind=file&name={filename}"
 
-    def _verify_upload_checksum(self, lpath: str, rpath: str) -> None:
-        """Verify uploaded file checksum matches local file."""
-        # Compute local checksum
-        with open(lpath, "rb") as f:
-            local_checksum = compute_upload_checksum(f)
+    def _verify_upload_checksum(
+        self, lpath: str, rpath: str, local_checksum: Optional[str] = None
+    ) -> None:
+        """Verify uploaded file checksum matches local file.
+
+        ``local_checksum`` skips re-reading ``lpath`` when the MD5 is
+        already known (put_file hashes the file while uploading it).
+        """
+        if local_checksum is None:
+            with open(lpath, "rb") as f:
+                local_checksum = compute_upload_checksum(f)
 
         # Get remote file info
         remote_info = self.info(rpath)
@@ -1577,36 +2333,178 @@ class OSFFileSystem(ObjectFileSystem):
 
     def put(  # type: ignore[override]
         self,
-        file_obj: BinaryIO,
-        rpath: str,
+        file_obj: Union[BinaryIO, str, List[str]],
+        rpath: Union[str, List[str]],
         callback: Optional[Callable[[int, int], None]] = None,
         **kwargs: Any,
     ) -> None:
         """
-        Upload a file-like object to OSF.
+        Upload a file-like object, or local files by path, to OSF.
+
+        Local paths (DVC passes lists of them with ``batch_size``) are
+        uploaded concurrently with put_many.
 
         Args:
-            file_obj: File-like object to upload
-            rpath: Remote OSF path
+            file_obj: File-like object, local path or list of local paths
+            rpath: Remote OSF path, or list of paths matching ``file_obj``
             callback: Optional progress callback (bytes_uploaded, total_bytes)
-            **kwargs: Additional arguments
-        """
+                for file objects; for paths, an fsspec-style callback
+                advanced once per file
+            **kwargs: Additional arguments (``batch_size`` limits concurrent
+                uploads)
+        """
+        if isinstance(file_obj, (str, list)):
+            lpaths = [file_obj] if isinstance(file_obj, str) else file_obj
+            rpaths = [rpath] if isinstance(rpath, str) else rpath
+            if len(lpaths) != len(rpaths):
+                raise ValueError("put() needs one remote path per local path")
+
+            progress = callback if hasattr(callback, "relative_update") else None
+            if progress is not None:
+                progress.set_size(len(lpaths))  # type: ignore[attr-defined]
+
+            def on_done(done: int, total: int) -> None:
+                if progress is not None:
+                    progress.relative_update(1)  # type: ignore[attr-defined]
+
+            self.put_many(
+                list(zip(lpaths, rpaths)),
+                max_workers=kwargs.pop("batch_size", None),
+                callback=on_done,
+            )
+            return
+
         project_id, provider, file_path = self._resolve_path(rpath)
 
         # Get upload URL
         upload_url = self._get_upload_url(project_id, provider, file_path)
 
-        # Try to get file size
+        # Seekable objects are streamed as they are; others are spooled first
+        # so their size is known, spilling to disk rather than held in memory
+        spool: Optional[BinaryIO] = None
         try:
-            file_size = get_file_size(file_obj)
-        except (AttributeError, OSError):
-            # File object doesn't support size - read into memory
-            data = file_obj.read()
-            file_size = len(data)
-            file_obj = io.BytesIO(data)
+            try:
+                file_size = get_file_size(file_obj)
+            except (AttributeError, OSError):
+                spool = tempfile.SpooledTemporaryFile(  # type: ignore[assignment]
+                    max_size=UPLOAD_SPOOL_SIZE, prefix="dvc_osf_put_"
+                )
+                shutil.copyfileobj(file_obj, spool, Config.CHUNK_SIZE)
+                file_size = spool.tell()
+                spool.seek(0)
+                file_obj = spool
+
+            # Upload, hashing the body as it is sent so the upload can be
+            # checked against the MD5 in WaterButler's response without
+            # another lookup
+            reader = _HashingReader(file_obj)
+            response = self.client.upload_file(
+                upload_url, reader, callback, file_size  # type: ignore[arg-type]
+            )
+        finally:
+            if spool is not None:
+                spool.close()
+        remote_md5 = self._response_md5(response)
+        local_md5 = reader.hexdigest(file_size)
+        if remote_md5 and local_md5 and remote_md5 != local_md5:
+            raise OSFIntegrityError(
+                f"Checksum mismatch after upload for {rpath}: "
+                f"expected {local_md5}, got {remote_md5}",
+                expected_checksum=local_md5,
+                actual_checksum=remote_md5,
+            )
+
+    def put_many(
+        self,
+        path_pairs: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        callback: Optional[Callable[[int, int], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Upload several local files concurrently.
+
+        Each file is an independent put_file, so running them side by side
+        overlaps their round trips over the client's connection pool.
+
+        Args:
+            path_pairs: List of (local path, remote path) tuples
+            max_workers: Maximum uploads in flight (defaults to, and is
+                capped at, the connection pool size)
+            callback: Optional progress callback (files_done, total_files)
+            **kwargs: Passed to put_file
+
+        Raises:
+            OSFException: The first upload error; uploads not yet started
+                are cancelled
+        """
+        self._transfer_many(
+            self.put_file, path_pairs, max_workers, callback, "dvc-osf-put", **kwargs
+        )
+
+    def get_many(
+        self,
+        path_pairs: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        callback: Optional[Callable[[int, int], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Download several files concurrently.
+
+        Each file is an independent get_file; socket reads and MD5 updates
+        both release the GIL, so downloads and their checksums run in
+        parallel across threads.
+
+        Args:
+            path_pairs: List of (remote path, local path) tuples
+            max_workers: Maximum downloads in flight (defaults to, and is
+                capped at, the connection pool size)
+            callback: Optional progress callback (files_done, total_files)
+            **kwargs: Passed to get_file
+
+        Raises:
+            OSFException: The first download error; downloads not yet
+                started are cancelled
+        """
+        self._transfer_many(
+            self.get_file, path_pairs, max_workers, callback, "dvc-osf-get", **kwargs
+        )
 
-        # Upload
-        self.client.upload_file(upload_url, file_obj, callback, file_size)
+    def _transfer_many(
+        self,
+        func: Callable[..., None],
+        path_pairs: List[Tuple[str, str]],
+        max_workers: Optional[int],
+        callback: Optional[Callable[[int, int], None]],
+        thread_name_prefix: str,
+        **kwargs: Any,
+    ) -> None:
+        """Run ``func(src, dst, **kwargs)`` for each pair on a thread pool."""
+        total = len(path_pairs)
+        if total < 2:
+            for src, dst in path_pairs:
+                func(src, dst, **kwargs)
+                if callback:
+                    callback(1, total)
+            return
+
+        workers = max(1, min(max_workers or self._pool_size, self._pool_size, total))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=thread_name_prefix
+        ) as executor:
+            futures = [
+                executor.submit(func, src, dst, **kwargs) for src, dst in path_pairs
+            ]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if callback:
+                        callback(done, total)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def cp(
         self,
@@ -1615,19 +2513,28 @@ class OSFFileSystem(ObjectFileSystem):
         recursive: bool = False,
         overwrite: bool = True,
         **kwargs: Any,
-    ) -> None:
+    ) -> Optional[str]:
         """
         Copy a file or directory within OSF storage.
 
-        Uses download-then-upload strategy for reliability. Verifies checksums
-        to ensure data integrity.
+        Files are copied server-side with WaterButler's copy action, so no
+        file contents pass through the client. If the source has no move
+        link or the provider rejects the copy, the file is downloaded and
+        re-uploaded instead. Verifies checksums to ensure data integrity.
 
         Args:
             path1: Source path
             path2: Destination path
             recursive: If True, copy directories recursively
             overwrite: If True, overwrite existing destination (default: True)
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (``skip_identical=True`` makes a
+                recursive copy skip files whose destination already has the
+                same checksum)
+
+        Returns:
+            For a single file, the checksum the copy was verified against;
+            None if it could not be verified (the source or destination
+            reported no checksum) or for directories
 
         Raises:
             OSFNotFoundError: If source doesn't exist
@@ -1656,11 +2563,24 @@ class OSFFileSystem(ObjectFileSystem):
                 operation="copy",
             )
 
-        # Get source info
-        try:
-            src_info = self.info(path1)
-        except OSFNotFoundError:
-            raise OSFNotFoundError(f"Source not found: {path1}")
+        # Copying a path onto itself leaves it unchanged
+        if src_path == dst_path:
+            if not self.exists(path1):
+                raise OSFNotFoundError(f"Source not found: {path1}")
+            return None
+
+        # Get source info. Recursive copies pass each child's metadata and
+        # links down from the parent's listing, along with a dict of
+        # destination folder URLs shared by siblings, so that the writes
+        # clearing the listing cache do not force a refetch per item.
+        src_info = kwargs.get("_src_info")
+        src_links = kwargs.get("_src_links")
+        folder_urls: Dict[str, str] = kwargs.get("_folder_urls", {})
+        if src_info is None:
+            try:
+                src_info = self.info(path1)
+            except OSFNotFoundError:
+                raise OSFNotFoundError(f"Source not found: {path1}")
 
         # Handle directory copy
         if src_info["type"] == "directory":
@@ -1670,69 +2590,237 @@ class OSFFileSystem(ObjectFileSystem):
                     operation="copy",
                 )
 
-            # List source directory contents
-            items: List[Dict[str, Any]] = self.ls(path1, detail=True)  # type: ignore[assignment] # noqa: E501
-            logger.debug(f"Recursively copying {len(items)} items from {path1}")
-
-            for item in items:
-                item_name = item["name"]
-                # Build destination path
-                rel_path = item_name[
-                    len(serialize_path(src_project, src_provider, src_path)) :
-                ]
-                if rel_path.startswith("/"):
-                    rel_path = rel_path[1:]
-                dest_item = serialize_path(dst_project, dst_provider, dst_path)
-                if rel_path:
-                    dest_item = f"{dest_item}/{rel_path}"
-
-                # Recursively copy
-                self.cp(item_name, dest_item, recursive=True, overwrite=overwrite)
+            # Walk the tree, listing each source directory once, then copy
+            # the files concurrently. OSF has no empty directories to create
+            # first, so the files can be copied in any order.
+            src_prefix_len = len(serialize_path(src_project, src_provider, src_path))
+            dst_prefix = serialize_path(dst_project, dst_provider, dst_path)
+            skip_identical = kwargs.get("skip_identical", False)
+
+            files: List[Tuple[str, str, Dict[str, Any], Dict[str, Any]]] = []
+            pending = [src_path]
+            while pending:
+                dir_path = pending.pop()
+                try:
+                    listing = self._list_dir(src_project, src_provider, dir_path)
+                except OSFNotFoundError:
+                    raise FileNotFoundError(f"Directory not found: {path1}")
+
+                # Checksums already at the destination, for skip_identical
+                dst_checksums: Dict[str, Optional[str]] = {}
+                if skip_identical:
+                    rel_dir = dir_path[len(src_path) :].strip("/")
+                    dst_dir = "/".join(p for p in (dst_path, rel_dir) if p)
+                    try:
+                        dst_listing = self._list_dir(dst_project, dst_provider, dst_dir)
+                    except OSFNotFoundError:
+                        pass  # Nothing copied here yet
+                    else:
+                        dst_checksums = {
+                            name: item.get("checksum")
+                            for name, item in dst_listing.entries.items()
+                            if item["type"] == "file"
+                        }
+
+                for name, item in listing.entries.items():
+                    if item["type"] == "directory":
+                        pending.append(f"{dir_path}/{name}" if dir_path else name)
+                        continue
+                    checksum = item.get("checksum")
+                    if checksum and dst_checksums.get(name) == checksum:
+                        continue
+                    item_name = item["name"]
+                    # Build destination path
+                    rel_path = item_name[src_prefix_len:].lstrip("/")
+                    dest_item = f"{dst_prefix}/{rel_path}" if rel_path else dst_prefix
+                    files.append(
+                        (item_name, dest_item, item, listing.links.get(name, {}))
+                    )
+            logger.debug(f"Recursively copying {len(files)} files from {path1}")
+
+            # Look up each destination folder once, before the workers need it
+            for _, dest_item, _, links in files:
+                if links.get("move"):
+                    dest_dir = get_directory(self._resolve_path(dest_item)[2])
+                    if dest_dir not in folder_urls:
+                        folder_urls[dest_dir] = self._folder_url(
+                            dst_project, dst_provider, dest_dir
+                        )
+
+            def _copy_one(
+                entry: Tuple[str, str, Dict[str, Any], Dict[str, Any]],
+            ) -> None:
+                item_name, dest_item, item, links = entry
+                self.cp(
+                    item_name,
+                    dest_item,
+                    overwrite=overwrite,
+                    _src_info=item,
+                    _src_links=links,
+                    _folder_urls=folder_urls,
+                )
+
+            self._map_paths(_copy_one, files, thread_name_prefix="dvc-osf-copy")
 
             logger.info(f"Completed recursive copy of {path1} to {path2}")
-            return
+            return None
 
         # Single file copy
         # Check destination
         if not overwrite and self.exists(path2):
             raise OSFConflictError(f"Destination exists: {path2}")
 
-        # Create temp file for download
-        temp_fd, temp_path = tempfile.mkstemp(prefix="dvc_osf_copy_")
         try:
-            # Close the file descriptor as we'll open it properly
-            os.close(temp_fd)
-
-            # Download source to temp file
-            logger.debug(f"Downloading {path1} to temp file")
-            self.get_file(path1, temp_path)
-
-            # Upload temp file to destination
-            logger.debug(f"Uploading temp file to {path2}")
-            self.put_file(temp_path, path2)
-
-            # Verify checksums match
-            src_checksum = src_info.get("checksum")
-            if src_checksum:
-                dst_info = self.info(path2)
-                dst_checksum = dst_info.get("checksum")
-                if dst_checksum and src_checksum != dst_checksum:
-                    raise OSFIntegrityError(
-                        f"Checksum mismatch after copy: {path1} -> {path2}",
-                        expected_checksum=src_checksum,
-                        actual_checksum=dst_checksum,
-                    )
+            response = self._server_side_copy(
+                src_project,
+                src_provider,
+                src_path,
+                dst_path,
+                overwrite,
+                links=src_links,
+                folder_urls=folder_urls,
+            )
+        except OSFVersionConflictError:
+            raise OSFConflictError(f"Destination exists: {path2}") from None
+        except OSFAPIError as e:
+            logger.debug(f"Server-side copy of {path1} failed, re-uploading: {e}")
+            response = None
+
+        if response is not None:
+            dst_checksum = self._response_md5(response)
+        else:
+            dst_checksum = self._copy_via_download(path1, path2)
+
+        # Verify checksums match
+        src_checksum = src_info.get("checksum")
+        if src_checksum:
+            if not dst_checksum:
+                dst_checksum = self.info(path2).get("checksum")
+            if dst_checksum and src_checksum != dst_checksum:
+                raise OSFIntegrityError(
+                    f"Checksum mismatch after copy: {path1} -> {path2}",
+                    expected_checksum=src_checksum,
+                    actual_checksum=dst_checksum,
+                )
+
+        logger.info(f"Successfully copied {path1} to {path2}")
+        return src_checksum if src_checksum and dst_checksum else None
+
+    def _server_side_copy(
+        self,
+        project_id: str,
+        provider: str,
+        src_path: str,
+        dst_path: str,
+        overwrite: bool,
+        links: Optional[Dict[str, Any]] = None,
+        folder_urls: Optional[Dict[str, str]] = None,
+    ) -> Optional["requests.Response"]:
+        """
+        Copy a file within a provider using WaterButler's copy action.
+
+        Args:
+            project_id: OSF project ID
+            provider: Storage provider
+            src_path: Source file path within the provider
+            dst_path: Destination file path within the provider
+            overwrite: Replace an existing destination instead of failing
+            links: The source's API links, if already known
+            folder_urls: WaterButler URLs of destination folders by path,
+                consulted and filled in to share lookups between calls
+
+        Returns:
+            WaterButler's response describing the new file, or None if the
+            source has no move link
+
+        Raises:
+            OSFVersionConflictError: If the destination exists and
+                ``overwrite`` is False
+            OSFAPIError: If WaterButler rejects the copy
+        """
+        if links is None:
+            listing = self._list_dir(project_id, provider, get_directory(src_path))
+            links = listing.links.get(get_filename(src_path), {})
+        move_url = links.get("move")
+        if not move_url:
+            return None
+
+        # WaterButler addresses the destination folder by its own path (an
+        # ID for osfstorage), taken from the folder's WaterButler URL.
+        if folder_urls is None:
+            folder_urls = {}
+        dst_parent = get_directory(dst_path)
+        folder_url = folder_urls.get(dst_parent)
+        if folder_url is None:
+            folder_url = self._folder_url(project_id, provider, dst_parent)
+            folder_urls[dst_parent] = folder_url
+        match = re.search(r"/providers/[^/]+/(.*)$", folder_url.split("?")[0])
+        folder = match.group(1).strip("/") if match else ""
+
+        return self.client.post(
+            str(move_url),
+            json={
+                "action": "copy",
+                "path": f"/{folder}/" if folder else "/",
+                "provider": provider,
+                "resource": project_id,
+                "rename": get_filename(dst_path),
+                "conflict": "replace" if overwrite else "warn",
+            },
+        )
+
+    def _folder_url(self, project_id: str, provider: str, dir_path: str) -> str:
+        """Return a folder's WaterButler URL, creating the folder if missing."""
+        try:
+            return self._list_dir(project_id, provider, dir_path).waterbutler_url
+        except OSFNotFoundError:
+            _, folder_url = self._navigate_to_dir(
+                project_id, provider, dir_path, create_missing=True
+            )
+            return str(folder_url)
 
-            logger.info(f"Successfully copied {path1} to {path2}")
+    def _copy_via_download(self, path1: str, path2: str) -> Optional[str]:
+        """
+        Copy a file by downloading it and uploading it again.
+
+        The file is buffered in memory, spilling to a temporary file only
+        past COPY_SPOOL_SIZE. In-memory buffers are returned to a small pool
+        so that a batch of small copies reuses them.
+
+        Returns:
+            The destination's MD5 as reported by the upload or, if the
+            response carries none, as hashed while the bytes were sent
+        """
+        try:
+            buf = _copy_buffer_pool.get_nowait()
+        except queue.Empty:
+            buf = tempfile.SpooledTemporaryFile(  # type: ignore[assignment]
+                max_size=COPY_SPOOL_SIZE, prefix="dvc_osf_copy_"
+            )
+        try:
+            logger.debug(f"Downloading {path1} for re-upload")
+            self._download_to_fileobj(path1, buf)
+            size = buf.tell()
 
+            logger.debug(f"Uploading {size} bytes to {path2}")
+            remote_md5, local_md5 = self._upload_fileobj(buf, path2, size)
         finally:
-            # Clean up temp file
-            try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                    logger.debug(f"Cleaned up temp file: {temp_path}")
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp file {temp_path}: {e}")
+            self._release_copy_buffer(buf)
+        return remote_md5 or local_md5
+
+    @staticmethod
+    def _release_copy_buffer(buf: BinaryIO) -> None:
+        """Return an in-memory copy buffer to the pool, or close it."""
+        try:
+            # Anything larger has rolled over to a temporary file
+            if buf.seek(0, io.SEEK_END) <= COPY_SPOOL_SIZE:
+                buf.seek(0)
+                buf.truncate(0)
+                _copy_buffer_pool.put_nowait(buf)
+                return
+        except (OSError, ValueError, queue.Full):
+            pass
+        buf.close()
 
     def mv(  # type: ignore[override]
         self,
@@ -1752,11 +2840,13 @@ class OSFFileSystem(ObjectFileSystem):
             path1: Source path
             path2: Destination path
             recursive: If True, move directories recursively
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (``overwrite=True`` replaces an
+                existing destination instead of failing)
 
         Raises:
             OSFNotFoundError: If source doesn't exist
-            OSFConflictError: If destination already exists
+            OSFConflictError: If destination already exists and overwrite
+                is not set
             OSFOperationNotSupportedError: For cross-project or cross-provider moves
 
         Note:
@@ -1785,19 +2875,44 @@ class OSFFileSystem(ObjectFileSystem):
                 operation="move",
             )
 
-        # Check if destination exists
-        if self.exists(path2):
+        # Moving a path onto itself leaves it unchanged
+        if src_path == dst_path:
+            if not self.exists(path1):
+                raise OSFNotFoundError(f"Source not found: {path1}")
+            return
+
+        # Look the source up once and hand it to cp, which would otherwise
+        # fetch it again
+        try:
+            src_info = self.info(path1)
+        except OSFNotFoundError:
+            raise OSFNotFoundError(f"Source not found: {path1}")
+        is_dir = src_info["type"] == "directory"
+
+        # A single-file cp with overwrite=False checks the destination
+        # itself; a directory copy only checks each file inside it
+        overwrite = kwargs.get("overwrite", False)
+        if is_dir and not overwrite and self.exists(path2):
             raise OSFConflictError(f"Destination exists: {path2}")
 
         # Copy source to destination
         try:
-            self.cp(path1, path2, recursive=recursive, overwrite=False)
+            verified = self.cp(
+                path1,
+                path2,
+                recursive=recursive,
+                overwrite=overwrite,
+                _src_info=src_info,
+            )
         except Exception as e:
             logger.error(f"Copy failed during move operation: {e}")
             raise
 
-        # Verify copy succeeded
-        if not self.exists(path2):
+        # Only delete the source once the destination is known to exist.
+        # A file copy verified against the source's checksum has shown
+        # that; anything else (directories, files without checksums) is
+        # checked explicitly.
+        if not verified and not self.exists(path2):
             raise OSFIntegrityError(
                 f"Move failed: destination not found after copy: {path2}"
             )
@@ -1815,22 +2930,199 @@ class OSFFileSystem(ObjectFileSystem):
                 f"Error: {e}"
             )
 
+    def _iter_batch(
+        self,
+        operation: str,
+        func: Callable[..., None],
+        items: List[Tuple[str, ...]],
+        max_workers: Optional[int],
+        redo: Optional[Callable[..., None]] = None,
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        """
+        Run ``func(*item)`` for each item concurrently, yielding as each ends.
+
+        Each operation is a few independent round trips, so they are spread
+        over the client's connection pool. The client already retries each
+        request, so only an operation whose result failed verification
+        (OSFIntegrityError) is redone, with backoff, up to BATCH_RETRIES
+        times, and only if ``redo`` is given; retrying anything else would
+        multiply the client's retries.
+        Only a couple of operations per worker are submitted ahead, so the
+        work queued at any time does not grow with the batch.
+
+        Args:
+            operation: Operation name for logging
+            func: Per-item operation
+            items: Argument tuples; the first element is the source path
+            max_workers: Maximum operations in flight (defaults to the pool size)
+            redo: Operation for redoing an item that failed verification. The
+                failed attempt has already written its result, so it must
+                replace it (e.g. cp with ``overwrite=True``)
+
+        Yields:
+            ``(index, error)`` in completion order, where ``error`` is the
+            failure message or None on success
+        """
+        total = len(items)
+        workers = max(1, min(max_workers or self._pool_size, self._pool_size, total))
+        logger.info(f"Starting batch {operation} of {total} files")
+
+        queued = iter(enumerate(items))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"dvc-osf-{operation}"
+        ) as executor:
+            pending: Dict[Future, int] = {}
+
+            def submit(count: int) -> None:
+                for i, item in itertools.islice(queued, count):
+                    future = executor.submit(
+                        _fanout_worker(self._run_batch_item), func, redo, item
+                    )
+                    pending[future] = i
+
+            submit(2 * workers)
+            done = 0
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = pending.pop(future)
+                    submit(1)
+                    done += 1
+                    desc = " -> ".join(items[i])
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.warning(
+                            f"Batch {operation} [{done}/{total}]: {desc} FAILED: {e}"
+                        )
+                        yield i, str(e)
+                    else:
+                        logger.debug(
+                            f"Batch {operation} [{done}/{total}]: {desc} SUCCESS"
+                        )
+                        yield i, None
+
+    def _run_batch_item(
+        self,
+        func: Callable[..., None],
+        redo: Optional[Callable[..., None]],
+        item: Tuple[str, ...],
+    ) -> None:
+        """
+        Run one batch item, redoing it with ``redo`` if verification fails.
+
+        Backoff waits end as soon as the client is closed.
+        """
+        if redo is None:
+            func(*item)
+            return
+        attempts = itertools.chain([func], itertools.repeat(redo))
+        retry_with_backoff(
+            lambda: next(attempts)(*item),
+            max_retries=BATCH_RETRIES,
+            retry_on=(OSFIntegrityError,),
+            cancel=self.client._cancel,
+        )
+
+    def _run_batch(
+        self,
+        operation: str,
+        func: Callable[..., None],
+        items: List[Tuple[str, ...]],
+        callback: Optional[Callable[[int, int, str, str], None]],
+        max_workers: Optional[int],
+        redo: Optional[Callable[..., None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a batch with _iter_batch, collecting failures into a summary.
+
+        The callback is invoked on the calling thread as operations finish.
+
+        Args:
+            operation: Operation name for logging and the callback
+            func: Per-item operation
+            items: Argument tuples; the first element is the source path
+            callback: Optional progress callback (index, total, path, operation)
+            max_workers: Maximum operations in flight (defaults to the pool size)
+            redo: Operation for redoing an item that failed verification
+                (see _iter_batch)
+
+        Returns:
+            Summary dictionary (see batch_copy); errors are in input order
+        """
+        total = len(items)
+        failures: Dict[int, str] = {}
+        results = self._iter_batch(operation, func, items, max_workers, redo)
+        for done, (i, error) in enumerate(results, 1):
+            if error is not None:
+                failures[i] = error
+
+            # Invoke callback if provided
+            if callback:
+                try:
+                    callback(done, total, items[i][0], operation)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+
+        failed = len(failures)
+        logger.info(
+            f"Batch {operation} completed: {total - failed} succeeded, "
+            f"{failed} failed out of {total}"
+        )
+        return {
+            "total": total,
+            "success": total - failed,
+            "failed": failed,
+            "errors": [(*items[i], failures[i]) for i in sorted(failures)],
+        }
+
+    @staticmethod
+    def _batch_results(
+        items: List[Tuple[str, ...]], results: Iterator[Tuple[int, Optional[str]]]
+    ) -> Iterator[BatchResult]:
+        """Turn _iter_batch's ``(index, error)`` pairs into BatchResults."""
+        for i, error in results:
+            item = items[i]
+            yield BatchResult(item[0], item[1] if len(item) > 1 else None, error)
+
+    @staticmethod
+    def _check_unique_destinations(path_pairs: List[tuple[str, str]]) -> None:
+        """
+        Reject a batch that writes the same destination more than once.
+
+        Args:
+            path_pairs: List of (source, destination) path tuples
+
+        Raises:
+            ValueError: Naming the first repeated destination
+        """
+        seen: set[str] = set()
+        for _, dst in path_pairs:
+            if dst in seen:
+                raise ValueError(f"Duplicate destinations not allowed: {dst}")
+            seen.add(dst)
+
     def batch_copy(
         self,
         path_pairs: List[tuple[str, str]],
         overwrite: bool = True,
         callback: Optional[Callable[[int, int, str, str], None]] = None,
+        max_workers: Optional[int] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
         Copy multiple files in batch.
 
-        Collects errors without failing early, allowing partial success.
+        Copies run concurrently. Collects errors without failing early,
+        allowing partial success.
 
         Args:
             path_pairs: List of (source, destination) path tuples
             overwrite: If True, overwrite existing destinations
-            callback: Optional progress callback (index, total, path, operation)
+            callback: Optional progress callback (index, total, path, operation),
+                called as each copy finishes
+            max_workers: Maximum copies in flight (defaults to the connection
+                pool size)
             **kwargs: Additional arguments
 
         Returns:
@@ -1854,64 +3146,69 @@ class OSFFileSystem(ObjectFileSystem):
         if not path_pairs:
             raise ValueError("path_pairs cannot be empty")
 
-        # Check for duplicate destinations
-        destinations = [dst for _, dst in path_pairs]
-        if len(destinations) != len(set(destinations)):
-            raise ValueError("Duplicate destinations not allowed")
+        self._check_unique_destinations(path_pairs)
 
-        logger.info(f"Starting batch copy of {len(path_pairs)} files")
+        copy = functools.partial(self.cp, overwrite=overwrite)
+        # A copy that failed verification is redone over its own bad result
+        recopy = functools.partial(self.cp, overwrite=True)
+        return self._run_batch(
+            "copy", copy, list(path_pairs), callback, max_workers, recopy
+        )
 
-        total = len(path_pairs)
-        success = 0
-        failed = 0
-        errors = []
+    def batch_copy_iter(
+        self,
+        path_pairs: List[tuple[str, str]],
+        overwrite: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Copy multiple files concurrently, yielding each result as it finishes.
 
-        for i, (src, dst) in enumerate(path_pairs):
-            try:
-                self.cp(src, dst, overwrite=overwrite)
-                success += 1
-                logger.debug(f"Batch copy [{i + 1}/{total}]: {src} -> {dst} SUCCESS")
-            except Exception as e:
-                failed += 1
-                errors.append((src, dst, str(e)))
-                logger.warning(
-                    f"Batch copy [{i + 1}/{total}]: {src} -> {dst} FAILED: {e}"
-                )
+        Like batch_copy, but nothing is accumulated: callers copying very
+        many files can record each outcome as it arrives.
 
-            # Invoke callback if provided
-            if callback:
-                try:
-                    callback(i + 1, total, src, "copy")
-                except Exception as e:
-                    logger.warning(f"Progress callback failed: {e}")
+        Args:
+            path_pairs: List of (source, destination) path tuples
+            overwrite: If True, overwrite existing destinations
+            max_workers: Maximum copies in flight (defaults to the connection
+                pool size)
 
-        result = {
-            "total": total,
-            "success": success,
-            "failed": failed,
-            "errors": errors,
-        }
+        Returns:
+            Iterator of BatchResult in completion order
 
-        logger.info(
-            f"Batch copy completed: {success} succeeded, {failed} failed out of {total}"
-        )
+        Raises:
+            ValueError: If path_pairs is empty or contains duplicate destinations
+        """
+        if not path_pairs:
+            raise ValueError("path_pairs cannot be empty")
+        self._check_unique_destinations(path_pairs)
 
-        return result
+        items = list(path_pairs)
+        copy = functools.partial(self.cp, overwrite=overwrite)
+        recopy = functools.partial(self.cp, overwrite=True)
+        return self._batch_results(
+            items, self._iter_batch("copy", copy, items, max_workers, recopy)
+        )
 
     def batch_move(
         self,
         path_pairs: List[tuple[str, str]],
         callback: Optional[Callable[[int, int, str, str], None]] = None,
+        max_workers: Optional[int] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
         Move multiple files in batch.
 
-        Collects errors without failing early, allowing partial success.
+        Moves run concurrently. Collects errors without failing early,
+        allowing partial success.
 
         Args:
             path_pairs: List of (source, destination) path tuples
-            callback: Optional progress callback (index, total, path, operation)
+            callback: Optional progress callback (index, total, path, operation),
+                called as each move finishes
+            max_workers: Maximum moves in flight (defaults to the connection
+                pool size)
             **kwargs: Additional arguments
 
         Returns:
@@ -1934,64 +3231,65 @@ class OSFFileSystem(ObjectFileSystem):
         if not path_pairs:
             raise ValueError("path_pairs cannot be empty")
 
-        # Check for duplicate destinations
-        destinations = [dst for _, dst in path_pairs]
-        if len(destinations) != len(set(destinations)):
-            raise ValueError("Duplicate destinations not allowed")
+        self._check_unique_destinations(path_pairs)
 
-        logger.info(f"Starting batch move of {len(path_pairs)} files")
+        # A move that failed verification kept its source; redo it over the
+        # bad copy it left behind
+        move_over = functools.partial(self.mv, overwrite=True)
+        return self._run_batch(
+            "move", self.mv, list(path_pairs), callback, max_workers, move_over
+        )
 
-        total = len(path_pairs)
-        success = 0
-        failed = 0
-        errors = []
+    def batch_move_iter(
+        self,
+        path_pairs: List[tuple[str, str]],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Move multiple files concurrently, yielding each result as it finishes.
 
-        for i, (src, dst) in enumerate(path_pairs):
-            try:
-                self.mv(src, dst)
-                success += 1
-                logger.debug(f"Batch move [{i + 1}/{total}]: {src} -> {dst} SUCCESS")
-            except Exception as e:
-                failed += 1
-                errors.append((src, dst, str(e)))
-                logger.warning(
-                    f"Batch move [{i + 1}/{total}]: {src} -> {dst} FAILED: {e}"
-                )
+        Like batch_move, but nothing is accumulated.
 
-            # Invoke callback if provided
-            if callback:
-                try:
-                    callback(i + 1, total, src, "move")
-                except Exception as e:
-                    logger.warning(f"Progress callback failed: {e}")
+        Args:
+            path_pairs: List of (source, destination) path tuples
+            max_workers: Maximum moves in flight (defaults to the connection
+                pool size)
 
-        result = {
-            "total": total,
-            "success": success,
-            "failed": failed,
-            "errors": errors,
-        }
+        Returns:
+            Iterator of BatchResult in completion order
 
-        logger.info(
-            f"Batch move completed: {success} succeeded, {failed} failed out of {total}"
-        )
+        Raises:
+            ValueError: If path_pairs is empty or contains duplicate destinations
+        """
+        if not path_pairs:
+            raise ValueError("path_pairs cannot be empty")
+        self._check_unique_destinations(path_pairs)
 
-        return result
+        items = list(path_pairs)
+        move_over = functools.partial(self.mv, overwrite=True)
+        return self._batch_results(
+            items, self._iter_batch("move", self.mv, items, max_workers, move_over)
+        )
 
     def batch_delete(
         self,
         paths: List[str],
         callback: Optional[Callable[[int, int, str, str], None]] = None,
+        max_workers: Optional[int] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
         Delete multiple files in batch.
 
-        Collects errors without failing early, allowing partial success.
+        Deletes run concurrently. Collects errors without failing early,
+        allowing partial success.
 
         Args:
             paths: List of file paths to delete
-            callback: Optional progress callback (index, total, path, operation)
+            callback: Optional progress callback (index, total, path, operation),
+                called as each delete finishes
+            max_workers: Maximum deletes in flight (defaults to the connection
+                pool size)
             **kwargs: Additional arguments
 
         Returns:
@@ -2014,42 +3312,39 @@ class OSFFileSystem(ObjectFileSystem):
         if not paths:
             raise ValueError("paths cannot be empty")
 
-        logger.info(f"Starting batch delete of {len(paths)} files")
+        return self._run_batch(
+            "delete", self.rm_file, [(path,) for path in paths], callback, max_workers
+        )
 
-        total = len(paths)
-        success = 0
-        failed = 0
-        errors = []
+    def batch_delete_iter(
+        self,
+        paths: List[str],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Delete multiple files concurrently, yielding each result as it finishes.
 
-        for i, path in enumerate(paths):
-            try:
-                self.rm_file(path)
-                success += 1
-                logger.debug(f"Batch delete [{i + 1}/{total}]: {path} SUCCESS")
-            except Exception as e:
-                failed += 1
-                errors.append((path, str(e)))
-                logger.warning(f"Batch delete [{i + 1}/{total}]: {path} FAILED: {e}")
+        Like batch_delete, but nothing is accumulated. Results have no
+        destination.
 
-            # Invoke callback if provided
-            if callback:
-                try:
-                    callback(i + 1, total, path, "delete")
-                except Exception as e:
-                    logger.warning(f"Progress callback failed: {e}")
+        Args:
+            paths: List of paths to delete
+            max_workers: Maximum deletes in flight (defaults to the connection
+                pool size)
 
-        result = {
-            "total": total,
-            "success": success,
-            "failed": failed,
-            "errors": errors,
-        }
+        Returns:
+            Iterator of BatchResult in completion order
 
-        logger.info(
-            f"Batch delete completed: {success} succeeded, {failed} failed out of {total}"  # noqa: E501
-        )
+        Raises:
+            ValueError: If paths is empty
+        """
+        if not paths:
+            raise ValueError("paths cannot be empty")
 
-        return result
+        items = [(path,) for path in paths]
+        return self._batch_results(
+            items, self._iter_batch("delete", self.rm_file, items, max_workers)
+        )
 
     def mkdir(self, path: str, create_parents: bool = True, **kwargs: Any) -> None:
         """
@@ -2083,8 +3378,7 @@ class OSFFileSystem(ObjectFileSystem):
         """
         # dvc gc passes a list of paths when batch-deleting; handle both cases.
         if isinstance(path, list):
-            for p in path:
-                self.rm(p, recursive=recursive, **kwargs)
+            self._rm_many(path, recursive)
             return
 
         # Resolve path components.
@@ -2095,50 +3389,71 @@ class OSFFileSystem(ObjectFileSystem):
         parent_path = get_directory(file_path)
         filename = get_filename(file_path)
 
-        # Navigate to parent directory using internal IDs.
-        # Do NOT call info() first: info() uses the same _navigate_to_dir
-        # path and will silently raise OSFNotFoundError if navigation is
-        # imperfect, causing rm() to return without deleting anything.
-        # Instead, navigate directly to the parent and search for the item.
+        # Look the item up by name in the parent listing, which is found by
+        # navigating internal IDs.  A missing parent or item is treated as
+        # already deleted rather than an error.
         try:
-            parent_listing_url, _ = self._navigate_to_dir(
-                project_id, provider, parent_path, create_missing=False
-            )
+            listing = self._list_dir(project_id, provider, parent_path)
         except OSFNotFoundError:
             return  # Parent doesn't exist — nothing to delete.
 
-        next_url: Optional[str] = parent_listing_url
-        while next_url and isinstance(next_url, str):
-            response = self.client.get(next_url)
-            data = response.json()
+        delete_url = self._delete_url(listing, filename, recursive)
+        if delete_url:
+            self.client.delete(delete_url)
 
-            for item in data.get("data", []):
-                item_name = item.get("attributes", {}).get("name", "")
-                if item_name != filename:
-                    continue
+    def _rm_many(self, paths: List[str], recursive: bool) -> None:
+        """
+        Delete several paths, listing each parent directory once.
 
-                kind = item.get("attributes", {}).get("kind", "")
-                links = item.get("links", {})
-
-                if kind == "folder":
-                    if recursive:
-                        # Delete the folder via WaterButler DELETE (not a
-                        # no-op — WaterButler supports folder deletion).
-                        delete_url = links.get("delete")
-                        if delete_url:
-                            self.client.delete(delete_url)
-                    return  # Done (recursive=False means leave folder alone).
-
-                # It's a file — delete it.
-                delete_url = links.get("delete") or links.get("upload")
-                if delete_url:
-                    self.client.delete(delete_url)
-                return
+        Every delete is a write that invalidates cached listings, so all the
+        delete links are collected first and the deletes are then issued
+        concurrently.
+
+        Raises:
+            OSFException: The first delete that failed, after all have run
+        """
+        listings: Dict[Tuple[str, str, str], Optional[_DirListing]] = {}
+        urls: Dict[str, None] = {}
+        for p in paths:
+            project_id, provider, file_path = self._resolve_path(p)
+            if not file_path:
+                continue  # Root — nothing to delete.
 
-            next_url = data.get("links", {}).get("next")
+            key = (project_id, provider, get_directory(file_path))
+            if key not in listings:
+                try:
+                    listings[key] = self._list_dir(*key)
+                except OSFNotFoundError:
+                    listings[key] = None  # Parent doesn't exist.
+            listing = listings[key]
+            if listing is None:
+                continue
+
+            delete_url = self._delete_url(listing, get_filename(file_path), recursive)
+            if delete_url:
+                urls[str(delete_url)] = None
+
+        for _, error in self.client.delete_many(list(urls)):
+            if error is not None:
+                raise error
+
+    @staticmethod
+    def _delete_url(listing: _DirListing, name: str, recursive: bool) -> Optional[str]:
+        """
+        Return the WaterButler URL that deletes ``name``, if it should be deleted.
+
+        Missing entries are treated as already deleted (idempotent), and
+        directories are left alone unless ``recursive`` is set.
+        """
+        metadata = listing.entries.get(name)
+        if metadata is None:
+            return None
+        links = listing.links.get(name, {})
 
-        # Item not found — treat as already deleted (idempotent).
-        return
+        if metadata["type"] == "directory":
+            # WaterButler deletes a folder and its contents in one request
+            return links.get("delete") if recursive else None
+        return links.get("delete") or links.get("upload")
 
     def rm_file(self, path: str, **kwargs: Any) -> None:
         """
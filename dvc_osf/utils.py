@@ -1,15 +1,34 @@
 """Utility functions for DVC-OSF."""
 
+import functools
 import hashlib
+import io
+import json
 import logging
+import mmap
 import os
-from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Tuple
 from urllib.parse import quote, urlparse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Read size for local checksums; large reads keep the per-chunk Python
+# overhead negligible next to the MD5 itself.
+HASH_BUFFER_SIZE = 1024 * 1024
+
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Entries kept by the memoized path helpers. DVC touches the same handful
+# of directories (and thousands of files in them) over and over.
+PATH_CACHE_SIZE = 8192
+
 
 def parse_osf_url(url: str) -> Tuple[str, str, str]:
     """
@@ -84,6 +103,7 @@ def _validate_project_id(project_id: str) -> bool:
     return project_id.replace("_", "").replace("-", "").isalnum()
 
 
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
 def normalize_path(path: str) -> str:
     """
     Normalize an OSF path.
@@ -150,7 +170,12 @@ def path_to_api_url(
     """
     if base_url is None:
         base_url = Config.API_BASE_URL
+    return _api_url(base_url, project_id, provider, path)
+
 
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def _api_url(base_url: str, project_id: str, provider: str, path: str) -> str:
+    """Build the files API URL for path_to_api_url (memoized)."""
     # Normalize the base URL (remove trailing slash)
     base_url = base_url.rstrip("/")
 
@@ -189,6 +214,7 @@ def serialize_path(project_id: str, provider: str, path: str) -> str:
         return f"osf://{project_id}/{provider}"
 
 
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
 def get_filename(path: str) -> str:
     """
     Extract filename from path.
@@ -209,6 +235,7 @@ def get_filename(path: str) -> str:
     return normalized.split("/")[-1]
 
 
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
 def get_directory(path: str) -> str:
     """
     Extract directory path from file path.
@@ -259,33 +286,111 @@ def validate_osf_url(url: str) -> None:
         raise ValueError(f"Invalid OSF URL '{url}': {e}") from e
 
 
+def load_json(content: bytes) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses ``orjson`` when installed, falling back to the standard library.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded JSON document
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dump_json(obj: Any) -> bytes:
+    """
+    Serialize a request payload to JSON bytes.
+
+    Uses ``orjson`` when installed, falling back to the standard library.
+
+    Args:
+        obj: JSON-serializable payload
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def compute_upload_checksum(file_obj: BinaryIO) -> str:
     """
     Compute MD5 checksum of a file during upload.
 
+    Hashes from the current position to the end of the file, then restores
+    the position. Uses ``hashlib.file_digest`` (Python 3.11+) when possible,
+    so the read/update loop runs in C. On older Pythons a real file is
+    memory-mapped and hashed in one call instead; anything else is read
+    into a reused ``HASH_BUFFER_SIZE`` buffer.
+
     Args:
         file_obj: File-like object to compute checksum for
 
     Returns:
         MD5 checksum as hex string
     """
-    md5 = hashlib.md5()
-    chunk_size = Config.CHUNK_SIZE
-
     # Save current position
     start_pos = file_obj.tell()
 
-    # Read file in chunks
-    while True:
-        chunk = file_obj.read(chunk_size)
-        if not chunk:
-            break
-        md5.update(chunk)
+    try:
+        # file_digest hashes a BytesIO's whole buffer regardless of position
+        if (
+            _file_digest is not None
+            and start_pos == 0
+            and hasattr(file_obj, "readinto")
+        ):
+            return _file_digest(file_obj, "md5").hexdigest()  # type: ignore[arg-type]
+
+        if start_pos == 0:
+            digest = _mmap_md5(file_obj)
+            if digest is not None:
+                return digest
+
+        md5 = hashlib.md5()
+        if hasattr(file_obj, "readinto"):
+            buffer = bytearray(HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                n = file_obj.readinto(buffer)  # type: ignore[attr-defined]
+                if not n:
+                    break
+                md5.update(view[:n])
+        else:
+            while True:
+                chunk = file_obj.read(HASH_BUFFER_SIZE)
+                if not chunk:
+                    break
+                md5.update(chunk)
+        return md5.hexdigest()
+    finally:
+        # Reset file position
+        file_obj.seek(start_pos)
 
-    # Reset file position
-    file_obj.seek(start_pos)
 
-    return md5.hexdigest()
+def _mmap_md5(file_obj: BinaryIO) -> Optional[str]:
+    """
+    MD5 a whole file through a read-only memory map.
+
+    Returns:
+        Hex digest, or None if the object has no mappable descriptor (or
+        is empty, which mmap rejects)
+    """
+    try:
+        fileno = file_obj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    try:
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.md5(mapped).hexdigest()
+    except (OSError, ValueError):
+        return None
 
 
 def chunk_file(file_obj: BinaryIO, chunk_size: int) -> Iterator[Tuple[bytes, int, int]]:
@@ -1,15 +1,20 @@
 """Tests for OSF API client."""
 
+import json
+import threading
+import time
+from concurrent.futures import Future
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-from dvc_osf.api import OSFAPIClient
+from dvc_osf.api import OSFAPIClient, _resolve_url
 from dvc_osf.config import Config
 from dvc_osf.exceptions import (
     OSFAPIError,
     OSFAuthenticationError,
+    OSFConnectionError,
     OSFNotFoundError,
     OSFPermissionError,
     OSFRateLimitError,
@@ -32,6 +37,44 @@ class TestOSFAPIClientInit:
         client = OSFAPIClient(token="test_token", base_url="https://test.osf.io/v2")
         assert client.base_url == "https://test.osf.io/v2"
 
+    def test_abs_resolves_and_caches_relative_urls(self):
+        """Test that relative endpoints are joined to base_url and memoized."""
+        _resolve_url.cache_clear()
+        client = OSFAPIClient(token="test_token", base_url="https://test.osf.io/v2/")
+        assert client._abs("/nodes/") == "https://test.osf.io/v2/nodes/"
+        assert client._abs("https://files.osf.io/x") == "https://files.osf.io/x"
+
+        # A second client with the same base URL reuses the resolution
+        other = OSFAPIClient(token="other_token", base_url="https://test.osf.io/v2")
+        assert other._abs("/nodes/") == "https://test.osf.io/v2/nodes/"
+        info = _resolve_url.cache_info()
+        assert (info.hits, info.currsize) == (1, 1)
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_prewarm_opens_connection_in_background(self, mock_request):
+        """Test that prewarm sends a best-effort HEAD to the API host."""
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+
+        with patch("dvc_osf.api.threading.Thread") as mock_thread:
+            client = OSFAPIClient(token="test_token", prewarm=True)
+
+        # Started on its own daemon thread, not the page prefetch executor
+        assert mock_thread.call_args.kwargs["daemon"] is True
+        mock_thread.return_value.start.assert_called_once()
+        assert client._executor is None
+
+        mock_thread.call_args.kwargs["target"]()
+        args, kwargs = mock_request.call_args
+        assert args == ("HEAD", "https://api.osf.io/v2/")
+        assert mock_request.call_count == 1
+        client.close()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_no_prewarm_by_default(self, mock_request):
+        """Test that constructing a client makes no requests by default."""
+        OSFAPIClient(token="test_token")
+        mock_request.assert_not_called()
+
     def test_init_with_custom_timeout(self):
         """Test initialization with custom timeout."""
         client = OSFAPIClient(token="test_token", timeout=60)
@@ -53,6 +96,22 @@ class TestOSFAPIClientInit:
         assert "Authorization" in client.session.headers
         assert client.session.headers["Authorization"] == "Bearer test_token"
 
+    def test_new_session_reuses_formatted_auth_headers(self):
+        """Test that new sessions don't re-run the auth header formatter."""
+        client = OSFAPIClient(token="test_token")
+        with patch("dvc_osf.api.format_auth_header") as mock_format:
+            session = client._new_session()
+
+        mock_format.assert_not_called()
+        assert session is not client.session
+        assert session.headers["Authorization"] == "Bearer test_token"
+
+    def test_init_has_no_default_content_type(self):
+        """Test that Content-Type is not a session-wide default."""
+        client = OSFAPIClient(token="test_token")
+        assert "Content-Type" not in client.session.headers
+        assert client.session.headers["Accept"] == "application/json"
+
 
 class TestHTTPMethods:
     """Tests for HTTP method implementations."""
@@ -85,7 +144,8 @@ class TestHTTPMethods:
         mock_request.assert_called_once()
         args, kwargs = mock_request.call_args
         assert kwargs["method"] == "POST"
-        assert kwargs["json"] == {"key": "value"}
+        assert json.loads(kwargs["data"]) == {"key": "value"}
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
 
     @patch("dvc_osf.api.requests.Session.request")
     def test_put_method(self, mock_request):
@@ -100,6 +160,8 @@ class TestHTTPMethods:
         mock_request.assert_called_once()
         args, kwargs = mock_request.call_args
         assert kwargs["method"] == "PUT"
+        assert json.loads(kwargs["data"]) == {"key": "value"}
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
 
     @patch("dvc_osf.api.requests.Session.request")
     def test_delete_method(self, mock_request):
@@ -115,6 +177,58 @@ class TestHTTPMethods:
         args, kwargs = mock_request.call_args
         assert kwargs["method"] == "DELETE"
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_download_file_requests_raw_bytes(self, mock_request):
+        """Test that downloads stream and disable transfer compression."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        client.download_file("https://files.osf.io/v1/resources/abc/file")
+
+        kwargs = mock_request.call_args[1]
+        assert kwargs["stream"] is True
+        assert kwargs["headers"]["Accept-Encoding"] == "identity"
+        assert kwargs["headers"]["Accept"] == "application/octet-stream"
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_iter_download_yields_chunks_and_closes(self, mock_request):
+        """Test that iter_download streams chunks and closes the response."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = iter([b"ab", b"cd"])
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        chunks = list(client.iter_download("https://files.osf.io/v1/file", 2))
+
+        assert chunks == [b"ab", b"cd"]
+        mock_response.iter_content.assert_called_once_with(chunk_size=2)
+        mock_response.close.assert_called_once()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_delete_many_collects_per_url_errors(self, mock_request):
+        """Test that one failed delete does not abort the batch."""
+
+        def respond(method, url, **kwargs):
+            response = Mock()
+            response.status_code = 404 if url.endswith("/b") else 204
+            response.headers = {}
+            return response
+
+        mock_request.side_effect = respond
+
+        client = OSFAPIClient(token="test_token")
+        results = client.delete_many(["/files/a", "/files/b", "/files/c"])
+
+        assert [url for url, _ in results] == ["/files/a", "/files/b", "/files/c"]
+        assert results[0][1] is None and results[2][1] is None
+        assert isinstance(results[1][1], OSFNotFoundError)
+        assert {kwargs["method"] for _, kwargs in mock_request.call_args_list} == {
+            "DELETE"
+        }
+
     @patch("dvc_osf.api.requests.Session.request")
     def test_get_with_params(self, mock_request):
         """Test GET request with query parameters."""
@@ -138,6 +252,7 @@ class TestStatusCodeMapping:
         """Test that 400 raises OSFAPIError."""
         mock_response = Mock()
         mock_response.status_code = 400
+        mock_response.headers = {}
         mock_response.json.return_value = {}
         mock_request.return_value = mock_response
 
@@ -152,6 +267,7 @@ class TestStatusCodeMapping:
         """Test that 401 raises OSFAuthenticationError."""
         mock_response = Mock()
         mock_response.status_code = 401
+        mock_response.headers = {}
         mock_response.json.return_value = {}
         mock_request.return_value = mock_response
 
@@ -166,6 +282,7 @@ class TestStatusCodeMapping:
         """Test that 403 raises OSFPermissionError."""
         mock_response = Mock()
         mock_response.status_code = 403
+        mock_response.headers = {}
         mock_response.json.return_value = {}
         mock_request.return_value = mock_response
 
@@ -180,6 +297,7 @@ class TestStatusCodeMapping:
         """Test that 404 raises OSFNotFoundError."""
         mock_response = Mock()
         mock_response.status_code = 404
+        mock_response.headers = {}
         mock_response.json.return_value = {}
         mock_request.return_value = mock_response
 
@@ -209,6 +327,7 @@ class TestStatusCodeMapping:
         """Test that 500 raises retryable OSFAPIError."""
         mock_response = Mock()
         mock_response.status_code = 500
+        mock_response.headers = {}
         mock_response.json.return_value = {}
         mock_request.return_value = mock_response
 
@@ -224,12 +343,13 @@ class TestRetryLogic:
     """Tests for retry logic with exponential backoff."""
 
     @patch("dvc_osf.api.requests.Session.request")
-    @patch("dvc_osf.api.time.sleep")
-    def test_retry_on_500_error(self, mock_sleep, mock_request):
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_retry_on_500_error(self, mock_wait, mock_request):
         """Test retry on 500 server error."""
         # First two attempts fail, third succeeds
         mock_response_fail = Mock()
         mock_response_fail.status_code = 500
+        mock_response_fail.headers = {}
         mock_response_fail.json.return_value = {}
 
         mock_response_success = Mock()
@@ -242,15 +362,15 @@ class TestRetryLogic:
         ]
 
         client = OSFAPIClient(token="test_token", max_retries=3)
-        response = client.get("/test")
+        response = client.post("/test")
 
         assert response.status_code == 200
         assert mock_request.call_count == 3
-        assert mock_sleep.call_count == 2  # Two retries
+        assert mock_wait.call_count == 2  # Two retries
 
     @patch("dvc_osf.api.requests.Session.request")
-    @patch("dvc_osf.api.time.sleep")
-    def test_retry_on_connection_error(self, mock_sleep, mock_request):
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_retry_on_connection_error(self, mock_wait, mock_request):
         """Test retry on connection error."""
         # First two attempts fail with connection error, third succeeds
         mock_response_success = Mock()
@@ -267,13 +387,87 @@ class TestRetryLogic:
 
         assert response.status_code == 200
         assert mock_request.call_count == 3
-        assert mock_sleep.call_count == 2
+        assert mock_wait.call_count == 2
+
+    @patch("dvc_osf.api.requests.Session.request")
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_get_5xx_retried_in_python(self, mock_wait, mock_request):
+        """Test that GET status retries go through the cancellable backoff."""
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 503
+        mock_response_fail.headers = {}
+        mock_response_fail.json.return_value = {}
+        mock_request.return_value = mock_response_fail
+
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        with pytest.raises(OSFAPIError):
+            client.get("/test")
+
+        assert mock_request.call_count == 4
+        assert mock_wait.call_count == 3
+
+    @patch("dvc_osf.api.requests.Session.request")
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_get_retry_after_bounded_by_deadline(self, mock_wait, mock_request):
+        """Test that a huge Retry-After never waits past the deadline."""
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 429
+        mock_response_fail.headers = {"Retry-After": "3600"}
+        mock_response_fail.json.return_value = {}
+        mock_request.return_value = mock_response_fail
+
+        client = OSFAPIClient(token="test_token", max_retries=1)
+        with pytest.raises(OSFRateLimitError):
+            client.get("/test", deadline=time.monotonic() + 5)
+
+        assert mock_wait.call_args[0][0] <= 5
+
+    def test_adapter_does_not_retry(self):
+        """Test that the HTTPAdapter leaves every retry to _request."""
+        client = OSFAPIClient(token="test_token", max_retries=4)
+        retry = client.session.get_adapter("https://api.osf.io").max_retries
+
+        assert retry.total == 0
+        assert retry.status == 0
+        assert retry.respect_retry_after_header is False
+
+    def test_pool_size_sizes_adapter(self):
+        """Test that a custom pool size reaches the HTTPAdapter."""
+        client = OSFAPIClient(token="test_token", pool_size=25)
+        adapter = client.session.get_adapter("https://api.osf.io")
+
+        assert adapter._pool_maxsize == 25
+
+    def test_adapter_enables_tcp_keepalive(self):
+        """Test that pooled sockets are created with SO_KEEPALIVE."""
+        import socket
+
+        client = OSFAPIClient(token="test_token")
+        adapter = client.session.get_adapter("https://api.osf.io")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    def test_adapter_sends_uploads_in_large_blocks(self):
+        """Test that pooled connections read upload bodies in large blocks."""
+        from dvc_osf.api import _POOL_SUPPORTS_BLOCKSIZE, UPLOAD_BLOCK_SIZE
+
+        if not _POOL_SUPPORTS_BLOCKSIZE:
+            pytest.skip("urllib3 1.26 has no per-pool block size")
+
+        client = OSFAPIClient(token="test_token")
+        adapter = client.session.get_adapter("https://api.osf.io")
+        pool = adapter.poolmanager.connection_from_url("https://api.osf.io")
+
+        assert pool._new_conn().blocksize == UPLOAD_BLOCK_SIZE
 
     @patch("dvc_osf.api.requests.Session.request")
     def test_no_retry_on_401_error(self, mock_request):
         """Test no retry on authentication error."""
         mock_response = Mock()
         mock_response.status_code = 401
+        mock_response.headers = {}
         mock_response.json.return_value = {}
         mock_request.return_value = mock_response
 
@@ -285,34 +479,127 @@ class TestRetryLogic:
         assert mock_request.call_count == 1
 
     @patch("dvc_osf.api.requests.Session.request")
-    @patch("dvc_osf.api.time.sleep")
-    def test_exponential_backoff(self, mock_sleep, mock_request):
-        """Test exponential backoff delays."""
+    @patch("dvc_osf.api.random.random", return_value=1.0)
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_exponential_backoff(self, mock_wait, mock_random, mock_request):
+        """Test exponential backoff delays (jitter pinned to its maximum)."""
         mock_response_fail = Mock()
         mock_response_fail.status_code = 503
+        mock_response_fail.headers = {}
         mock_response_fail.json.return_value = {}
 
         mock_request.return_value = mock_response_fail
 
         client = OSFAPIClient(token="test_token", max_retries=3)
         with pytest.raises(OSFAPIError):
-            client.get("/test")
+            client.post("/test")
 
         # Check that sleep was called with increasing delays
-        assert mock_sleep.call_count == 3
+        assert mock_wait.call_count == 3
         # Backoff should be 2^1, 2^2, 2^3 = 2, 4, 8
-        calls = [call[0][0] for call in mock_sleep.call_args_list]
+        calls = [call[0][0] for call in mock_wait.call_args_list]
         assert calls[0] == 2.0
         assert calls[1] == 4.0
         assert calls[2] == 8.0
 
+    @patch("dvc_osf.api.requests.Session.request")
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_backoff_has_full_jitter(self, mock_wait, mock_request):
+        """Test that backoff delays are randomized below the exponential ceiling."""
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 503
+        mock_response_fail.headers = {}
+        mock_response_fail.json.return_value = {}
+        mock_request.return_value = mock_response_fail
+
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        with patch("dvc_osf.api.random.random", return_value=0.5):
+            with pytest.raises(OSFAPIError):
+                client.post("/test")
+
+        calls = [call[0][0] for call in mock_wait.call_args_list]
+        assert calls == [1.0, 2.0, 4.0]
+
+    @patch("dvc_osf.api.requests.Session.request")
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_expired_deadline_stops_retries(self, mock_wait, mock_request):
+        """Test that no retry is attempted once the deadline has passed."""
+        import time
+
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 503
+        mock_response_fail.headers = {}
+        mock_response_fail.json.return_value = {}
+        mock_request.return_value = mock_response_fail
+
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        with pytest.raises(OSFAPIError):
+            client.post("/test", deadline=time.monotonic() - 1)
+
+        assert mock_request.call_count == 1
+        mock_wait.assert_not_called()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_sleep_truncated_to_deadline(self, mock_wait, mock_request):
+        """Test that a backoff sleep never runs past the deadline."""
+        import time
+
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 503
+        mock_response_fail.headers = {}
+        mock_response_fail.json.return_value = {}
+        mock_response_success = Mock()
+        mock_response_success.status_code = 200
+        mock_request.side_effect = [mock_response_fail, mock_response_success]
+
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        with patch("dvc_osf.api.random.random", return_value=1.0):
+            client.post("/test", deadline=time.monotonic() + 0.5)
+
+        assert mock_wait.call_count == 1
+        assert mock_wait.call_args[0][0] <= 0.5
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_close_cancels_backoff(self, mock_request):
+        """Test that closing the client aborts a pending retry wait."""
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        client.close()
+
+        with pytest.raises(OSFConnectionError, match="cancelled"):
+            client.post("/test")
+        assert mock_request.call_count == 1
+
+    def test_backoff_delay_is_capped(self):
+        """Test that the backoff ceiling never exceeds RETRY_MAX_DELAY."""
+        with patch("dvc_osf.api.random.random", return_value=1.0):
+            client = OSFAPIClient(token="test_token", max_retries=10)
+            delay = client._backoff_delay(10)
+        assert delay == Config.RETRY_MAX_DELAY
+
+    def test_backoff_table_precomputed(self):
+        """Test that backoff ceilings are computed once per client."""
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        assert client._backoff_table == [
+            min(Config.RETRY_MAX_DELAY, Config.RETRY_BASE_DELAY * 2.0**i)
+            for i in range(5)
+        ]
+
 
 class TestRateLimitHandling:
     """Tests for rate limit handling with Retry-After header."""
 
     @patch("dvc_osf.api.requests.Session.request")
-    @patch("dvc_osf.api.time.sleep")
-    def test_rate_limit_with_retry_after_header(self, mock_sleep, mock_request):
+    @patch("dvc_osf.exceptions.random.uniform", return_value=0.0)
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_rate_limit_with_retry_after_header(
+        self, mock_wait, mock_uniform, mock_request
+    ):
         """Test rate limit handling with Retry-After header."""
         # First request hits rate limit, second succeeds
         mock_response_rate_limit = Mock()
@@ -329,16 +616,18 @@ class TestRateLimitHandling:
         ]
 
         client = OSFAPIClient(token="test_token", max_retries=3)
-        response = client.get("/test")
+        response = client.post("/test")
 
         assert response.status_code == 200
-        assert mock_sleep.call_count == 1
+        assert mock_wait.call_count == 1
         # Should sleep for the retry-after duration
-        assert mock_sleep.call_args[0][0] == 60
+        assert mock_wait.call_args[0][0] == 60
+        mock_uniform.assert_called_once_with(0, Config.RETRY_JITTER)
 
     @patch("dvc_osf.api.requests.Session.request")
-    @patch("dvc_osf.api.time.sleep")
-    def test_rate_limit_without_retry_after(self, mock_sleep, mock_request):
+    @patch("dvc_osf.api.random.random", return_value=1.0)
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_rate_limit_without_retry_after(self, mock_wait, mock_random, mock_request):
         """Test rate limit handling without Retry-After header."""
         mock_response_rate_limit = Mock()
         mock_response_rate_limit.status_code = 429
@@ -354,26 +643,61 @@ class TestRateLimitHandling:
         ]
 
         client = OSFAPIClient(token="test_token", max_retries=3)
-        response = client.get("/test")
+        response = client.post("/test")
 
         assert response.status_code == 200
-        assert mock_sleep.call_count == 1
+        assert mock_wait.call_count == 1
         # Should use exponential backoff (2^1 = 2)
-        assert mock_sleep.call_args[0][0] == 2.0
+        assert mock_wait.call_args[0][0] == 2.0
+
+    @patch("dvc_osf.api.requests.Session.request")
+    @patch("dvc_osf.exceptions.random.uniform", return_value=0.0)
+    @patch("dvc_osf.api.threading.Event.wait", return_value=False)
+    def test_rate_limit_with_http_date_retry_after(
+        self, mock_wait, mock_uniform, mock_request
+    ):
+        """Test Retry-After HTTP-dates are measured against the Date header."""
+        mock_response_rate_limit = Mock()
+        mock_response_rate_limit.status_code = 429
+        mock_response_rate_limit.headers = {
+            "Retry-After": "Wed, 21 Oct 2015 07:28:45 GMT",
+            "Date": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+        mock_response_success = Mock()
+        mock_response_success.status_code = 200
+
+        mock_request.side_effect = [
+            mock_response_rate_limit,
+            mock_response_success,
+        ]
+
+        client = OSFAPIClient(token="test_token", max_retries=3)
+        response = client.post("/test")
+
+        assert response.status_code == 200
+        assert mock_wait.call_args[0][0] == 45.0
 
 
 class TestPaginationLogic:
     """Tests for pagination with get_paginated method."""
 
+    @staticmethod
+    def _page(data):
+        response = Mock()
+        response.status_code = 200
+        response.content = json.dumps(data).encode()
+        return response
+
     @patch("dvc_osf.api.requests.Session.request")
     def test_pagination_single_page(self, mock_request):
         """Test pagination with single page of results."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [{"id": "1"}, {"id": "2"}],
-            "links": {},
-        }
+        mock_response = self._page(
+            {
+                "data": [{"id": "1"}, {"id": "2"}],
+                "links": {},
+            }
+        )
         mock_request.return_value = mock_response
 
         client = OSFAPIClient(token="test_token")
@@ -386,19 +710,19 @@ class TestPaginationLogic:
     @patch("dvc_osf.api.requests.Session.request")
     def test_pagination_multiple_pages(self, mock_request):
         """Test pagination with multiple pages."""
-        mock_response_page1 = Mock()
-        mock_response_page1.status_code = 200
-        mock_response_page1.json.return_value = {
-            "data": [{"id": "1"}, {"id": "2"}],
-            "links": {"next": "https://api.osf.io/v2/nodes?page=2"},
-        }
+        mock_response_page1 = self._page(
+            {
+                "data": [{"id": "1"}, {"id": "2"}],
+                "links": {"next": "https://api.osf.io/v2/nodes?page=2"},
+            }
+        )
 
-        mock_response_page2 = Mock()
-        mock_response_page2.status_code = 200
-        mock_response_page2.json.return_value = {
-            "data": [{"id": "3"}, {"id": "4"}],
-            "links": {},
-        }
+        mock_response_page2 = self._page(
+            {
+                "data": [{"id": "3"}, {"id": "4"}],
+                "links": {},
+            }
+        )
 
         mock_request.side_effect = [mock_response_page1, mock_response_page2]
 
@@ -408,15 +732,139 @@ class TestPaginationLogic:
         assert len(items) == 4
         assert mock_request.call_count == 2
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_pagination_prefetches_next_page(self, mock_request):
+        """Test that the next page is requested before the current one is consumed."""
+        mock_response_page1 = self._page(
+            {
+                "data": [{"id": "1"}, {"id": "2"}],
+                "links": {"next": "https://api.osf.io/v2/nodes?page=2"},
+            }
+        )
+
+        mock_response_page2 = self._page({"data": [{"id": "3"}], "links": {}})
+
+        mock_request.side_effect = [mock_response_page1, mock_response_page2]
+
+        client = OSFAPIClient(token="test_token")
+        items = client.get_paginated("/nodes")
+        assert next(items)["id"] == "1"
+
+        deadline = time.monotonic() + 5
+        while mock_request.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert mock_request.call_count == 2
+        assert "nodes?page=2" in str(mock_request.call_args)
+
+        assert [item["id"] for item in items] == ["2", "3"]
+        client.close()
+        assert client._executor is None
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_iter_pages_yields_whole_pages(self, mock_request):
+        """Test that iter_pages yields each decoded page, links included."""
+        mock_request.side_effect = [
+            self._page(
+                {
+                    "data": [{"id": "1"}],
+                    "links": {"next": "https://api.osf.io/v2/nodes?page=2"},
+                }
+            ),
+            self._page({"data": [{"id": "2"}], "links": {"next": None}}),
+        ]
+
+        client = OSFAPIClient(token="test_token")
+        pages = list(client.iter_pages("/nodes"))
+
+        assert [page["data"] for page in pages] == [[{"id": "1"}], [{"id": "2"}]]
+        assert mock_request.call_count == 2
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_get_paginated_stopped_early_drops_prefetch(self, mock_request):
+        """Test that abandoning get_paginated cancels the pending page."""
+        mock_request.side_effect = [
+            self._page(
+                {
+                    "data": [{"id": "1"}, {"id": "2"}],
+                    "links": {"next": "https://api.osf.io/v2/nodes?page=2"},
+                }
+            ),
+            self._page({"data": [{"id": "3"}], "links": {}}),
+        ]
+
+        client = OSFAPIClient(token="test_token")
+        items = client.get_paginated("/nodes")
+        assert next(items)["id"] == "1"
+        with patch.object(Future, "cancel") as mock_cancel:
+            items.close()
+
+        mock_cancel.assert_called_once()
+        client.close()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_concurrent_listings_prefetch_in_parallel(self, mock_request):
+        """Test that one thread's page prefetch does not queue behind another's."""
+        # Both second pages must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def request(method, url, **kwargs):
+            if "page=2" in url:
+                barrier.wait()
+                return self._page({"data": [{"id": "2"}], "links": {}})
+            return self._page(
+                {"data": [{"id": "1"}], "links": {"next": f"{url}?page=2"}}
+            )
+
+        mock_request.side_effect = request
+        client = OSFAPIClient(token="test_token", pool_size=4)
+        results = {}
+
+        def list_nodes(name):
+            results[name] = [i["id"] for i in client.get_paginated(f"/{name}")]
+
+        threads = [threading.Thread(target=list_nodes, args=(n,)) for n in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {"a": ["1", "2"], "b": ["1", "2"]}
+        client.close()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_close_during_listing_raises_connection_error(self, mock_request):
+        """Test that a prefetch dropped by close() surfaces as OSFConnectionError."""
+        release = threading.Event()
+
+        def request(method, url, **kwargs):
+            if "page=" in url:
+                release.wait(5)
+                return self._page({"data": [], "links": {}})
+            return self._page(
+                {"data": [{"id": "1"}], "links": {"next": f"{url}?page=2"}}
+            )
+
+        mock_request.side_effect = request
+        client = OSFAPIClient(token="test_token", pool_size=1)
+        # Occupy the only prefetch worker so the listing's prefetch is queued
+        client._prefetch_executor().submit(release.wait, 5)
+        pages = client.iter_pages("/nodes")
+        next(pages)
+
+        client.close()
+        release.set()
+        with pytest.raises(OSFConnectionError, match="closed"):
+            next(pages)
+
     @patch("dvc_osf.api.requests.Session.request")
     def test_pagination_empty_results(self, mock_request):
         """Test pagination with empty results."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [],
-            "links": {},
-        }
+        mock_response = self._page(
+            {
+                "data": [],
+                "links": {},
+            }
+        )
         mock_request.return_value = mock_response
 
         client = OSFAPIClient(token="test_token")
@@ -424,6 +872,134 @@ class TestPaginationLogic:
 
         assert len(items) == 0
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_get_single_returns_data_object(self, mock_request):
+        """Test get_single unwraps a single-resource payload."""
+        mock_request.return_value = self._page(
+            {"data": {"id": "abc", "type": "nodes"}, "links": {}}
+        )
+
+        client = OSFAPIClient(token="test_token")
+
+        assert client.get_single("/nodes/abc/") == {"id": "abc", "type": "nodes"}
+
+
+class TestGetCache:
+    """Tests for the short-lived GET response cache."""
+
+    @staticmethod
+    def _response(status_code=200, etag=None):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_repeated_get_served_from_cache(self, mock_request):
+        """Test that a fresh cached response is reused without a request."""
+        response = self._response()
+        mock_request.return_value = response
+
+        client = OSFAPIClient(token="test_token")
+        assert client.get("/nodes/abc", params={"page": 1}) is response
+        assert client.get("/nodes/abc", params={"page": 1}) is response
+
+        assert mock_request.call_count == 1
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_stale_entry_revalidated_with_etag(self, mock_request):
+        """Test that stale entries send If-None-Match and reuse on 304."""
+        response = self._response(etag='"v1"')
+        mock_request.side_effect = [response, self._response(status_code=304)]
+
+        client = OSFAPIClient(token="test_token")
+        client.get("/nodes/abc")
+        with patch("dvc_osf.api.time.monotonic", return_value=time.monotonic() + 60):
+            assert client.get("/nodes/abc") is response
+
+        assert mock_request.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_write_clears_cache(self, mock_request):
+        """Test that a non-GET request invalidates cached responses."""
+        mock_request.return_value = self._response()
+
+        client = OSFAPIClient(token="test_token")
+        client.get("/nodes/abc")
+        client.delete("/nodes/abc/files/x")
+        client.get("/nodes/abc")
+
+        assert mock_request.call_count == 3
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_response_in_flight_during_clear_not_cached(self, mock_request):
+        """Test that a GET racing a write does not cache its stale response."""
+        client = OSFAPIClient(token="test_token")
+
+        def request(*args, **kwargs):
+            # Another thread's write lands while this GET is in flight
+            client.clear_cache()
+            return self._response()
+
+        mock_request.side_effect = request
+        client.get("/nodes/abc")
+        mock_request.side_effect = None
+        mock_request.return_value = self._response()
+        client.get("/nodes/abc")
+
+        assert mock_request.call_count == 2
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_get_started_during_write_not_kept(self, mock_request):
+        """Test that a GET sent while a write is in flight is dropped after it."""
+        client = OSFAPIClient(token="test_token")
+
+        def request(**kwargs):
+            if kwargs["method"] == "DELETE":
+                # Another thread lists the folder while the delete is in
+                # flight and still sees the file
+                client.get("/nodes/abc")
+            return self._response()
+
+        mock_request.side_effect = request
+        client.delete("/nodes/abc/files/x")
+        client.get("/nodes/abc")
+
+        assert [c.kwargs["method"] for c in mock_request.call_args_list] == [
+            "DELETE",
+            "GET",
+            "GET",
+        ]
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_errors_and_streams_not_cached(self, mock_request):
+        """Test that error and streamed responses always hit the network."""
+        mock_request.return_value = self._response()
+
+        client = OSFAPIClient(token="test_token")
+        client.get("/nodes/abc", stream=True)
+        client.get("/nodes/abc", stream=True)
+        assert mock_request.call_count == 2
+
+        not_found = self._response(status_code=404)
+        mock_request.return_value = not_found
+        for _ in range(2):
+            with pytest.raises(OSFNotFoundError):
+                client.get("/nodes/missing")
+        assert mock_request.call_count == 4
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_zero_ttl_disables_cache(self, mock_request):
+        """Test that OSF_CACHE_TTL=0 turns the cache off."""
+        mock_request.return_value = self._response()
+
+        with patch.object(Config, "CACHE_TTL", 0):
+            client = OSFAPIClient(token="test_token")
+        client.get("/nodes/abc")
+        client.get("/nodes/abc")
+
+        assert mock_request.call_count == 2
+
 
 class TestContextManager:
     """Tests for context manager support."""
@@ -451,6 +1027,10 @@ class TestErrorMessageExtraction:
         """Test extracting error message from errors array."""
         mock_response = Mock()
         mock_response.status_code = 400
+        mock_response.headers = {"Content-Type": "application/vnd.api+json"}
+        mock_response.content = (
+            b'{"errors": [{"detail": "Invalid request parameters"}]}'
+        )
         mock_response.json.return_value = {
             "errors": [{"detail": "Invalid request parameters"}]
         }
@@ -467,6 +1047,8 @@ class TestErrorMessageExtraction:
         """Test extracting error message from detail field."""
         mock_response = Mock()
         mock_response.status_code = 404
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = b'{"detail": "Resource not found"}'
         mock_response.json.return_value = {"detail": "Resource not found"}
         mock_request.return_value = mock_response
 
@@ -476,6 +1058,52 @@ class TestErrorMessageExtraction:
 
         assert "Resource not found" in str(exc_info.value)
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_non_json_error_body_not_parsed(self, mock_request):
+        """Test that HTML error pages fall back to the default message."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        with pytest.raises(OSFNotFoundError) as exc_info:
+            client.get("/test")
+
+        assert "Resource not found on OSF." in str(exc_info.value)
+        mock_response.json.assert_not_called()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_oversized_error_body_not_parsed(self, mock_request):
+        """Test that large error bodies are not parsed."""
+        mock_response = Mock()
+        mock_response.status_code = 400
+        mock_response.headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(10 * 1024 * 1024),
+        }
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        with pytest.raises(OSFAPIError) as exc_info:
+            client.get("/test")
+
+        assert "Bad request" in str(exc_info.value)
+        mock_response.json.assert_not_called()
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_empty_json_error_body_uses_default(self, mock_request):
+        """Test that an empty body with a JSON content type is not decoded."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.headers = {"Content-Type": "application/vnd.api+json"}
+        mock_response.content = b""
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        with pytest.raises(OSFPermissionError, match="Permission denied"):
+            client.get("/test")
+
 
 class TestOSFAPIClientUploadMethods:
     """Tests for OSF API client upload methods."""
@@ -498,6 +1126,31 @@ class TestOSFAPIClientUploadMethods:
         assert response.status_code == 200
         mock_request.assert_called_once()
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_upload_file_with_progress_passes_file_wrapper(self, mock_request):
+        """Test that progress uploads hand requests a file-like body."""
+        import io
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+        progress = []
+
+        client = OSFAPIClient(token="test_token")
+        client.upload_file(
+            "https://osf.io/upload",
+            io.BytesIO(b"abcdefghij"),
+            lambda sent, total: progress.append((sent, total)),
+            10,
+        )
+
+        body = mock_request.call_args[1]["data"]
+        assert len(body) == 10
+        assert body.read(4) == b"abcd"
+        assert body.read() == b"efghij"
+        assert body.read(4) == b""
+        assert progress == [(4, 10), (10, 10)]
+
     @patch("dvc_osf.api.requests.Session.request")
     def test_upload_chunk_success(self, mock_request):
         """Test successful chunk upload."""
@@ -519,6 +1172,64 @@ class TestOSFAPIClientUploadMethods:
         assert "Content-Range" in call_kwargs["headers"]
         assert call_kwargs["headers"]["Content-Range"] == "bytes 0-1023/1024"
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_upload_chunks_parallel(self, mock_request):
+        """Test that all chunks are uploaded and responses keep chunk order."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        chunks = [(b"a" * 4, 0, 3), (b"b" * 4, 4, 7), (b"c" * 2, 8, 9)]
+
+        responses = client.upload_chunks_parallel(
+            "https://osf.io/upload", chunks, 10, max_concurrency=2
+        )
+
+        assert responses == [mock_response] * 3
+        ranges = sorted(
+            call[1]["headers"]["Content-Range"] for call in mock_request.call_args_list
+        )
+        assert ranges == ["bytes 0-3/10", "bytes 4-7/10", "bytes 8-9/10"]
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_upload_chunks_parallel_raises_first_error(self, mock_request):
+        """Test that a failing chunk surfaces its exception."""
+        from dvc_osf.exceptions import OSFQuotaExceededError
+
+        mock_response = Mock()
+        mock_response.status_code = 413
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token")
+        with pytest.raises(OSFQuotaExceededError):
+            client.upload_chunks_parallel(
+                "https://osf.io/upload", [(b"a", 0, 0), (b"b", 1, 1)], 2
+            )
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_upload_chunks_parallel_reports_progress_on_error(self, mock_request):
+        """Test that upload errors carry the bytes of completed chunks."""
+        from dvc_osf.exceptions import OSFQuotaExceededError
+
+        ok = Mock(status_code=200)
+        full = Mock(status_code=413, headers={})
+
+        def _respond(method, url, headers=None, **kwargs):
+            return full if headers["Content-Range"].startswith("bytes 4-") else ok
+
+        mock_request.side_effect = _respond
+
+        client = OSFAPIClient(token="test_token")
+        chunks = [(b"a" * 4, 0, 3), (b"b" * 4, 4, 7)]
+        with pytest.raises(OSFQuotaExceededError) as exc_info:
+            client.upload_chunks_parallel(
+                "https://osf.io/upload", chunks, 8, max_concurrency=1
+            )
+        assert exc_info.value.bytes_uploaded == 4
+        assert exc_info.value.total_size == 8
+
     @patch("dvc_osf.api.requests.Session.request")
     def test_upload_with_quota_exceeded(self, mock_request):
         """Test upload with quota exceeded error."""
@@ -526,6 +1237,7 @@ class TestOSFAPIClientUploadMethods:
 
         mock_response = Mock()
         mock_response.status_code = 413
+        mock_response.headers = {}
         mock_response.json.return_value = {"detail": "Quota exceeded"}
         mock_request.return_value = mock_response
 
@@ -534,8 +1246,10 @@ class TestOSFAPIClientUploadMethods:
 
         file_obj = io.BytesIO(b"test data")
 
-        with pytest.raises(OSFQuotaExceededError):
+        with pytest.raises(OSFQuotaExceededError) as exc_info:
             client.upload_file("https://osf.io/upload", file_obj, None, 9)
+        assert exc_info.value.total_size == 9
+        assert exc_info.value.bytes_uploaded == 0
 
     @patch("dvc_osf.api.requests.Session.request")
     def test_upload_with_file_locked(self, mock_request):
@@ -544,6 +1258,7 @@ class TestOSFAPIClientUploadMethods:
 
         mock_response = Mock()
         mock_response.status_code = 423
+        mock_response.headers = {}
         mock_response.json.return_value = {"detail": "File locked"}
         mock_request.return_value = mock_response
 
@@ -562,6 +1277,7 @@ class TestOSFAPIClientUploadMethods:
 
         mock_response = Mock()
         mock_response.status_code = 409
+        mock_response.headers = {}
         mock_response.json.return_value = {"detail": "Version conflict"}
         mock_request.return_value = mock_response
 
@@ -579,6 +1295,7 @@ class TestOSFAPIClientUploadMethods:
         # First call fails with 500, second succeeds
         mock_response_fail = Mock()
         mock_response_fail.status_code = 500
+        mock_response_fail.headers = {}
         mock_response_fail.json.return_value = {"detail": "Server error"}
 
         mock_response_success = Mock()
@@ -597,6 +1314,27 @@ class TestOSFAPIClientUploadMethods:
         assert response.status_code == 200
         assert mock_request.call_count == 2
 
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_upload_without_retries_sends_once(self, mock_request):
+        """Test upload with max_retries=0 still makes one attempt."""
+        from dvc_osf.exceptions import OSFAPIError
+
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.headers = {}
+        mock_response.json.return_value = {"detail": "Server error"}
+        mock_request.return_value = mock_response
+
+        client = OSFAPIClient(token="test_token", max_retries=0)
+        import io
+
+        file_obj = io.BytesIO(b"test data")
+
+        with pytest.raises(OSFAPIError):
+            client.upload_file("https://osf.io/upload", file_obj, None, 9)
+
+        assert mock_request.call_count == 1
+
     @patch("dvc_osf.api.requests.Session.request")
     def test_upload_no_retry_on_409(self, mock_request):
         """Test upload does not retry on 409 conflict."""
@@ -604,6 +1342,7 @@ class TestOSFAPIClientUploadMethods:
 
         mock_response = Mock()
         mock_response.status_code = 409
+        mock_response.headers = {}
         mock_response.json.return_value = {"detail": "Conflict"}
         mock_request.return_value = mock_response
 
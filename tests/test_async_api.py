@@ -0,0 +1,340 @@
+"""Tests for the asynchronous OSF API client."""
+
+import asyncio
+import io
+from unittest.mock import patch
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from dvc_osf.async_api import AsyncOSFAPIClient  # noqa: E402
+from dvc_osf.exceptions import (  # noqa: E402
+    OSFAPIError,
+    OSFConnectionError,
+    OSFNotFoundError,
+    OSFQuotaExceededError,
+)
+
+
+def run_with_server(routes, scenario):
+    """Serve ``routes`` on a local test server and run ``scenario(client)``."""
+
+    async def _main():
+        app = web.Application()
+        app.add_routes(routes)
+        server = TestServer(app)
+        await server.start_server()
+        client = AsyncOSFAPIClient(
+            token="test_token", base_url=str(server.make_url("/v2"))
+        )
+        try:
+            return await scenario(client, server)
+        finally:
+            await client.close()
+            await server.close()
+
+    return asyncio.run(_main())
+
+
+class TestAsyncOSFAPIClient:
+    """Tests for AsyncOSFAPIClient request handling."""
+
+    def test_get_sends_auth_and_returns_read_response(self):
+        """Test GET resolves relative URLs and the body is readable."""
+        seen = {}
+
+        async def handler(request):
+            seen["auth"] = request.headers["Authorization"]
+            return web.json_response({"data": {"id": "abc"}})
+
+        async def scenario(client, server):
+            response = await client.get("/nodes/abc/")
+            return await response.json()
+
+        data = run_with_server([web.get("/v2/nodes/abc/", handler)], scenario)
+
+        assert data == {"data": {"id": "abc"}}
+        assert seen["auth"] == "Bearer test_token"
+
+    def test_post_serializes_json(self):
+        """Test POST sends JSON payloads with a JSON content type."""
+        seen = {}
+
+        async def handler(request):
+            seen["content_type"] = request.content_type
+            seen["body"] = await request.json()
+            return web.json_response({}, status=201)
+
+        async def scenario(client, server):
+            response = await client.post("/nodes/", json={"key": "value"})
+            return response.status
+
+        status = run_with_server([web.post("/v2/nodes/", handler)], scenario)
+
+        assert status == 201
+        assert seen == {"content_type": "application/json", "body": {"key": "value"}}
+
+    def test_error_status_raises_mapped_exception(self):
+        """Test that error responses use the shared status mapping."""
+
+        async def handler(request):
+            return web.json_response({"detail": "No such node"}, status=404)
+
+        async def scenario(client, server):
+            await client.get("/nodes/missing/")
+
+        with pytest.raises(OSFNotFoundError, match="No such node"):
+            run_with_server([web.get("/v2/nodes/missing/", handler)], scenario)
+
+    def test_delete_many_collects_per_url_errors(self):
+        """Test that concurrent deletes report failures per URL."""
+
+        async def handler(request):
+            if request.match_info["name"] == "b":
+                return web.json_response({"detail": "Gone"}, status=404)
+            return web.Response(status=204)
+
+        async def scenario(client, server):
+            return await client.delete_many(["/files/a", "/files/b", "/files/c"])
+
+        results = run_with_server([web.delete("/v2/files/{name}", handler)], scenario)
+
+        assert [url for url, _ in results] == ["/files/a", "/files/b", "/files/c"]
+        assert results[0][1] is None and results[2][1] is None
+        assert isinstance(results[1][1], OSFNotFoundError)
+
+    @patch("dvc_osf.async_api.random.random", return_value=0.0)
+    def test_retries_server_errors(self, mock_random):
+        """Test that 5xx responses are retried with backoff."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.path)
+            if len(calls) < 3:
+                return web.json_response({}, status=503)
+            return web.json_response({"data": []})
+
+        async def scenario(client, server):
+            return (await client.get("/nodes/")).status
+
+        status = run_with_server([web.get("/v2/nodes/", handler)], scenario)
+
+        assert status == 200
+        assert len(calls) == 3
+        assert mock_random.call_count == 2
+
+    def test_get_paginated_follows_next_links(self):
+        """Test that pagination yields items from every page."""
+
+        async def handler(request):
+            if request.query.get("page") == "2":
+                return web.json_response({"data": [{"id": "3"}], "links": {}})
+            next_url = str(request.url.with_query(page="2"))
+            return web.json_response(
+                {"data": [{"id": "1"}, {"id": "2"}], "links": {"next": next_url}}
+            )
+
+        async def scenario(client, server):
+            return [item["id"] async for item in client.get_paginated("/nodes/")]
+
+        ids = run_with_server([web.get("/v2/nodes/", handler)], scenario)
+
+        assert ids == ["1", "2", "3"]
+
+    def test_get_paginated_prefetches_next_page(self):
+        """Test that the next page is requested before the caller asks for it."""
+        requested = []
+
+        async def handler(request):
+            page = int(request.query.get("page", "1"))
+            requested.append(page)
+            links = {}
+            if page < 3:
+                links["next"] = str(request.url.with_query(page=str(page + 1)))
+            return web.json_response({"data": [{"id": str(page)}], "links": links})
+
+        async def scenario(client, server):
+            pages = client.get_paginated("/nodes/")
+            first = await pages.__anext__()
+            # Let the prefetch task run without consuming more items.
+            for _ in range(50):
+                if len(requested) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            seen = list(requested)
+            rest = [item["id"] async for item in pages]
+            return first["id"], seen, rest
+
+        first, seen, rest = run_with_server([web.get("/v2/nodes/", handler)], scenario)
+
+        assert first == "1"
+        assert seen == [1, 2]
+        assert rest == ["2", "3"]
+
+    def test_get_paginated_fetches_pages_concurrently(self):
+        """Test that pages 2..N are fetched together and yielded in order."""
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            page = int(request.query.get("page", "1"))
+            last = str(request.url.with_query({"filter[kind]": "file", "page": "4"}))
+            if page > 1:
+                in_flight.append(page)
+                peak.append(len(in_flight))
+                # Later pages answer first
+                await asyncio.sleep(0.01 * (5 - page))
+                in_flight.remove(page)
+            return web.json_response(
+                {"data": [{"id": str(page)}], "links": {"last": last}}
+            )
+
+        async def scenario(client, server):
+            return [
+                item["id"]
+                async for item in client.get_paginated(
+                    "/nodes/", params={"filter[kind]": "file"}
+                )
+            ]
+
+        ids = run_with_server([web.get("/v2/nodes/", handler)], scenario)
+
+        assert ids == ["1", "2", "3", "4"]
+        assert max(peak) == 3
+
+    def test_iter_download_yields_chunks(self):
+        """Test that iter_download streams the body in fixed-size chunks."""
+
+        async def handler(request):
+            return web.Response(body=b"x" * 10)
+
+        async def scenario(client, server):
+            return [
+                chunk
+                async for chunk in client.iter_download(
+                    str(server.make_url("/file")), chunk_size=4
+                )
+            ]
+
+        chunks = run_with_server([web.get("/file", handler)], scenario)
+
+        assert b"".join(chunks) == b"x" * 10
+        assert max(len(chunk) for chunk in chunks) <= 4
+
+    def test_upload_file_streams_body_with_progress(self):
+        """Test that uploads send the whole file and report progress."""
+        seen = {}
+        progress = []
+
+        async def handler(request):
+            seen["body"] = await request.read()
+            seen["length"] = request.content_length
+            return web.json_response({"data": {}}, status=201)
+
+        async def scenario(client, server):
+            return await client.upload_file(
+                str(server.make_url("/upload")),
+                io.BytesIO(b"x" * 1000),
+                lambda sent, total: progress.append((sent, total)),
+                1000,
+            )
+
+        response = run_with_server([web.put("/upload", handler)], scenario)
+
+        assert response.status == 201
+        assert seen == {"body": b"x" * 1000, "length": 1000}
+        assert progress[-1] == (1000, 1000)
+
+    def test_upload_quota_exceeded(self):
+        """Test that upload errors map to OSF exceptions."""
+
+        async def handler(request):
+            await request.read()
+            return web.json_response({"detail": "Quota exceeded"}, status=413)
+
+        async def scenario(client, server):
+            await client.upload_file(
+                str(server.make_url("/upload")), io.BytesIO(b"data"), None, 4
+            )
+
+        with pytest.raises(OSFQuotaExceededError):
+            run_with_server([web.put("/upload", handler)], scenario)
+
+    def test_upload_without_retries_sends_once(self):
+        """Test that max_retries=0 is kept and uploads still run once."""
+        hits = []
+
+        async def handler(request):
+            hits.append(await request.read())
+            return web.json_response({"detail": "Server error"}, status=500)
+
+        async def scenario(client, server):
+            client = AsyncOSFAPIClient(token="test_token", max_retries=0)
+            try:
+                assert client.max_retries == 0
+                await client.upload_file(
+                    str(server.make_url("/upload")), io.BytesIO(b"data"), None, 4
+                )
+            finally:
+                await client.close()
+
+        with pytest.raises(OSFAPIError):
+            run_with_server([web.put("/upload", handler)], scenario)
+
+        assert hits == [b"data"]
+
+
+class TestAsyncClientLifecycle:
+    """Tests for AsyncOSFAPIClient session and connection handling."""
+
+    def test_async_context_manager_closes_session(self):
+        """Test that leaving the context closes the aiohttp session."""
+
+        async def scenario():
+            async with AsyncOSFAPIClient(token="test_token") as client:
+                session = client.session
+                connector = session.connector
+                assert connector.limit_per_host == connector.limit
+                assert session.timeout.total == client.timeout
+            return session
+
+        session = asyncio.run(scenario())
+        assert session.closed
+
+    def test_prewarm_sends_head_to_base_url(self):
+        """Test that prewarm opens a connection with a HEAD request."""
+        seen = []
+
+        async def handler(request):
+            seen.append(request.method)
+            return web.Response()
+
+        async def scenario(client, server):
+            await client.prewarm()
+
+        run_with_server([web.head("/v2/", handler)], scenario)
+
+        assert seen == ["HEAD"]
+
+    @patch("dvc_osf.async_api.random.random", return_value=0.0)
+    def test_connection_errors_map_to_osf_exception(self, mock_random):
+        """Test that unreachable hosts raise OSFConnectionError after retries."""
+        import socket
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        async def scenario():
+            async with AsyncOSFAPIClient(
+                token="test_token", base_url=f"http://127.0.0.1:{port}/v2"
+            ) as client:
+                await client.get("/nodes/")
+
+        with pytest.raises(OSFConnectionError):
+            asyncio.run(scenario())
+        assert mock_random.call_count == 3
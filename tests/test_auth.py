@@ -120,6 +120,14 @@ class TestFormatAuthHeader:
         header = format_auth_header("another_token")
         assert header == {"Authorization": "Bearer another_token"}
 
+    def test_format_auth_header_is_shared_and_read_only(self):
+        """Test that the cached header is reused and cannot be mutated."""
+        header = format_auth_header("test_token_12345")
+
+        assert format_auth_header("test_token_12345") is header
+        with pytest.raises(TypeError):
+            header["Accept"] = "application/json"  # type: ignore[index]
+
 
 class TestRedactTokenInMessage:
     """Tests for redact_token_in_message function."""
@@ -149,3 +157,10 @@ class TestRedactTokenInMessage:
         redacted = redact_token_in_message(message, "my_token")
         assert "my_token" not in redacted
         assert redacted.count("[REDACTED]") == 2
+
+    def test_redact_previously_seen_tokens(self):
+        """Test that tokens from earlier calls are redacted in one pass."""
+        redact_token_in_message("", "first_secret")
+        message = "first_secret then second_secret"
+        redacted = redact_token_in_message(message, "second_secret")
+        assert redacted == "[REDACTED] then [REDACTED]"
@@ -22,9 +22,22 @@ class TestConfig:
         """Test default retry backoff."""
         assert Config.RETRY_BACKOFF == 2.0
 
+    def test_default_retry_delays(self):
+        """Test default retry base and maximum delays."""
+        assert Config.RETRY_BASE_DELAY == 1.0
+        assert Config.RETRY_MAX_DELAY == 30
+
+    def test_default_retry_jitter(self):
+        """Test default Retry-After jitter."""
+        assert Config.RETRY_JITTER == 0.5
+
     def test_default_chunk_size(self):
         """Test default chunk size."""
-        assert Config.CHUNK_SIZE == 8192
+        assert Config.CHUNK_SIZE == 1024 * 1024  # 1MB
+
+    def test_default_cache_ttl(self):
+        """Test default GET cache TTL."""
+        assert Config.CACHE_TTL == 10
 
     def test_default_connection_pool_size(self):
         """Test default connection pool size."""
@@ -104,6 +117,23 @@ class TestConfig:
         # Restore original
         importlib.reload(config)
 
+    def test_env_var_chunk_size_bounded(self, monkeypatch):
+        """Test that out-of-range chunk sizes are clamped."""
+        import importlib
+
+        from dvc_osf import config
+
+        monkeypatch.setenv("OSF_CHUNK_SIZE", "512")
+        importlib.reload(config)
+        assert config.Config.CHUNK_SIZE == config.Config.CHUNK_MIN_SIZE
+
+        monkeypatch.setenv("OSF_CHUNK_SIZE", str(1 << 30))
+        importlib.reload(config)
+        assert config.Config.CHUNK_SIZE == config.Config.CHUNK_MAX_SIZE
+
+        # Restore original
+        importlib.reload(config)
+
     def test_env_var_pool_size(self, monkeypatch):
         """Test connection pool size override via environment variable."""
         monkeypatch.setenv("OSF_POOL_SIZE", "20")
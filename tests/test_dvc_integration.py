@@ -175,6 +175,49 @@ class TestEntryPoints:
         assert FS is not None
         assert FS.protocol == "osf"
 
+    def test_registration_deferred_until_dvc_config_schema_import(
+        self, tmp_path, monkeypatch
+    ):
+        """The osf scheme is registered when DVC imports its config schema."""
+        import sys
+
+        import dvc_osf
+
+        pkg = tmp_path / "dvc"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "config_schema.py").write_text(
+            "REMOTE_COMMON = {}\n"
+            "REMOTE_SCHEMAS = {}\n"
+            "SCHEMA = {}\n"
+            "def ByUrl(mapping):\n"
+            "    return dict(mapping)\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        for name in ("dvc", "dvc.config_schema"):
+            monkeypatch.delitem(sys.modules, name, raising=False)
+        monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+        sys.meta_path[:] = [
+            f
+            for f in sys.meta_path
+            if not isinstance(f, dvc_osf._RegisterOnSchemaImport)
+        ]
+
+        dvc_osf._install_registration_hook()
+        assert isinstance(sys.meta_path[0], dvc_osf._RegisterOnSchemaImport)
+
+        import dvc.config_schema as schema
+
+        try:
+            assert "osf" in schema.REMOTE_SCHEMAS
+            assert "osf" in schema.SCHEMA["remote"][str]
+            assert not any(
+                isinstance(f, dvc_osf._RegisterOnSchemaImport) for f in sys.meta_path
+            )
+        finally:
+            sys.modules.pop("dvc.config_schema", None)
+            sys.modules.pop("dvc", None)
+
     def test_entry_points_in_pyproject(self):
         """Verify pyproject.toml has correct entry points."""
         try:
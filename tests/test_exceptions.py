@@ -1,5 +1,7 @@
 """Tests for OSF exception classes."""
 
+import pytest
+
 from dvc_osf.exceptions import (
     OSFAPIError,
     OSFAuthenticationError,
@@ -14,6 +16,8 @@ from dvc_osf.exceptions import (
     OSFQuotaExceededError,
     OSFRateLimitError,
     OSFVersionConflictError,
+    parse_retry_after,
+    raise_for_status,
 )
 
 
@@ -36,6 +40,19 @@ class TestOSFException:
         exc = OSFException("test error")
         assert exc.retryable is False
 
+    def test_http_fields_on_every_subclass(self):
+        """Test that status_code and response are always present."""
+        exc = OSFConnectionError()
+        assert exc.status_code is None
+        assert exc.response is None
+
+    def test_upload_fields_keep_positional_order(self):
+        """Test that upload errors accept the shared positional arguments."""
+        exc = OSFFileLockedError("Locked", 423, None, 10, 100)
+        assert (exc.message, exc.status_code) == ("Locked", 423)
+        assert (exc.bytes_uploaded, exc.total_size) == (10, 100)
+        assert isinstance(exc, OSFPermissionError)
+
 
 class TestOSFAuthenticationError:
     """Tests for OSFAuthenticationError."""
@@ -172,6 +189,15 @@ class TestOSFRateLimitError:
         exc = OSFRateLimitError()
         assert exc.retryable is True
 
+    def test_delay_honors_retry_after(self):
+        """Test that the retry delay is Retry-After plus bounded jitter."""
+        exc = OSFRateLimitError(retry_after=60)
+        assert 60 <= exc.delay(2.0, jitter=0.5) <= 60.5
+
+    def test_delay_without_retry_after_uses_backoff(self):
+        """Test that the client's backoff is used without Retry-After."""
+        assert OSFRateLimitError().delay(2.0, jitter=0.5) == 2.0
+
 
 class TestOSFAPIError:
     """Tests for OSFAPIError."""
@@ -414,3 +440,48 @@ class TestOSFOperationNotSupportedError:
         """Test that operation not supported errors are not retryable."""
         exc = OSFOperationNotSupportedError()
         assert exc.retryable is False
+
+
+class TestRaiseForStatus:
+    """Tests for status code dispatch."""
+
+    def test_success_does_not_raise(self):
+        """Test that non-error statuses are ignored."""
+        raise_for_status(200)
+        raise_for_status(304)
+
+    @pytest.mark.parametrize(
+        "status_code,exc_class",
+        [
+            (401, OSFAuthenticationError),
+            (403, OSFPermissionError),
+            (404, OSFNotFoundError),
+            (409, OSFVersionConflictError),
+            (413, OSFQuotaExceededError),
+            (423, OSFFileLockedError),
+            (429, OSFRateLimitError),
+            (418, OSFAPIError),
+            (502, OSFAPIError),
+        ],
+    )
+    def test_maps_status_to_exception(self, status_code, exc_class):
+        """Test that each status raises its exception with the status attached."""
+        with pytest.raises(exc_class) as exc_info:
+            raise_for_status(status_code, "boom")
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.message == "boom"
+
+    def test_rate_limit_carries_retry_after(self):
+        """Test that 429 responses parse Retry-After onto the error."""
+        with pytest.raises(OSFRateLimitError) as exc_info:
+            raise_for_status(429, headers={"Retry-After": "12"})
+        assert exc_info.value.retry_after == 12.0
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for both header formats."""
+        assert parse_retry_after({"Retry-After": "120"}) == 120.0
+        assert parse_retry_after({"Retry-After": "-5"}) == 0.0
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+        assert parse_retry_after({}) is None
+        # A date already in the past means retry immediately
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
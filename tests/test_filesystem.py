@@ -1,16 +1,57 @@
 """Tests for OSF filesystem implementation."""
 
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
+from dvc_osf.config import Config
 from dvc_osf.exceptions import (
+    OSFAPIError,
     OSFConflictError,
     OSFIntegrityError,
     OSFNotFoundError,
     OSFOperationNotSupportedError,
+    OSFVersionConflictError,
 )
-from dvc_osf.filesystem import OSFFile, OSFFileSystem
+from dvc_osf.filesystem import (
+    BATCH_RETRIES,
+    BatchResult,
+    OSFFile,
+    OSFFileSystem,
+    _copy_with_writer_thread,
+    _DirListing,
+)
+from dvc_osf.utils import parse_osf_url
+
+
+def _json_response(data, status_code=200):
+    """Build a mock response whose body is ``data`` encoded as JSON."""
+    response = Mock(status_code=status_code)
+    response.content = json.dumps(data).encode()
+    response.json.return_value = data
+    return response
+
+
+def _pages_from_get(mock_client):
+    """Have a mocked client's iter_pages follow its mocked get() responses."""
+
+    def iter_pages(url, params=None):
+        while url:
+            data = json.loads(mock_client.get(url).content)
+            yield data
+            url = (data.get("links") or {}).get("next")
+
+    mock_client.iter_pages.side_effect = iter_pages
 
 
 class TestOSFFile:
@@ -38,6 +79,36 @@ class TestOSFFile:
         assert data == b"hello"
         assert osf_file.tell() == 5
 
+    def test_read_size_across_chunks_and_past_end(self):
+        """Test sized reads spanning chunks and running off the end."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hel", b"lo wo", b"rld"])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+
+        assert osf_file.read(7) == b"hello w"
+        assert osf_file.read(100) == b"orld"
+        assert osf_file.read(5) == b""
+        assert osf_file.tell() == 11
+
+    def test_mixed_reads_share_chunk_cursor(self):
+        """Test read, read1, readline and seek interleaved within chunks."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter(
+            [b"ab\ncd", b"", b"ef\ngh", b"ij"]
+        )
+
+        osf_file = OSFFile(mock_response, mode="rb")
+
+        assert osf_file.read(1) == b"a"
+        assert osf_file.readline() == b"b\n"
+        assert osf_file.read1(1) == b"c"
+        assert osf_file.seek(1, 1) == 5
+        assert osf_file.readline() == b"ef\n"
+        assert osf_file.read1() == b"gh"
+        assert osf_file.read() == b"ij"
+        assert osf_file.tell() == 12
+
     def test_read_zero_bytes(self):
         """Test reading zero bytes."""
         mock_response = Mock()
@@ -48,17 +119,66 @@ class TestOSFFile:
         assert data == b""
         assert osf_file.tell() == 0
 
+    @pytest.mark.parametrize(
+        "content_length, expected",
+        [
+            (None, Config.CHUNK_SIZE),
+            ("1", Config.CHUNK_SIZE),
+            ("65536", max(Config.CHUNK_SIZE, 65536)),
+            ("1048576", Config.CHUNK_SIZE),
+            (str(64 * 1024 * 1024), max(Config.CHUNK_SIZE, 4 * 1024 * 1024)),
+        ],
+    )
+    def test_chunk_size_scales_with_content_length(self, content_length, expected):
+        """Test that the default read chunk size follows the body size."""
+        mock_response = Mock()
+        mock_response.headers = (
+            {} if content_length is None else {"Content-Length": content_length}
+        )
+        mock_response.iter_content.return_value = iter([])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+
+        assert osf_file.chunk_size == expected
+        mock_response.iter_content.assert_called_once_with(chunk_size=expected)
+
+    def test_explicit_chunk_size_not_scaled(self):
+        """Test that a caller's chunk size wins over Content-Length."""
+        mock_response = Mock()
+        mock_response.headers = {"Content-Length": str(64 * 1024 * 1024)}
+        mock_response.iter_content.return_value = iter([])
+
+        assert OSFFile(mock_response, mode="rb", chunk_size=100).chunk_size == 100
+
     def test_read_text_mode(self):
-        """Test reading in text mode."""
+        """Test reading text through io.TextIOWrapper."""
         mock_response = Mock()
         mock_response.iter_content.return_value = iter([b"hello", b" ", b"world"])
 
-        osf_file = OSFFile(mock_response, mode="r")
-        data = osf_file.read()
+        text = io.TextIOWrapper(OSFFile(mock_response, mode="rb"), encoding="utf-8")
+        data = text.read()
 
         assert data == "hello world"
         assert isinstance(data, str)
 
+    def test_text_mode_rejected(self):
+        """Test that OSFFile itself only supports binary modes."""
+        with pytest.raises(ValueError, match="TextIOWrapper"):
+            OSFFile(Mock(), mode="r")
+
+    def test_read1_returns_one_chunk(self):
+        """Test that read1 does not wait to fill the requested size."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hello", b" world"])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+
+        assert osf_file.read1(100) == b"hello"
+        assert osf_file.read1(3) == b" wo"
+        assert osf_file.read1() == b"rld"
+        assert osf_file.read1() == b""
+        assert osf_file.tell() == 11
+
     def test_tell(self):
         """Test tell() method returns current position."""
         mock_response = Mock()
@@ -72,6 +192,62 @@ class TestOSFFile:
         osf_file.read()
         assert osf_file.tell() == 11
 
+    def test_readline_across_chunks(self):
+        """Test that lines spanning chunk boundaries are joined."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"ab", b"c\nde\nf", b"g"])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+
+        assert list(osf_file) == [b"abc\n", b"de\n", b"fg"]
+        assert osf_file.tell() == 9
+
+    def test_readline_text_mode_split_character(self):
+        """Test that a multi-byte character split across chunks decodes."""
+        encoded = "caf\u00e9\nok".encode("utf-8")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([encoded[:4], encoded[4:]])
+
+        osf_file = io.TextIOWrapper(OSFFile(mock_response, mode="rb"), encoding="utf-8")
+
+        assert osf_file.readline() == "caf\u00e9\n"
+        assert osf_file.readline() == "ok"
+        assert osf_file.readline() == ""
+
+    def test_readline_size_limit(self):
+        """Test that readline stops after size bytes."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hello\n"])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+
+        assert osf_file.readline(3) == b"hel"
+        assert osf_file.readline() == b"lo\n"
+
+    def test_seek_forward_skips_chunks(self):
+        """Test that forward seeks discard data across chunks."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hel", b"lo wo", b"rld"])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+        osf_file.read(1)
+
+        assert osf_file.seek(4, 1) == 5
+        assert osf_file.seek(7) == 7
+        assert osf_file.read(1) == b"o"
+        assert osf_file.seek(20) == 11
+
+    def test_seek_backward_raises(self):
+        """Test that backward seeks are rejected."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hello"])
+
+        osf_file = OSFFile(mock_response, mode="rb")
+        osf_file.read(3)
+
+        with pytest.raises(OSError, match="Backward seeks"):
+            osf_file.seek(1)
+
     def test_close(self):
         """Test close() method."""
         mock_response = Mock()
@@ -103,11 +279,37 @@ class TestOSFFile:
         with pytest.raises(ValueError, match="closed file"):
             osf_file.read()
 
+    def test_checksum_verified_at_end_of_stream(self):
+        """Test that a matching MD5 reads through without error."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hel", b"lo"])
+
+        osf_file = OSFFile(
+            mock_response,
+            mode="rb",
+            expected_checksum="5d41402abc4b2a76b9719d911017c592",
+        )
+
+        assert osf_file.read(2) == b"he"
+        assert osf_file.read() == b"llo"
+
+    def test_checksum_mismatch_raises_at_end_of_stream(self):
+        """Test that a wrong MD5 raises once the body is exhausted."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = iter([b"hello"])
+
+        osf_file = OSFFile(mock_response, mode="rb", expected_checksum="wrong")
+
+        with pytest.raises(OSFIntegrityError) as exc_info:
+            osf_file.read()
+        assert exc_info.value.actual_checksum == "5d41402abc4b2a76b9719d911017c592"
+        assert osf_file.closed
+
 
 class TestOSFFileSystemInit:
     """Tests for OSFFileSystem initialization."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_init_with_url(self, mock_client_class):
         """Test initialization with OSF URL."""
         fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
@@ -116,7 +318,7 @@ class TestOSFFileSystemInit:
         assert fs.provider == "osfstorage"
         assert fs.base_path == ""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_init_with_url_and_path(self, mock_client_class):
         """Test initialization with URL including path."""
         fs = OSFFileSystem("osf://abc123/osfstorage/data", token="test_token")
@@ -124,6 +326,76 @@ class TestOSFFileSystemInit:
         assert fs.project_id == "abc123"
         assert fs.provider == "osfstorage"
         assert fs.base_path == "data"
+        assert fs._resolve_path("sub/file.csv") == (
+            "abc123",
+            "osfstorage",
+            "data/sub/file.csv",
+        )
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_default_pool_size_covers_dvc_jobs(self, mock_client_class):
+        """Test that the pool is sized for DVC's transfer concurrency."""
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token", jobs=64)
+
+        kwargs = mock_client_class.call_args[1]
+        assert kwargs["pool_size"] == 64
+        assert kwargs["prewarm"] is True
+        fs.close()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_init_passes_pool_size_and_close_releases_client(self, mock_client_class):
+        """Test that the pool size reaches the client and close() closes it."""
+        fs = OSFFileSystem(
+            "osf://abc123/osfstorage", token="test_token", connection_pool_size="20"
+        )
+
+        assert mock_client_class.call_args[1]["pool_size"] == 20
+        fs.close()
+        fs.close()
+        mock_client_class.return_value.close.assert_called_once()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_filesystems_share_client_until_last_close(self, mock_client_class):
+        """Test that filesystems for the same account reuse one client."""
+        mock_client_class.side_effect = lambda **kwargs: Mock()
+        fs1 = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        fs2 = OSFFileSystem("osf://abc123/osfstorage/data", token="test_token")
+        other = OSFFileSystem("osf://abc123/osfstorage", token="other_token")
+
+        assert fs1.client is fs2.client
+        assert other.client is not fs1.client
+        assert mock_client_class.call_count == 2
+
+        client = fs1.client
+        fs1.close()
+        client.close.assert_not_called()
+        fs2.close()
+        client.close.assert_called_once()
+        other.close()
+
+    def test_import_does_not_load_http_stack(self):
+        """Test that importing the plugin module defers importing requests."""
+        code = "import sys, dvc_osf.filesystem; " "print('requests' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    @patch("dvc_osf.filesystem.parse_osf_url", wraps=parse_osf_url)
+    def test_resolve_path_memoized(self, mock_parse, mock_client_class):
+        """Test that repeated paths are parsed once."""
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        mock_parse.reset_mock()
+
+        for _ in range(3):
+            assert fs._resolve_path("osf://xyz789/osfstorage/a/b.txt") == (
+                "xyz789",
+                "osfstorage",
+                "a/b.txt",
+            )
+
+        mock_parse.assert_called_once()
 
 
 class TestOSFFileSystemExists:
@@ -149,7 +421,7 @@ class TestOSFFileSystemExists:
 class TestOSFFileSystemLs:
     """Tests for ls() method."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_ls_without_detail(self, mock_client_class):
         """Test ls() without detail returns just paths."""
         mock_client = Mock()
@@ -167,7 +439,7 @@ class TestOSFFileSystemLs:
         assert len(results) == 2
         assert all("osf://abc123" in path for path in results)
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_ls_with_detail(self, mock_client_class):
         """Test ls() with detail returns metadata."""
         mock_client = Mock()
@@ -198,25 +470,27 @@ class TestOSFFileSystemLs:
 class TestOSFFileSystemInfo:
     """Tests for info() method."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_info_file(self, mock_client_class):
         """Test info() returns file metadata."""
         mock_client = Mock()
-        mock_response = Mock()
+        _pages_from_get(mock_client)
         # info() now lists parent directory, so return array
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "attributes": {
-                        "name": "file.csv",
-                        "kind": "file",
-                        "size": 2048,
-                        "date_modified": "2024-01-01",
-                        "extra": {"hashes": {"md5": "def456"}},
+        mock_response = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {
+                            "name": "file.csv",
+                            "kind": "file",
+                            "size": 2048,
+                            "date_modified": "2024-01-01",
+                            "extra": {"hashes": {"md5": "def456"}},
+                        }
                     }
-                }
-            ]
-        }
+                ]
+            }
+        )
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -227,30 +501,84 @@ class TestOSFFileSystemInfo:
         assert info["size"] == 2048
         assert info["checksum"] == "def456"
 
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_info_reuses_parent_listing(self, mock_client_class):
+        """Test that siblings share one listing until the client writes."""
+        mock_client = Mock()
+        _pages_from_get(mock_client)
+        mock_client.cache_generation = 0
+        mock_response = _json_response(
+            {
+                "data": [
+                    {"attributes": {"name": "a.csv", "kind": "file", "size": 1}},
+                    {"attributes": {"name": "b.csv", "kind": "file", "size": 2}},
+                ]
+            }
+        )
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+
+        assert fs.exists(["a.csv", "b.csv", "c.csv"]) == [True, True, False]
+        assert fs.info("b.csv")["size"] == 2
+        assert mock_client.get.call_count == 1
+
+        mock_client.cache_generation = 1
+        fs.info("a.csv")
+        assert mock_client.get.call_count == 2
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_listing_overlapping_write_not_cached(self, mock_client_class):
+        """Test that a listing fetched while a write finished is not kept."""
+        mock_client = Mock()
+        _pages_from_get(mock_client)
+        mock_client.cache_generation = 0
+        listing = _json_response(
+            {"data": [{"attributes": {"name": "a.csv", "kind": "file", "size": 1}}]}
+        )
+
+        def get(url, params=None):
+            # Another thread's write completes while this listing is fetched
+            mock_client.cache_generation += 1
+            return listing
+
+        mock_client.get.side_effect = get
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+
+        assert fs.exists("a.csv")
+        assert not fs._dir_cache
+        assert fs.exists("a.csv")
+        assert mock_client.get.call_count == 2
+
 
 class TestOSFFileSystemOpen:
     """Tests for open() method."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_open_read_binary(self, mock_client_class):
         """Test opening file in binary read mode."""
         mock_client = Mock()
+        _pages_from_get(mock_client)
 
         # Mock responses for info() call (lists parent directory)
-        mock_info_response = Mock()
-        mock_info_response.json.return_value = {
-            "data": [
-                {
-                    "attributes": {
-                        "name": "file.csv",
-                        "kind": "file",
-                        "size": 100,
-                        "extra": {"hashes": {"md5": "test"}},
-                    },
-                    "links": {"upload": "https://files.osf.io/test"},
-                }
-            ]
-        }
+        mock_info_response = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {
+                            "name": "file.csv",
+                            "kind": "file",
+                            "size": 100,
+                            "extra": {"hashes": {"md5": "test"}},
+                        },
+                        "links": {"upload": "https://files.osf.io/test"},
+                    }
+                ]
+            }
+        )
 
         # Mock get to return listing
         mock_client.get.return_value = mock_info_response
@@ -265,14 +593,69 @@ class TestOSFFileSystemOpen:
 
         assert isinstance(f, OSFFile)
         assert f.mode == "rb"
+        # info() and the download link share one parent listing
+        assert mock_client.get.call_count == 1
+        mock_client.download_file.assert_called_once_with("https://files.osf.io/test")
+
+    @patch.object(Config, "CACHE_TTL", 0)
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_open_read_lists_parent_once_without_cache(self, mock_client_class):
+        """Test that metadata and download link come from a single listing."""
+        mock_client = mock_client_class.return_value
+        _pages_from_get(mock_client)
+        mock_client.cache_generation = 0
+        mock_client.get.return_value = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {"name": "file.csv", "kind": "file"},
+                        "links": {"upload": "https://files.osf.io/test"},
+                    }
+                ]
+            }
+        )
+        mock_client.download_file.return_value.iter_content.return_value = iter([])
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        fs.open("file.csv", mode="rb")
+
+        assert mock_client.get.call_count == 1
+        mock_client.download_file.assert_called_once_with("https://files.osf.io/test")
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_open_read_text(self, mock_client_class):
+        """Test that text mode wraps the stream in a TextIOWrapper."""
+        mock_client = Mock()
+        _pages_from_get(mock_client)
+        mock_client.get.return_value = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {"name": "notes.txt", "kind": "file"},
+                        "links": {"upload": "https://files.osf.io/test"},
+                    }
+                ]
+            }
+        )
+        mock_stream_response = Mock()
+        mock_stream_response.iter_content.return_value = iter([b"a\r\nb", b"\n"])
+        mock_client.download_file.return_value = mock_stream_response
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        f = fs.open("notes.txt", mode="r")
+
+        assert isinstance(f, io.TextIOWrapper)
+        assert f.mode == "r"
+        assert f.readlines() == ["a\n", "b\n"]
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_open_write_mode_returns_write_file(self, mock_client_class):
         """Test that write mode returns OSFWriteFile."""
         mock_client = Mock()
+        _pages_from_get(mock_client)
         # Return an empty directory listing so _get_upload_url terminates
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": [], "links": {"next": None}}
+        mock_response = _json_response({"data": [], "links": {"next": None}})
         mock_client.get.return_value = mock_response
         # get_paginated used by ls/navigate helpers
         mock_client.get_paginated.return_value = iter([])
@@ -285,7 +668,38 @@ class TestOSFFileSystemOpen:
         assert file_obj is not None
         assert hasattr(file_obj, "write")
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_upload_url_from_cached_listing(self, mock_client_class):
+        """Test that upload URLs come from the cached parent listing."""
+        mock_client = Mock()
+        _pages_from_get(mock_client)
+        mock_client.get.return_value = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {"name": "file.csv", "kind": "file"},
+                        "links": {"upload": "https://files.osf.io/existing"},
+                    }
+                ],
+                "links": {"next": None},
+            }
+        )
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        fs.info("file.csv")
+
+        assert (
+            fs._get_upload_url("abc123", "osfstorage", "file.csv")
+            == "https://files.osf.io/existing"
+        )
+        assert fs._get_upload_url("abc123", "osfstorage", "new.csv") == (
+            "https://files.osf.io/v1/resources/abc123/providers/osfstorage"
+            "/?kind=file&name=new.csv"
+        )
+        assert mock_client.get.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_open_append_raises(self, mock_client_class):
         """Test that append mode raises NotImplementedError."""
         fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
@@ -298,60 +712,92 @@ class TestOSFFileSystemGetFile:
     """Tests for get_file() method."""
 
     @patch("dvc_osf.filesystem.OSFFileSystem.open")
-    @patch("dvc_osf.filesystem.OSFFileSystem.info")
-    @patch("builtins.open", new_callable=lambda: Mock(side_effect=open))
-    def test_get_file_success(self, mock_builtin_open, mock_info, mock_open):
-        """Test successful file download with checksum verification."""
-        # Mock file info with checksum
-        mock_info.return_value = {
-            "checksum": "5d41402abc4b2a76b9719d911017c592",  # MD5 of "hello"
-        }
-
-        # Mock file read
+    def test_get_file_success(self, mock_open, tmp_path):
+        """Test that the remote stream is written to the local path."""
         mock_file = Mock()
-        mock_file.read.side_effect = [b"hello", b""]
+        mock_file.read1.side_effect = [b"hello", b""]
         mock_open.return_value.__enter__.return_value = mock_file
+        local_path = tmp_path / "sub" / "test.txt"
 
-        import os
-        import tempfile
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        fs.get_file("remote.txt", str(local_path))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            local_path = os.path.join(tmpdir, "test.txt")
+        mock_open.assert_called_once_with("remote.txt", mode="rb")
+        assert local_path.read_bytes() == b"hello"
 
-            fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
-            fs.get_file("remote.txt", local_path)
+    @patch("dvc_osf.filesystem.OSFFileSystem.open")
+    def test_get_file_without_checksum_copies_raw_stream(self, mock_open, tmp_path):
+        """Test that unverifiable downloads bypass the chunk iterator."""
+        mock_file = Mock(expected_checksum=None)
+        mock_file.response.raw = io.BytesIO(b"raw body")
+        mock_open.return_value.__enter__.return_value = mock_file
+        local_path = tmp_path / "test.txt"
 
-            # File should be created
-            mock_open.assert_called()
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        fs.get_file("remote.txt", str(local_path))
 
-    @patch("dvc_osf.filesystem.OSFFileSystem.open")
-    @patch("dvc_osf.filesystem.OSFFileSystem.info")
-    @patch("builtins.open", new_callable=lambda: Mock(side_effect=open))
-    @patch("os.remove")
-    def test_get_file_checksum_mismatch(
-        self, mock_remove, mock_builtin_open, mock_info, mock_open
-    ):
-        """Test that checksum mismatch raises OSFIntegrityError."""
-        # Mock file info with wrong checksum
-        mock_info.return_value = {
-            "checksum": "wrong_checksum",
-        }
+        assert local_path.read_bytes() == b"raw body"
+        assert mock_file.response.raw.decode_content is True
+        mock_file.read1.assert_not_called()
 
-        # Mock file read
+    @patch("dvc_osf.filesystem.OSFFileSystem.open")
+    def test_get_file_checksum_mismatch(self, mock_open, tmp_path):
+        """Test that checksum mismatch raises and removes the local file."""
         mock_file = Mock()
-        mock_file.read.side_effect = [b"hello", b""]
+        mock_file.read1.side_effect = [
+            b"hello",
+            OSFIntegrityError(
+                "Checksum mismatch: expected wrong, got 5d41",
+                expected_checksum="wrong",
+                actual_checksum="5d41",
+            ),
+        ]
         mock_open.return_value.__enter__.return_value = mock_file
+        local_path = tmp_path / "test.txt"
 
-        import os
-        import tempfile
+        fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+
+        with pytest.raises(OSFIntegrityError, match="Checksum mismatch for remote"):
+            fs.get_file("remote.txt", str(local_path))
+        assert not local_path.exists()
+
+
+class TestCopyWithWriterThread:
+    """Tests for the background-writer copy used by get_file()."""
+
+    def test_copies_all_chunks_in_order(self):
+        """Test that every chunk reaches the destination in order."""
+        src = io.BytesIO(bytes(range(256)) * 40)
+        dst = io.BytesIO()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            local_path = os.path.join(tmpdir, "test.txt")
+        _copy_with_writer_thread(src, dst, chunk_size=100, depth=2)
 
-            fs = OSFFileSystem("osf://abc123/osfstorage", token="test_token")
+        assert dst.getvalue() == bytes(range(256)) * 40
 
-            with pytest.raises(OSFIntegrityError, match="Checksum mismatch"):
-                fs.get_file("remote.txt", local_path)
+    def test_passes_osf_file_chunks_through_whole(self):
+        """Test that downloaded chunks reach the writer without being copied."""
+        chunks = [b"a" * 10, b"b" * 7]
+        response = Mock()
+        response.iter_content.return_value = iter(chunks)
+        written = []
+        dst = Mock()
+        dst.write.side_effect = written.append
+
+        _copy_with_writer_thread(OSFFile(response, mode="rb", chunk_size=10), dst, 10)
+
+        assert [w is c for w, c in zip(written, chunks)] == [True, True]
+
+    def test_write_error_stops_reading_and_raises(self):
+        """Test that a failed local write surfaces and ends the copy."""
+        src = Mock()
+        src.read1.return_value = b"x" * 10
+        dst = Mock()
+        dst.write.side_effect = OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            _copy_with_writer_thread(src, dst, chunk_size=10, depth=2)
+
+        dst.write.assert_called_once()
 
 
 class TestOSFFileSystemStripProtocol:
@@ -383,18 +829,107 @@ class TestExistsBatchAPI:
 
     def test_exists_with_list_returns_list_of_bools(self, mock_osf_filesystem):
         """dvc-objects calls fs.exists(paths, batch_size=N) with a list."""
-        with patch.object(mock_osf_filesystem, "info") as mock_info:
-            mock_info.side_effect = [
-                {"name": "a"},  # first path exists
-                OSFNotFoundError("not found"),  # second path does not
-            ]
+        listing = _DirListing({"a.txt": {"name": "a"}}, {}, "")
+
+        with patch.object(mock_osf_filesystem, "_list_dir", return_value=listing):
             result = mock_osf_filesystem.exists(["osf://abc/a.txt", "osf://abc/b.txt"])
         assert result == [True, False]
 
+    def test_exists_many_lists_each_parent_once(self, mock_osf_filesystem):
+        """Paths sharing a parent are answered from a single listing."""
+        listings = {
+            "ab": _DirListing({"cdef": {}, "0123": {}}, {}, ""),
+            "cd": _DirListing({"4567": {}}, {}, ""),
+        }
+
+        def list_dir(project_id, provider, dir_path):
+            if dir_path not in listings:
+                raise OSFNotFoundError("not found")
+            return listings[dir_path]
+
+        paths = [
+            "ab/cdef",
+            "ab/0123",
+            "ab/9999",
+            "cd/4567",
+            "ef/0000",
+            "",
+        ]
+        with patch.object(
+            mock_osf_filesystem, "_list_dir", side_effect=list_dir
+        ) as mock_list:
+            result = mock_osf_filesystem.exists_many(paths)
+
+        assert result == {
+            "ab/cdef": True,
+            "ab/0123": True,
+            "ab/9999": False,
+            "cd/4567": True,
+            "ef/0000": False,
+            "": True,
+        }
+        assert sorted(c.args[2] for c in mock_list.call_args_list) == [
+            "ab",
+            "cd",
+            "ef",
+        ]
+
+    @patch("dvc_osf.api.requests.Session.request")
+    def test_exists_many_pages_listings_concurrently(self, mock_request):
+        """Multi-page listings of different parents fetch later pages in parallel."""
+        # Both second pages must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def request(method, url, **kwargs):
+            if url.endswith("?page=2"):
+                barrier.wait()
+                return _json_response({"data": [], "links": {}})
+            name = url.rsplit("/", 1)[-1]
+            return _json_response(
+                {
+                    "data": [{"attributes": {"name": f"{name}.txt", "kind": "file"}}],
+                    "links": {"next": f"{url}?page=2"},
+                }
+            )
+
+        mock_request.side_effect = request
+        fs = OSFFileSystem(token="test_token", connection_pool_size=4)
+
+        def navigate(project_id, provider, dir_path, create_missing=False):
+            return f"https://api.osf.io/v2/{dir_path}", ""
+
+        with patch.object(fs, "_navigate_to_dir", side_effect=navigate):
+            result = fs.exists_many(["abc/osfstorage/d1/d1.txt", "abc/osfstorage/d2/x"])
+
+        assert result == {
+            "abc/osfstorage/d1/d1.txt": True,
+            "abc/osfstorage/d2/x": False,
+        }
+        fs.close()
+
     def test_exists_with_empty_list(self, mock_osf_filesystem):
         """Empty list returns empty list."""
         assert mock_osf_filesystem.exists([]) == []
 
+    def test_info_with_list_preserves_order_and_exceptions(self, mock_osf_filesystem):
+        """dvc-objects calls fs.info(paths, return_exceptions=True) with a list."""
+        missing = OSFNotFoundError("not found")
+        original = OSFFileSystem.info
+
+        def info(self, path, **kwargs):
+            # Lists go through the real fan-out; single paths are stubbed
+            if isinstance(path, list):
+                return original(self, path, **kwargs)
+            if path == "c.txt":
+                raise missing
+            return {"name": path}
+
+        with patch.object(OSFFileSystem, "info", info):
+            result = mock_osf_filesystem.info(
+                ["a.txt", "b.txt", "c.txt"], batch_size=2, return_exceptions=True
+            )
+        assert result == [{"name": "a.txt"}, {"name": "b.txt"}, missing]
+
 
 class TestOSFWriteFile:
     """Tests for OSFWriteFile class."""
@@ -531,11 +1066,58 @@ class TestOSFWriteFile:
         call_args = mock_client.upload_file.call_args
         assert call_args[1]["total_size"] == 11  # "hello world"
 
+    def test_buffer_reused_across_files(self):
+        """Test that a closed file's buffer is pooled without leaking data."""
+        from dvc_osf.filesystem import OSFWriteFile
+
+        uploads = []
+        mock_client = Mock()
+        mock_client.upload_file.side_effect = lambda url, f, **kw: uploads.append(
+            f.read()
+        )
+
+        first = OSFWriteFile(mock_client, "https://upload.url", mode="wb")
+        first.write(b"longer payload")
+        buffer = first._buffer
+        first.close()
+
+        second = OSFWriteFile(mock_client, "https://upload.url", mode="wb")
+        assert second._buffer is buffer
+        second.write(b"short")
+        second.close()
+
+        assert uploads == [b"longer payload", b"short"]
+        assert mock_client.upload_file.call_args[1]["total_size"] == 5
+
+    def test_large_write_spills_to_temp_file(self):
+        """Test that writes past chunk_size are buffered on disk."""
+        from dvc_osf.filesystem import OSFWriteFile
+
+        uploads = []
+        mock_client = Mock()
+        mock_client.upload_file.side_effect = lambda url, f, **kw: uploads.append(
+            (f.read(), f)
+        )
+
+        write_file = OSFWriteFile(
+            mock_client, "https://upload.url", mode="wb", chunk_size=8
+        )
+        write_file.write(b"hello ")
+        assert write_file._spill is None
+        write_file.write(b"world")
+        assert write_file._spill is not None
+        write_file.close()
+
+        data, uploaded = uploads[0]
+        assert data == b"hello world"
+        assert uploaded.closed
+        assert mock_client.upload_file.call_args[1]["total_size"] == 11
+
 
 class TestOSFFileSystemWriteMethods:
     """Tests for OSFFileSystem write methods."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     @patch("dvc_osf.filesystem.OSFFileSystem._verify_upload_checksum")
     def test_put_file_callback_validation(self, mock_verify, mock_client_class):
         """Test put_file accepts non-callable callbacks without raising.
@@ -544,8 +1126,8 @@ class TestOSFFileSystemWriteMethods:
         put_file must not reject them; call-sites guard with callable().
         """
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": [], "links": {"next": None}}
+        _pages_from_get(mock_client)
+        mock_response = _json_response({"data": [], "links": {"next": None}})
         mock_client.get.return_value = mock_response
         mock_client.get_paginated.return_value = iter([])
         mock_client.upload_file.return_value = None
@@ -572,7 +1154,7 @@ class TestOSFFileSystemWriteMethods:
             os.unlink(tmp_path)
 
     @patch("dvc_osf.filesystem.OSFFileSystem._verify_upload_checksum")
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_put_callback_validation(self, mock_client_class, mock_verify):
         """Test put accepts non-callable callbacks without raising.
 
@@ -582,8 +1164,9 @@ class TestOSFFileSystemWriteMethods:
         import tempfile
 
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": [], "links": {"next": None}}
+
+        _pages_from_get(mock_client)
+        mock_response = _json_response({"data": [], "links": {"next": None}})
         mock_client.get.return_value = mock_response
         mock_client.get_paginated.return_value = iter([])
         mock_client.upload_file.return_value = None
@@ -606,7 +1189,7 @@ class TestOSFFileSystemWriteMethods:
 
             os.unlink(tmp_path)
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     @patch("dvc_osf.filesystem.OSFFileSystem._verify_upload_checksum")
     @patch("os.path.getsize")
     @patch("builtins.open")
@@ -625,10 +1208,10 @@ class TestOSFFileSystemWriteMethods:
 
         # Mock client
         mock_client = Mock()
+        _pages_from_get(mock_client)
 
         # Mock response for checking if file exists
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response = _json_response({"data": []})
         mock_client.get.return_value = mock_response
         mock_client.upload_file.return_value = None
         mock_client_class.return_value = mock_client
@@ -642,7 +1225,7 @@ class TestOSFFileSystemWriteMethods:
         # Verify upload was called
         mock_client.upload_file.assert_called_once()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     @patch("dvc_osf.filesystem.OSFFileSystem._verify_upload_checksum")
     @patch("os.path.getsize")
     @patch("builtins.open")
@@ -661,10 +1244,10 @@ class TestOSFFileSystemWriteMethods:
 
         # Mock client
         mock_client = Mock()
+        _pages_from_get(mock_client)
 
         # Mock response for checking if file exists
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response = _json_response({"data": []})
         mock_client.get.return_value = mock_response
         mock_client.upload_file.return_value = None
         mock_client_class.return_value = mock_client
@@ -678,17 +1261,17 @@ class TestOSFFileSystemWriteMethods:
         # Verify upload was called
         mock_client.upload_file.assert_called_once()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_put_with_file_object(self, mock_client_class):
         """Test put with file-like object."""
         import io
 
         # Mock client
         mock_client = Mock()
+        _pages_from_get(mock_client)
 
         # Mock response for checking if file exists
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response = _json_response({"data": []})
         mock_client.get.return_value = mock_response
         mock_client.upload_file.return_value = None
         mock_client_class.return_value = mock_client
@@ -701,17 +1284,73 @@ class TestOSFFileSystemWriteMethods:
         # Verify upload was called
         mock_client.upload_file.assert_called_once()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_put_file_object_detects_checksum_mismatch(self, mock_client_class):
+        """Test put compares the MD5 of the streamed body with the server's."""
+
+        def _upload(url, f, callback, size):
+            assert f.read() == b"hello"
+            return _json_response({"data": {"attributes": {"md5": "0" * 32}}})
+
+        mock_client = mock_client_class.return_value
+
+        _pages_from_get(mock_client)
+        mock_client.cache_generation = 0
+        mock_client.get.return_value = _json_response(
+            {"data": [], "links": {"next": None}}
+        )
+        mock_client.upload_file.side_effect = _upload
+
+        fs = OSFFileSystem(token="test_token")
+        with pytest.raises(OSFIntegrityError) as exc_info:
+            fs.put(io.BytesIO(b"hello"), "osf://abc123/osfstorage/data.bin")
+
+        assert exc_info.value.expected_checksum == "5d41402abc4b2a76b9719d911017c592"
+        # Only the upload URL lookup lists the parent; no info() afterwards
+        assert mock_client.get.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_put_spools_unseekable_file_object(self, mock_client_class):
+        """Test put learns the size of a pipe-like object by spooling it."""
+
+        class _Pipe(io.RawIOBase):
+            def __init__(self, data):
+                self._data = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                return self._data.readinto(b)
+
+        uploaded = []
+
+        def _upload(url, f, callback, size):
+            uploaded.append((f.read(), size))
+
+        mock_client = mock_client_class.return_value
+        mock_client.cache_generation = 0
+        mock_client.get.return_value = _json_response(
+            {"data": [], "links": {"next": None}}
+        )
+        mock_client.upload_file.side_effect = _upload
+
+        fs = OSFFileSystem(token="test_token")
+        fs.put(_Pipe(b"streamed"), "osf://abc123/osfstorage/data.bin")
+
+        assert uploaded == [(b"streamed", 8)]
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_put_with_callback(self, mock_client_class):
         """Test put with progress callback."""
         import io
 
         # Mock client
         mock_client = Mock()
+        _pages_from_get(mock_client)
 
         # Mock response for checking if file exists
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response = _json_response({"data": []})
         mock_client.get.return_value = mock_response
         mock_client.upload_file.return_value = None
         mock_client_class.return_value = mock_client
@@ -729,7 +1368,129 @@ class TestOSFFileSystemWriteMethods:
             callback in call_args.args or call_args.kwargs.get("callback") == callback
         )
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
+    @patch("dvc_osf.filesystem.compute_upload_checksum")
+    def test_put_file_hashes_while_uploading(
+        self, mock_checksum, mock_client_class, tmp_path
+    ):
+        """Test put_file verifies the upload without re-reading the file."""
+        lpath = tmp_path / "data.bin"
+        lpath.write_bytes(b"hello")
+
+        def _upload(url, f, callback, size):
+            # Simulate a retried request re-reading part of the body
+            f.read(2)
+            f.seek(0)
+            assert f.read() == b"hello"
+            return _json_response(
+                {
+                    "data": {
+                        "attributes": {
+                            "extra": {
+                                "hashes": {"md5": "5d41402abc4b2a76b9719d911017c592"}
+                            }
+                        }
+                    }
+                }
+            )
+
+        mock_client = Mock()
+
+        _pages_from_get(mock_client)
+        mock_client.get.return_value = _json_response(
+            {"data": [], "links": {"next": None}}
+        )
+        mock_client.upload_file.side_effect = _upload
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem(token="test_token")
+        fs.put_file(str(lpath), "osf://abc123/osfstorage/data.bin")
+
+        mock_checksum.assert_not_called()
+        # Only the upload URL lookup lists the parent; no info() afterwards
+        assert mock_client.get.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_put_file_detects_checksum_mismatch(self, mock_client_class, tmp_path):
+        """Test put_file compares the streamed MD5 with the server's."""
+        lpath = tmp_path / "data.bin"
+        lpath.write_bytes(b"hello")
+
+        def _upload(url, f, callback, size):
+            f.read()
+            return _json_response({"data": {"attributes": {"md5": "0" * 32}}})
+
+        mock_client = Mock()
+
+        _pages_from_get(mock_client)
+        mock_client.get.return_value = _json_response(
+            {"data": [], "links": {"next": None}}
+        )
+        mock_client.upload_file.side_effect = _upload
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem(token="test_token")
+        with pytest.raises(OSFIntegrityError) as exc_info:
+            fs.put_file(str(lpath), "osf://abc123/osfstorage/data.bin")
+
+        assert exc_info.value.expected_checksum == "5d41402abc4b2a76b9719d911017c592"
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    @patch("dvc_osf.filesystem.OSFFileSystem.put_file")
+    def test_put_many_uploads_each_pair(self, mock_put_file, mock_client_class):
+        """Test put_many uploads every file and reports progress."""
+        pairs = [(f"/tmp/{i}", f"osf://abc123/osfstorage/{i}") for i in range(5)]
+        progress = []
+
+        fs = OSFFileSystem(token="test_token")
+        fs.put_many(pairs, max_workers=3, callback=lambda d, t: progress.append(d))
+
+        assert sorted(c.args for c in mock_put_file.call_args_list) == pairs
+        assert progress == [1, 2, 3, 4, 5]
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    @patch("dvc_osf.filesystem.OSFFileSystem.put_file")
+    def test_put_many_raises_first_error(self, mock_put_file, mock_client_class):
+        """Test put_many propagates upload failures."""
+        mock_put_file.side_effect = OSFNotFoundError("gone")
+        pairs = [("/tmp/a", "osf://abc123/osfstorage/a")] * 3
+
+        fs = OSFFileSystem(token="test_token")
+        with pytest.raises(OSFNotFoundError):
+            fs.put_many(pairs)
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    @patch("dvc_osf.filesystem.OSFFileSystem.get_file")
+    def test_get_many_downloads_each_pair(self, mock_get_file, mock_client_class):
+        """Test get_many downloads every file and reports progress."""
+        pairs = [(f"osf://abc123/osfstorage/{i}", f"/tmp/{i}") for i in range(4)]
+        progress = []
+
+        fs = OSFFileSystem(token="test_token")
+        fs.get_many(pairs, callback=lambda d, t: progress.append((d, t)))
+
+        assert sorted(c.args for c in mock_get_file.call_args_list) == pairs
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    @patch("dvc_osf.filesystem.OSFFileSystem.put_file")
+    def test_put_local_paths_uses_put_many(self, mock_put_file, mock_client_class):
+        """Test DVC-style put() of path lists with an fsspec callback."""
+        callback = Mock(spec=["set_size", "relative_update"])
+
+        fs = OSFFileSystem(token="test_token")
+        fs.put(
+            ["/tmp/a", "/tmp/b"],
+            ["osf://abc123/osfstorage/a", "osf://abc123/osfstorage/b"],
+            callback=callback,
+            batch_size=2,
+        )
+
+        assert mock_put_file.call_count == 2
+        callback.set_size.assert_called_once_with(2)
+        assert callback.relative_update.call_count == 2
+
+    @patch("dvc_osf.api.OSFAPIClient")
     @patch("dvc_osf.filesystem.OSFFileSystem.info")
     def test_rm_file(self, mock_info, mock_client_class):
         """Test rm deletes file."""
@@ -741,17 +1502,19 @@ class TestOSFFileSystemWriteMethods:
 
         # Mock client
         mock_client = Mock()
+        _pages_from_get(mock_client)
 
         # Mock the response for checking if file exists (in _get_delete_link)
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "attributes": {"name": "file.txt"},
-                    "links": {"delete": "https://files.osf.io/delete"},
-                }
-            ]
-        }
+        mock_response = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {"name": "file.txt"},
+                        "links": {"delete": "https://files.osf.io/delete"},
+                    }
+                ]
+            }
+        )
         mock_client.get.return_value = mock_response
         mock_client.delete.return_value = None
         mock_client_class.return_value = mock_client
@@ -762,7 +1525,68 @@ class TestOSFFileSystemWriteMethods:
         # Verify delete was called
         mock_client.delete.assert_called_once()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_rm_looks_up_siblings_by_name(self, mock_client_class):
+        """Test rm of several siblings resolves each from the parent listing."""
+        mock_client = Mock()
+        _pages_from_get(mock_client)
+        mock_client.get.return_value = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {"name": name, "kind": "file"},
+                        "links": {"delete": f"https://files.osf.io/{name}"},
+                    }
+                    for name in ("a.txt", "b.txt", "c.txt")
+                ],
+                "links": {"next": None},
+            }
+        )
+        mock_client.delete_many.side_effect = lambda urls: [(u, None) for u in urls]
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem(token="test_token")
+        fs.rm(
+            [
+                "osf://abc123/osfstorage/c.txt",
+                "osf://abc123/osfstorage/a.txt",
+                "osf://abc123/osfstorage/missing.txt",
+            ]
+        )
+
+        mock_client.delete_many.assert_called_once_with(
+            ["https://files.osf.io/c.txt", "https://files.osf.io/a.txt"]
+        )
+        assert mock_client.get.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_rm_many_raises_first_failure(self, mock_client_class):
+        """Test that a failed delete in a batch is raised after the others."""
+        mock_client = Mock()
+        _pages_from_get(mock_client)
+        mock_client.get.return_value = _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {"name": name, "kind": "file"},
+                        "links": {"delete": f"https://files.osf.io/{name}"},
+                    }
+                    for name in ("a.txt", "b.txt")
+                ]
+            }
+        )
+        denied = OSFAPIError("Denied", status_code=400)
+        mock_client.delete_many.return_value = [
+            ("https://files.osf.io/a.txt", denied),
+            ("https://files.osf.io/b.txt", None),
+        ]
+        mock_client_class.return_value = mock_client
+
+        fs = OSFFileSystem(token="test_token")
+        with pytest.raises(OSFAPIError, match="Denied"):
+            fs.rm(["osf://abc123/osfstorage/a.txt", "osf://abc123/osfstorage/b.txt"])
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_rm_recursive_is_complex(self, mock_client_class):
         """Test that rm recursive is too complex for simple unit test - use integration tests."""
         # Recursive deletion is complex and involves multiple API calls
@@ -775,7 +1599,7 @@ class TestOSFFileSystemWriteMethods:
         assert hasattr(fs, "rm")
         assert callable(fs.rm)
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_mkdir_is_noop(self, mock_client_class):
         """Test mkdir is a no-op."""
         fs = OSFFileSystem(token="test_token")
@@ -788,7 +1612,7 @@ class TestOSFFileSystemWriteMethods:
         mock_client.get.assert_not_called()
         mock_client.put.assert_not_called()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_rmdir_is_noop(self, mock_client_class):
         """Test rmdir is a no-op."""
         fs = OSFFileSystem(token="test_token")
@@ -801,9 +1625,12 @@ class TestOSFFileSystemWriteMethods:
         mock_client.get.assert_not_called()
         mock_client.delete.assert_not_called()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_open_write_mode_not_implemented(self, mock_client_class):
         """Test open with write mode returns OSFWriteFile."""
+        mock_client_class.return_value.get.return_value = _json_response(
+            {"data": [], "links": {"next": None}}
+        )
         fs = OSFFileSystem(token="test_token")
 
         # Write modes should return OSFWriteFile (or raise NotImplementedError for now)
@@ -817,7 +1644,7 @@ class TestOSFFileSystemWriteMethods:
             # Also acceptable if not yet fully implemented
             pass
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_open_append_mode_raises(self, mock_client_class):
         """Test open with append mode raises NotImplementedError."""
         fs = OSFFileSystem(token="test_token")
@@ -825,7 +1652,7 @@ class TestOSFFileSystemWriteMethods:
         with pytest.raises(NotImplementedError):
             fs.open("osf://abc123/osfstorage/test.txt", mode="a")
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_open_read_write_mode_raises(self, mock_client_class):
         """Test open with read-write mode raises NotImplementedError."""
         fs = OSFFileSystem(token="test_token")
@@ -837,48 +1664,217 @@ class TestOSFFileSystemWriteMethods:
 class TestCopyOperations:
     """Tests for cp() method."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
-    @patch("dvc_osf.filesystem.tempfile.mkstemp")
-    @patch("os.path.exists")
-    @patch("os.remove")
-    @patch("os.close")
-    def test_cp_single_file(
-        self, mock_close, mock_remove, mock_exists, mock_mkstemp, mock_client_class
+    @patch.object(OSFFileSystem, "_server_side_copy", return_value=None)
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_single_file(self, mock_client_class, mock_server_copy):
+        """Test copying a single file by download and re-upload."""
+        fs = OSFFileSystem(token="test_token")
+
+        def download(rpath, fileobj):
+            fileobj.write(b"data")
+
+        with patch.object(
+            fs, "info", return_value={"type": "file", "checksum": "abc123"}
+        ), patch.object(fs, "exists", return_value=False), patch.object(
+            fs, "_download_to_fileobj", side_effect=download
+        ) as mock_download, patch.object(
+            fs, "_upload_fileobj", return_value=("abc123", "abc123")
+        ) as mock_upload, patch(
+            "dvc_osf.filesystem.tempfile.mkstemp"
+        ) as mock_mkstemp:
+            fs.cp(
+                "osf://abc123/osfstorage/source.txt",
+                "osf://abc123/osfstorage/dest.txt",
+            )
+
+        mock_download.assert_called_once()
+        _, rpath, size = mock_upload.call_args.args
+        assert rpath == "osf://abc123/osfstorage/dest.txt"
+        assert size == 4
+        # Small files stay in memory
+        mock_mkstemp.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_upload_fileobj_sends_whole_buffer(self, mock_client_class):
+        """Test that _upload_fileobj rewinds and uploads the buffer."""
+        mock_client = mock_client_class.return_value
+        mock_client.upload_file.side_effect = lambda url, f, cb, size: (
+            _json_response(
+                {
+                    "data": {
+                        "attributes": {
+                            "extra": {
+                                "hashes": {"md5": hashlib.md5(f.read()).hexdigest()}
+                            }
+                        }
+                    }
+                }
+            )
+        )
+        fs = OSFFileSystem(token="test_token")
+        buf = io.BytesIO(b"payload")
+        buf.seek(0, io.SEEK_END)
+
+        with patch.object(fs, "_get_upload_url", return_value="https://upload.url"):
+            md5s = fs._upload_fileobj(buf, "osf://abc123/osfstorage/dest.txt", 7)
+
+        expected = hashlib.md5(b"payload").hexdigest()
+        assert md5s == (expected, expected)
+
+    @patch.object(OSFFileSystem, "_server_side_copy", return_value=None)
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_verifies_with_streamed_hash(self, mock_client_class, mock_server_copy):
+        """Test that the hash of the bytes sent replaces a destination info()."""
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(
+            fs, "info", return_value={"type": "file", "checksum": "abc123"}
+        ) as mock_info, patch.object(fs, "_download_to_fileobj"), patch.object(
+            fs, "_upload_fileobj", return_value=(None, "abc123")
+        ):
+            verified = fs.cp(
+                "osf://abc123/osfstorage/source.txt",
+                "osf://abc123/osfstorage/dest.txt",
+            )
+
+        # Only the source was looked up
+        mock_info.assert_called_once_with("osf://abc123/osfstorage/source.txt")
+        assert verified == "abc123"
+
+    @patch.object(OSFFileSystem, "_server_side_copy", return_value=None)
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_without_checksum_reports_unverified(
+        self, mock_client_class, mock_server_copy
     ):
-        """Test copying a single file."""
-        # Setup mocks
-        mock_mkstemp.return_value = (42, "/tmp/test_temp")
-        mock_exists.return_value = True
+        """Test that cp returns None when there was no checksum to verify."""
+        fs = OSFFileSystem(token="test_token")
 
-        mock_client = mock_client_class.return_value  # noqa: F841
+        with patch.object(fs, "info", return_value={"type": "file"}), patch.object(
+            fs, "_download_to_fileobj"
+        ), patch.object(fs, "_upload_fileobj", return_value=(None, "abc123")):
+            verified = fs.cp(
+                "osf://abc123/osfstorage/source.txt",
+                "osf://abc123/osfstorage/dest.txt",
+            )
+
+        assert verified is None
+
+    @staticmethod
+    def _root_listing():
+        """Root listing holding source.txt with a WaterButler move link."""
+        return _json_response(
+            {
+                "data": [
+                    {
+                        "attributes": {
+                            "name": "source.txt",
+                            "kind": "file",
+                            "extra": {"hashes": {"md5": "abc123"}},
+                        },
+                        "links": {"move": "https://files.osf.io/v1/src"},
+                    }
+                ]
+            }
+        )
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_server_side(self, mock_client_class):
+        """Test that cp copies through WaterButler without moving bytes."""
+        mock_client = mock_client_class.return_value
+        _pages_from_get(mock_client)
+        mock_client.cache_generation = 0
+        mock_client.get.return_value = self._root_listing()
+        mock_client.post.return_value = _json_response(
+            {"data": {"attributes": {"extra": {"hashes": {"md5": "abc123"}}}}}
+        )
         fs = OSFFileSystem(token="test_token")
 
-        # Mock info() to return file metadata
-        with patch.object(fs, "info") as mock_info:
-            mock_info.side_effect = [
-                {"type": "file", "checksum": "abc123"},  # Source info
-                {"type": "file", "checksum": "abc123"},  # Dest info after copy
-            ]
+        with patch.object(fs, "get_file") as mock_get, patch.object(
+            fs, "put_file"
+        ) as mock_put:
+            fs.cp(
+                "osf://abc123/osfstorage/source.txt",
+                "osf://abc123/osfstorage/dest.txt",
+            )
 
-            # Mock get_file and put_file
-            with patch.object(fs, "get_file") as mock_get, patch.object(
-                fs, "put_file"
-            ) as mock_put, patch.object(fs, "exists") as mock_exists_check:
-                mock_exists_check.return_value = False  # Destination doesn't exist
+        mock_client.post.assert_called_once_with(
+            "https://files.osf.io/v1/src",
+            json={
+                "action": "copy",
+                "path": "/",
+                "provider": "osfstorage",
+                "resource": "abc123",
+                "rename": "dest.txt",
+                "conflict": "replace",
+            },
+        )
+        mock_get.assert_not_called()
+        mock_put.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_server_side_conflict(self, mock_client_class):
+        """Test that a 409 from the copy action is a destination conflict."""
+        mock_client = mock_client_class.return_value
+        _pages_from_get(mock_client)
+        mock_client.cache_generation = 0
+        mock_client.get.return_value = self._root_listing()
+        mock_client.post.side_effect = OSFVersionConflictError("conflict")
+        fs = OSFFileSystem(token="test_token")
 
-                # Execute copy
+        with patch.object(fs, "exists", return_value=False):
+            with pytest.raises(OSFConflictError, match="Destination exists"):
                 fs.cp(
                     "osf://abc123/osfstorage/source.txt",
                     "osf://abc123/osfstorage/dest.txt",
+                    overwrite=False,
                 )
 
-                # Verify calls
-                mock_get.assert_called_once()
-                mock_put.assert_called_once()
-                mock_close.assert_called_once_with(42)
-                mock_remove.assert_called_once_with("/tmp/test_temp")
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_falls_back_when_copy_rejected(self, mock_client_class):
+        """Test that an API error from the copy action falls back to re-upload."""
+        mock_client = mock_client_class.return_value
+        mock_client.cache_generation = 0
+        mock_client.get.return_value = self._root_listing()
+        mock_client.post.side_effect = OSFAPIError("Not supported", status_code=501)
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(
+            fs, "_copy_via_download", return_value="abc123"
+        ) as mock_copy, patch.object(
+            fs, "info", return_value={"type": "file", "checksum": "abc123"}
+        ):
+            fs.cp(
+                "osf://abc123/osfstorage/source.txt",
+                "osf://abc123/osfstorage/dest.txt",
+            )
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+        mock_copy.assert_called_once_with(
+            "osf://abc123/osfstorage/source.txt", "osf://abc123/osfstorage/dest.txt"
+        )
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_copy_via_download_reuses_buffer(self, mock_client_class):
+        """Test that consecutive fallback copies share one pooled buffer."""
+        fs = OSFFileSystem(token="test_token")
+        used = []
+
+        def upload(buf, rpath, size):
+            buf.seek(0)
+            used.append((buf, buf.read(size)))
+            return None, "local-md5"
+
+        with patch.object(
+            fs, "_download_to_fileobj", side_effect=lambda p, f: f.write(p.encode())
+        ), patch.object(fs, "_upload_fileobj", side_effect=upload):
+            assert fs._copy_via_download("osf://abc/a1.txt", "osf://abc/b") == (
+                "local-md5"
+            )
+            fs._copy_via_download("osf://abc/a2", "osf://abc/c")
+
+        assert used[0][0] is used[1][0]
+        assert [data for _, data in used] == [b"osf://abc/a1.txt", b"osf://abc/a2"]
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_cp_file_not_found(self, mock_client_class):
         """Test cp raises OSFNotFoundError if source doesn't exist."""
         fs = OSFFileSystem(token="test_token")
@@ -892,7 +1888,7 @@ class TestCopyOperations:
                     "osf://abc123/osfstorage/dest.txt",
                 )
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_cp_destination_exists_no_overwrite(self, mock_client_class):
         """Test cp raises OSFConflictError if destination exists and overwrite=False."""
         fs = OSFFileSystem(token="test_token")
@@ -910,27 +1906,19 @@ class TestCopyOperations:
                     overwrite=False,
                 )
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
-    @patch("dvc_osf.filesystem.tempfile.mkstemp")
-    @patch("os.path.exists")
-    @patch("os.remove")
-    @patch("os.close")
+    @patch.object(OSFFileSystem, "_server_side_copy", return_value=None)
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_cp_destination_exists_with_overwrite(
-        self, mock_close, mock_remove, mock_exists_os, mock_mkstemp, mock_client_class
+        self, mock_client_class, mock_server_copy
     ):
         """Test cp succeeds if destination exists and overwrite=True."""
-        mock_mkstemp.return_value = (42, "/tmp/test_temp")
-        mock_exists_os.return_value = True
-
         fs = OSFFileSystem(token="test_token")
 
         with patch.object(fs, "info") as mock_info, patch.object(
             fs, "exists"
-        ) as mock_exists, patch.object(
-            fs, "get_file"
-        ) as mock_get, patch.object(  # noqa: F841
-            fs, "put_file"
-        ) as mock_put:
+        ) as mock_exists, patch.object(fs, "_download_to_fileobj"), patch.object(
+            fs, "_upload_fileobj", return_value=(None, None)
+        ) as mock_upload:
             mock_info.side_effect = [
                 {"type": "file", "checksum": "abc123"},  # Source
                 {"type": "file", "checksum": "abc123"},  # Dest after copy
@@ -944,9 +1932,31 @@ class TestCopyOperations:
                 overwrite=True,
             )
 
-            mock_put.assert_called_once()
+            mock_upload.assert_called_once()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_same_path_is_noop(self, mock_client_class):
+        """Test that copying a path onto itself does no transfer."""
+        fs = OSFFileSystem(token="test_token")
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+        with patch.object(fs, "exists", return_value=True), patch.object(
+            fs, "info"
+        ) as mock_info, patch.object(fs, "_server_side_copy") as mock_copy:
+            fs.cp("osf://abc123/osfstorage/a.txt", "osf://abc123/osfstorage/a.txt")
+
+        mock_info.assert_not_called()
+        mock_copy.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_same_path_missing_source(self, mock_client_class):
+        """Test that a same-path copy of a missing file still fails."""
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(fs, "exists", return_value=False):
+            with pytest.raises(OSFNotFoundError, match="Source not found"):
+                fs.cp("osf://abc123/osfstorage/a.txt", "osf://abc123/osfstorage/a.txt")
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_cp_cross_project(self, mock_client_class):
         """Test cp raises OSFOperationNotSupportedError for cross-project copy."""
         fs = OSFFileSystem(token="test_token")
@@ -960,73 +1970,182 @@ class TestCopyOperations:
                     "osf://xyz789/osfstorage/dest.txt",
                 )
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
-    def test_cp_recursive_directory(self, mock_client_class):
+    @patch.object(OSFFileSystem, "_server_side_copy", return_value=None)
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_recursive_directory(self, mock_client_class, mock_server_copy):
         """Test recursive directory copy."""
         fs = OSFFileSystem(token="test_token")
+        listing = _DirListing(
+            {
+                "file1.txt": {
+                    "name": "osf://abc123/osfstorage/dir/file1.txt",
+                    "type": "file",
+                    "checksum": "abc123",
+                },
+                "sub": {
+                    "name": "osf://abc123/osfstorage/dir/sub",
+                    "type": "directory",
+                },
+            },
+            {},
+            "",
+        )
+        sub_listing = _DirListing(
+            {
+                "file2.txt": {
+                    "name": "osf://abc123/osfstorage/dir/sub/file2.txt",
+                    "type": "file",
+                    "checksum": "abc123",
+                },
+            },
+            {},
+            "",
+        )
+        threads = set()
+
+        with patch.object(
+            fs, "info", return_value={"type": "directory"}
+        ) as mock_info, patch.object(
+            fs, "_list_dir", side_effect=[listing, sub_listing]
+        ) as mock_list, patch.object(
+            fs,
+            "_download_to_fileobj",
+            side_effect=lambda *a: threads.add(threading.current_thread().name),
+        ) as mock_download, patch.object(
+            fs, "_upload_fileobj", return_value=(None, "abc123")
+        ) as mock_upload:
+            fs.cp(
+                "osf://abc123/osfstorage/dir",
+                "osf://abc123/osfstorage/newdir",
+                recursive=True,
+            )
 
-        with patch.object(fs, "info") as mock_info, patch.object(
-            fs, "ls"
-        ) as mock_ls, patch.object(fs, "exists") as mock_exists, patch.object(
-            fs, "get_file"
-        ) as mock_get, patch.object(
-            fs, "put_file"
-        ) as mock_put:
-            # Mock info to return directory type first, then file types
-            mock_info.side_effect = [
-                {"type": "directory"},  # Source directory
-                {"type": "file", "checksum": "abc123"},  # file1 source
-                {"type": "file", "checksum": "abc123"},  # file1 dest
-                {"type": "file", "checksum": "def456"},  # file2 source
-                {"type": "file", "checksum": "def456"},  # file2 dest
+            # Each directory is listed once and its entries are not re-queried
+            assert [c.args[2] for c in mock_list.call_args_list] == ["dir", "dir/sub"]
+            mock_info.assert_called_once()
+            # Should have copied both files (concurrently, in any order)
+            assert mock_download.call_count == 2
+            assert sorted(c.args[1] for c in mock_upload.call_args_list) == [
+                "osf://abc123/osfstorage/newdir/file1.txt",
+                "osf://abc123/osfstorage/newdir/sub/file2.txt",
             ]
+            assert all(name.startswith("dvc-osf-copy") for name in threads)
+
+    @patch.object(OSFFileSystem, "_server_side_copy", return_value=None)
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_recursive_skip_identical(self, mock_client_class, mock_server_copy):
+        """Test that skip_identical leaves files already at the destination."""
+        fs = OSFFileSystem(token="test_token")
 
-            # Mock directory listing
-            from dvc_osf.utils import serialize_path
+        def _file(name, checksum):
+            return {"name": name, "type": "file", "checksum": checksum}
 
-            mock_ls.return_value = [
+        listings = {
+            "dir": _DirListing(
                 {
-                    "name": serialize_path("abc123", "osfstorage", "dir/file1.txt"),
-                    "type": "file",
+                    "same.txt": _file("osf://abc123/osfstorage/dir/same.txt", "aaa"),
+                    "new.txt": _file("osf://abc123/osfstorage/dir/new.txt", "bbb"),
+                    "sub": {
+                        "name": "osf://abc123/osfstorage/dir/sub",
+                        "type": "directory",
+                    },
                 },
+                {},
+                "",
+            ),
+            "dir/sub": _DirListing(
+                {"deep.txt": _file("osf://abc123/osfstorage/dir/sub/deep.txt", "ccc")},
+                {},
+                "",
+            ),
+            "out": _DirListing(
                 {
-                    "name": serialize_path("abc123", "osfstorage", "dir/file2.txt"),
-                    "type": "file",
+                    "same.txt": _file("osf://abc123/osfstorage/out/same.txt", "aaa"),
+                    "new.txt": _file("osf://abc123/osfstorage/out/new.txt", "old"),
                 },
-            ]
+                {},
+                "",
+            ),
+        }
 
-            mock_exists.return_value = False
+        def list_dir(project, provider, path):
+            if path not in listings:
+                raise OSFNotFoundError(path)
+            return listings[path]
 
-            with patch("dvc_osf.filesystem.tempfile.mkstemp") as mock_mkstemp, patch(
-                "os.path.exists"
-            ) as mock_exists_os, patch(
-                "os.remove"
-            ) as mock_remove, patch(  # noqa: F841
-                "os.close"
-            ) as mock_close:  # noqa: F841
-                mock_mkstemp.return_value = (42, "/tmp/test_temp")
-                mock_exists_os.return_value = True
+        with patch.object(fs, "info", return_value={"type": "directory"}), patch.object(
+            fs, "_list_dir", side_effect=list_dir
+        ), patch.object(fs, "_download_to_fileobj"), patch.object(
+            fs, "_upload_fileobj", side_effect=lambda f, p, s: (None, None)
+        ) as mock_upload:
+            fs.cp(
+                "osf://abc123/osfstorage/dir",
+                "osf://abc123/osfstorage/out",
+                recursive=True,
+                skip_identical=True,
+            )
 
-                fs.cp(
-                    "osf://abc123/osfstorage/dir",
-                    "osf://abc123/osfstorage/newdir",
-                    recursive=True,
-                )
+        assert sorted(c.args[1] for c in mock_upload.call_args_list) == [
+            "osf://abc123/osfstorage/out/new.txt",
+            "osf://abc123/osfstorage/out/sub/deep.txt",
+        ]
 
-                # Should have called ls to get directory contents
-                mock_ls.assert_called_once()
-                # Should have copied both files
-                assert mock_get.call_count == 2
-                assert mock_put.call_count == 2
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_cp_recursive_server_side_shares_lookups(self, mock_client_class):
+        """Test that siblings reuse the source listing and destination folder."""
+        mock_client = mock_client_class.return_value
+        mock_client.post.return_value = _json_response({"data": {"attributes": {}}})
+        fs = OSFFileSystem(token="test_token")
+        listing = _DirListing(
+            {
+                name: {"name": f"osf://abc123/osfstorage/dir/{name}", "type": "file"}
+                for name in ("a.txt", "b.txt")
+            },
+            {
+                name: {"move": f"https://files.osf.io/v1/{name}"}
+                for name in ("a.txt", "b.txt")
+            },
+            "",
+        )
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+        def list_dir(project_id, provider, dir_path):
+            if dir_path == "dir":
+                return listing
+            raise OSFNotFoundError("not found")
+
+        with patch.object(fs, "info", return_value={"type": "directory"}), patch.object(
+            fs, "_list_dir", side_effect=list_dir
+        ), patch.object(
+            fs,
+            "_navigate_to_dir",
+            return_value=(
+                "",
+                "https://files.osf.io/v1/resources/abc123/providers/osfstorage/n1/",
+            ),
+        ) as mock_navigate:
+            fs.cp(
+                "osf://abc123/osfstorage/dir",
+                "osf://abc123/osfstorage/newdir",
+                recursive=True,
+            )
+
+        mock_navigate.assert_called_once_with(
+            "abc123", "osfstorage", "newdir", create_missing=True
+        )
+        assert [c.kwargs["json"]["path"] for c in mock_client.post.call_args_list] == [
+            "/n1/",
+            "/n1/",
+        ]
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_cp_empty_directory(self, mock_client_class):
         """Test copying empty directory."""
         fs = OSFFileSystem(token="test_token")
 
-        with patch.object(fs, "info") as mock_info, patch.object(fs, "ls") as mock_ls:
+        with patch.object(fs, "info") as mock_info, patch.object(
+            fs, "_list_dir", return_value=_DirListing({}, {}, "")
+        ) as mock_list:
             mock_info.return_value = {"type": "directory"}
-            mock_ls.return_value = []  # Empty directory
 
             # Should succeed without error
             fs.cp(
@@ -1035,44 +2154,80 @@ class TestCopyOperations:
                 recursive=True,
             )
 
-            mock_ls.assert_called_once()
+            mock_list.assert_called_once()
 
 
 class TestMoveOperations:
     """Tests for mv() method."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_mv_single_file(self, mock_client_class):
         """Test moving a single file."""
         fs = OSFFileSystem(token="test_token")
+        src_info = {"type": "file", "checksum": "abc"}
 
-        with patch.object(fs, "exists") as mock_exists, patch.object(
-            fs, "cp"
-        ) as mock_cp, patch.object(fs, "rm") as mock_rm:
-            mock_exists.side_effect = [
-                False,
-                True,
-            ]  # Dest doesn't exist, then exists after copy
-
+        with patch.object(fs, "info", return_value=src_info) as mock_info, patch.object(
+            fs, "exists"
+        ) as mock_exists, patch.object(
+            fs, "cp", return_value="abc"
+        ) as mock_cp, patch.object(
+            fs, "rm"
+        ) as mock_rm:
             fs.mv(
                 "osf://abc123/osfstorage/source.txt", "osf://abc123/osfstorage/dest.txt"
             )
 
-            mock_cp.assert_called_once()
+            # The source is looked up once and handed to cp, which checks
+            # the destination and verifies the copy by checksum itself
+            mock_info.assert_called_once()
+            mock_exists.assert_not_called()
+            assert mock_cp.call_args.kwargs["_src_info"] is src_info
+            assert mock_cp.call_args.kwargs["overwrite"] is False
             mock_rm.assert_called_once()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_mv_unverified_copy_checks_destination(self, mock_client_class):
+        """Test that a copy cp could not verify is checked before deleting."""
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(fs, "info", return_value={"type": "file"}), patch.object(
+            fs, "exists", return_value=False
+        ) as mock_exists, patch.object(fs, "cp", return_value=None), patch.object(
+            fs, "rm"
+        ) as mock_rm:
+            with pytest.raises(OSFIntegrityError, match="destination not found"):
+                fs.mv(
+                    "osf://abc123/osfstorage/source.txt",
+                    "osf://abc123/osfstorage/dest.txt",
+                )
+
+        mock_exists.assert_called_once_with("osf://abc123/osfstorage/dest.txt")
+        mock_rm.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_mv_missing_source(self, mock_client_class):
+        """Test mv raises OSFNotFoundError without copying a missing source."""
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(
+            fs, "info", side_effect=OSFNotFoundError("gone")
+        ), patch.object(fs, "cp") as mock_cp:
+            with pytest.raises(OSFNotFoundError, match="Source not found"):
+                fs.mv(
+                    "osf://abc123/osfstorage/source.txt",
+                    "osf://abc123/osfstorage/dest.txt",
+                )
+
+        mock_cp.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_mv_delete_fails(self, mock_client_class):
         """Test mv logs warning but doesn't raise if delete fails."""
         fs = OSFFileSystem(token="test_token")
 
-        with patch.object(fs, "exists") as mock_exists, patch.object(
+        with patch.object(fs, "info", return_value={"type": "file"}), patch.object(
             fs, "cp"
         ) as mock_cp, patch.object(fs, "rm") as mock_rm:
-            mock_exists.side_effect = [
-                False,
-                True,
-            ]  # Dest doesn't exist, then exists after copy
             mock_rm.side_effect = OSFNotFoundError("Delete failed")
 
             # Should not raise exception
@@ -1083,15 +2238,14 @@ class TestMoveOperations:
             mock_cp.assert_called_once()
             mock_rm.assert_called_once()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_mv_copy_fails(self, mock_client_class):
         """Test mv raises exception if copy fails."""
         fs = OSFFileSystem(token="test_token")
 
-        with patch.object(fs, "exists") as mock_exists, patch.object(
+        with patch.object(fs, "info", return_value={"type": "file"}), patch.object(
             fs, "cp"
         ) as mock_cp, patch.object(fs, "rm") as mock_rm:
-            mock_exists.return_value = False
             mock_cp.side_effect = OSFNotFoundError("Copy failed")
 
             with pytest.raises(OSFNotFoundError, match="Copy failed"):
@@ -1104,14 +2258,27 @@ class TestMoveOperations:
             # rm should not be called if copy fails
             mock_rm.assert_not_called()
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_mv_same_path_is_noop(self, mock_client_class):
+        """Test that moving a path onto itself neither copies nor deletes."""
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(fs, "exists", return_value=True), patch.object(
+            fs, "cp"
+        ) as mock_cp, patch.object(fs, "rm") as mock_rm:
+            fs.mv("osf://abc123/osfstorage/a.txt", "osf://abc123/osfstorage/a.txt")
+
+        mock_cp.assert_not_called()
+        mock_rm.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_mv_recursive_directory(self, mock_client_class):
         """Test moving directory recursively."""
         fs = OSFFileSystem(token="test_token")
 
-        with patch.object(fs, "exists") as mock_exists, patch.object(
-            fs, "cp"
-        ) as mock_cp, patch.object(
+        with patch.object(fs, "info", return_value={"type": "directory"}), patch.object(
+            fs, "exists"
+        ) as mock_exists, patch.object(fs, "cp") as mock_cp, patch.object(
             fs, "rm"
         ) as mock_rm:  # noqa: F841
             mock_exists.side_effect = [False, True]
@@ -1131,7 +2298,7 @@ class TestMoveOperations:
 class TestBatchOperations:
     """Tests for batch operation methods."""
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_batch_copy(self, mock_client_class):
         """Test batch copy with multiple files."""
         fs = OSFFileSystem(token="test_token")
@@ -1150,17 +2317,17 @@ class TestBatchOperations:
             assert len(result["errors"]) == 0
             assert mock_cp.call_count == 2
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_batch_copy_partial_failure(self, mock_client_class):
         """Test batch copy with some failures."""
         fs = OSFFileSystem(token="test_token")
 
-        with patch.object(fs, "cp") as mock_cp:
-            mock_cp.side_effect = [
-                None,  # First succeeds
-                OSFNotFoundError("File not found"),  # Second fails
-                None,  # Third succeeds
-            ]
+        def cp(src, dst, overwrite=True):
+            # Copies run concurrently, so fail by path, not call order
+            if src.endswith("file2.txt"):
+                raise OSFNotFoundError("File not found")
+
+        with patch.object(fs, "cp", side_effect=cp):
 
             pairs = [
                 ("osf://abc/file1.txt", "osf://abc/dest1.txt"),
@@ -1176,7 +2343,7 @@ class TestBatchOperations:
             assert len(result["errors"]) == 1
             assert result["errors"][0][0] == "osf://abc/file2.txt"
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_batch_move(self, mock_client_class):
         """Test batch move with multiple files."""
         fs = OSFFileSystem(token="test_token")
@@ -1194,7 +2361,7 @@ class TestBatchOperations:
             assert result["failed"] == 0
             assert mock_mv.call_count == 2
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_batch_delete(self, mock_client_class):
         """Test batch delete with multiple files."""
         fs = OSFFileSystem(token="test_token")
@@ -1212,7 +2379,7 @@ class TestBatchOperations:
             assert result["failed"] == 0
             assert mock_rm.call_count == 2
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_batch_operations_empty_list(self, mock_client_class):
         """Test batch operations raise ValueError for empty lists."""
         fs = OSFFileSystem(token="test_token")
@@ -1226,7 +2393,7 @@ class TestBatchOperations:
         with pytest.raises(ValueError, match="cannot be empty"):
             fs.batch_delete([])
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_batch_operations_duplicate_destinations(self, mock_client_class):
         """Test batch operations raise ValueError for duplicate destinations."""
         fs = OSFFileSystem(token="test_token")
@@ -1239,10 +2406,10 @@ class TestBatchOperations:
         with pytest.raises(ValueError, match="Duplicate destinations"):
             fs.batch_copy(pairs)
 
-        with pytest.raises(ValueError, match="Duplicate destinations"):
+        with pytest.raises(ValueError, match="dest.txt"):
             fs.batch_move(pairs)
 
-    @patch("dvc_osf.filesystem.OSFAPIClient")
+    @patch("dvc_osf.api.OSFAPIClient")
     def test_progress_callback(self, mock_client_class):
         """Test progress callback is invoked correctly."""
         fs = OSFFileSystem(token="test_token")
@@ -1260,9 +2427,230 @@ class TestBatchOperations:
 
             fs.batch_copy(pairs, callback=callback)
 
-            assert len(callback_calls) == 2
-            assert callback_calls[0] == (1, 2, "osf://abc/file1.txt", "copy")
-            assert callback_calls[1] == (2, 2, "osf://abc/file2.txt", "copy")
+            # Called in completion order, which may differ from input order
+            assert [c[:2] for c in callback_calls] == [(1, 2), (2, 2)]
+            assert {c[2] for c in callback_calls} == {
+                "osf://abc/file1.txt",
+                "osf://abc/file2.txt",
+            }
+            assert all(c[3] == "copy" for c in callback_calls)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _copying_fs(mock_client_class, copied_md5s):
+        """Filesystem whose file copies report the given MD5s in turn."""
+        mock_client = mock_client_class.return_value
+        mock_client._cancel = threading.Event()
+        fs = OSFFileSystem(token="test_token")
+        written = set()
+
+        def copy_via_download(path1, path2):
+            written.add(path2)
+            return next(copied_md5s)
+
+        with patch.object(
+            fs, "info", return_value={"type": "file", "checksum": "abc"}
+        ), patch.object(fs, "exists", side_effect=lambda p: p in written), patch.object(
+            fs, "_server_side_copy", return_value=None
+        ), patch.object(
+            fs, "_copy_via_download", side_effect=copy_via_download
+        ) as mock_copy, patch.object(
+            mock_client._cancel, "wait", return_value=False
+        ) as mock_wait:
+            yield fs, mock_copy, mock_wait
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_copy_redoes_failed_verification(self, mock_client_class):
+        """Test that a copy failing verification is redone over its bad result."""
+        with self._copying_fs(mock_client_class, iter(["bad", "abc"])) as (
+            fs,
+            mock_copy,
+            mock_wait,
+        ):
+            result = fs.batch_copy(
+                [("osf://abc/a.txt", "osf://abc/b.txt")], overwrite=False
+            )
+
+        # The redo replaces the destination the first attempt wrote instead
+        # of failing on it with "Destination exists"
+        assert result["success"] == 1
+        assert mock_copy.call_count == 2
+        assert mock_wait.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_move_reports_persistent_mismatch(self, mock_client_class):
+        """Test that a move failing every verification reports the mismatch."""
+        with self._copying_fs(mock_client_class, itertools.repeat("bad")) as (
+            fs,
+            mock_copy,
+            _,
+        ), patch.object(fs, "rm") as mock_rm:
+            result = fs.batch_move([("osf://abc/a.txt", "osf://abc/b.txt")])
+
+        assert result["success"] == 0
+        assert "Checksum mismatch" in result["errors"][0][2]
+        assert mock_copy.call_count == 1 + BATCH_RETRIES
+        # The source is kept
+        mock_rm.assert_not_called()
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_retry_wait_ends_on_close(self, mock_client_class):
+        """Test that a closed client stops a batch item's retry wait."""
+        with self._copying_fs(mock_client_class, itertools.repeat("bad")) as (
+            fs,
+            mock_copy,
+            mock_wait,
+        ):
+            # The client is closed during the backoff
+            mock_wait.return_value = True
+            result = fs.batch_copy([("osf://abc/a.txt", "osf://abc/b.txt")])
+
+        assert "Checksum mismatch" in result["errors"][0][2]
+        assert mock_copy.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_does_not_retry_request_errors(self, mock_client_class):
+        """Test that errors the client already retried fail the item at once."""
+        mock_client_class.return_value._cancel = threading.Event()
+        fs = OSFFileSystem(token="test_token")
+
+        with patch.object(
+            fs, "cp", side_effect=OSFAPIError("Bad gateway", status_code=502)
+        ) as mock_cp:
+            result = fs.batch_copy([("osf://abc/a.txt", "osf://abc/b.txt")])
+
+        assert result["errors"] == [
+            ("osf://abc/a.txt", "osf://abc/b.txt", "Bad gateway")
+        ]
+        assert mock_cp.call_count == 1
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_copy_iter_yields_each_result(self, mock_client_class):
+        """Test that batch_copy_iter streams one BatchResult per pair."""
+        fs = OSFFileSystem(token="test_token")
+        pairs = [
+            ("osf://abc/a.txt", "osf://abc/x/a.txt"),
+            ("osf://abc/b.txt", "osf://abc/x/b.txt"),
+        ]
+
+        def cp(src, dst, overwrite):
+            if src.endswith("b.txt"):
+                raise OSFNotFoundError("missing")
+
+        with patch.object(fs, "cp", side_effect=cp):
+            results = sorted(fs.batch_copy_iter(pairs))
+
+        assert results == [
+            BatchResult("osf://abc/a.txt", "osf://abc/x/a.txt", None),
+            BatchResult("osf://abc/b.txt", "osf://abc/x/b.txt", "missing"),
+        ]
+        assert [r.succeeded for r in results] == [True, False]
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_iter_validates_eagerly(self, mock_client_class):
+        """Test that the iterator variants reject bad input before iterating."""
+        fs = OSFFileSystem(token="test_token")
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            fs.batch_delete_iter([])
+        with pytest.raises(ValueError, match="Duplicate destinations"):
+            fs.batch_move_iter(
+                [("osf://abc/a", "osf://abc/c"), ("osf://abc/b", "osf://abc/c")]
+            )
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_delete_iter_bounds_queued_work(self, mock_client_class):
+        """Test that only a few deletes per worker are queued ahead."""
+        fs = OSFFileSystem(token="test_token")
+        started = []
+
+        with patch.object(fs, "rm_file", side_effect=started.append):
+            results = fs.batch_delete_iter(
+                [f"osf://abc/f{i}.txt" for i in range(50)], max_workers=2
+            )
+            first = next(results)
+            # 2 workers x 2 queued each, plus one topped up per completion
+            assert len(started) <= 6
+            rest = list(results)
+
+        assert first.destination is None
+        assert len(rest) == 49
+        assert all(r.succeeded for r in rest)
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_batch_delete_runs_concurrently(self, mock_client_class):
+        """Test that batch operations overlap up to max_workers at once."""
+        fs = OSFFileSystem(token="test_token")
+        barrier = threading.Barrier(3, timeout=5)
+
+        def rm_file(path):
+            # Only returns once three deletes are in flight together
+            barrier.wait()
+            if path.endswith("2.txt"):
+                raise OSFNotFoundError("gone")
+
+        with patch.object(fs, "rm_file", side_effect=rm_file):
+            result = fs.batch_delete(
+                [f"osf://abc/file{i}.txt" for i in range(6)], max_workers=3
+            )
+
+        assert result["success"] == 5
+        assert result["errors"] == [("osf://abc/file2.txt", "gone")]
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_map_paths_capped_at_pool_size(self, mock_client_class):
+        """Test that a batch_size above the pool never opens extra workers."""
+        fs = OSFFileSystem(token="test_token", connection_pool_size=2)
+
+        with patch(
+            "dvc_osf.filesystem.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_executor:
+            fs._map_paths(str, ["a", "b", "c", "d"], batch_size=16)
+
+        assert mock_executor.call_args.kwargs["max_workers"] == 2
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_map_paths_cancels_queued_calls_on_error(self, mock_client_class):
+        """Test that calls not yet started are dropped after the first failure."""
+        fs = OSFFileSystem(token="test_token", connection_pool_size=2)
+        called = []
+
+        def probe(path):
+            called.append(path)
+            if path == "a":
+                raise OSFNotFoundError("gone")
+            time.sleep(0.05)
+
+        with pytest.raises(OSFNotFoundError, match="gone"):
+            fs._map_paths(probe, list("abcdefgh"))
+
+        # "a" fails at once; only calls already running or picked up by
+        # the other worker before the cancellation run
+        assert "a" in called
+        assert len(called) < 8
+
+    @patch("dvc_osf.api.OSFAPIClient")
+    def test_nested_fanout_runs_inline(self, mock_client_class):
+        """Test that fan-out inside a batch worker does not open another pool."""
+        fs = OSFFileSystem(token="test_token")
+        main = threading.current_thread()
+        inner_threads = set()
+
+        def copy_tree(src, dst, overwrite):
+            outer = threading.current_thread()
+            assert outer is not main
+            fs._map_paths(
+                lambda p: inner_threads.add(threading.current_thread() is outer),
+                ["a", "b", "c"],
+            )
+
+        with patch.object(fs, "cp", side_effect=copy_tree):
+            result = fs.batch_copy(
+                [("osf://abc/d1", "osf://abc/e1"), ("osf://abc/d2", "osf://abc/e2")]
+            )
+
+        assert result["success"] == 2
+        assert inner_threads == {True}
 
 
 class TestOSFFileSystemIsfileIsdir:
@@ -0,0 +1,97 @@
+"""Tests for the retry helper."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dvc_osf._retry import retry_with_backoff
+from dvc_osf.exceptions import (
+    OSFAPIError,
+    OSFAuthenticationError,
+    OSFNotFoundError,
+    OSFRateLimitError,
+)
+
+
+class TestRetryWithBackoff:
+    """Tests for retry_with_backoff."""
+
+    @patch("dvc_osf._retry.random.uniform", return_value=0.0)
+    @patch("dvc_osf._retry.time.sleep")
+    def test_retries_retryable_errors_with_exponential_backoff(
+        self, mock_sleep, mock_uniform
+    ):
+        """Test that retryable errors are retried with doubling delays."""
+        fn = Mock(
+            side_effect=[
+                OSFAPIError("Bad gateway", status_code=502),
+                OSFAPIError("Bad gateway", status_code=502),
+                "ok",
+            ]
+        )
+
+        assert retry_with_backoff(fn, max_retries=3, base=1.0) == "ok"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0]
+
+    @patch("dvc_osf._retry.time.sleep")
+    def test_non_retryable_error_raised_immediately(self, mock_sleep):
+        """Test that errors not flagged retryable are not retried."""
+        fn = Mock(side_effect=OSFAuthenticationError())
+
+        with pytest.raises(OSFAuthenticationError):
+            retry_with_backoff(fn)
+
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("dvc_osf._retry.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """Test that the last error is raised once retries run out."""
+        fn = Mock(side_effect=OSFAPIError("Unavailable", status_code=503))
+
+        with pytest.raises(OSFAPIError):
+            retry_with_backoff(fn, max_retries=2)
+
+        assert fn.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("dvc_osf._retry.time.sleep")
+    def test_delay_capped(self, mock_sleep):
+        """Test that backoff never exceeds cap plus jitter."""
+        fn = Mock(side_effect=[OSFAPIError("Unavailable", status_code=503), "ok"])
+
+        retry_with_backoff(fn, base=100.0, cap=5.0, jitter=0.5)
+
+        assert 5.0 <= mock_sleep.call_args[0][0] <= 7.5
+
+    @patch("dvc_osf.exceptions.random.uniform", return_value=0.0)
+    @patch("dvc_osf._retry.time.sleep")
+    def test_honors_retry_after(self, mock_sleep, mock_uniform):
+        """Test that rate limit errors wait for Retry-After."""
+        fn = Mock(side_effect=[OSFRateLimitError(retry_after=7), "ok"])
+
+        retry_with_backoff(fn)
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("dvc_osf._retry.time.sleep")
+    def test_retry_on_overrides_retryable(self, mock_sleep):
+        """Test that retry_on selects which errors are retried."""
+        fn = Mock(side_effect=[OSFNotFoundError("Not yet visible"), "ok"])
+
+        assert retry_with_backoff(fn, retry_on=(OSFNotFoundError,)) == "ok"
+        assert fn.call_count == 2
+
+    @patch("dvc_osf._retry.time.sleep")
+    def test_cancel_ends_wait_and_reraises(self, mock_sleep):
+        """Test that a set cancel event stops retrying with the last error."""
+        fn = Mock(side_effect=[OSFAPIError("Unavailable", status_code=503), "ok"])
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(OSFAPIError):
+            retry_with_backoff(fn, cancel=cancel)
+
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
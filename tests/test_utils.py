@@ -1,20 +1,24 @@
 """Tests for OSF utility functions."""
 
+import hashlib
 import io
 
 import pytest
 
+from dvc_osf.config import Config
 from dvc_osf.utils import (
     ProgressTracker,
     chunk_file,
     compute_upload_checksum,
     determine_upload_strategy,
+    dump_json,
     format_bytes,
     get_directory,
     get_file_size,
     get_filename,
     get_parent,
     join_path,
+    load_json,
     normalize_path,
     parse_osf_url,
     path_to_api_url,
@@ -184,6 +188,15 @@ class TestPathToApiUrl:
             "https://api.osf.io/v2/nodes/abc123/files/osfstorage/data/subdir/file.csv/"
         )
 
+    def test_path_to_api_url_follows_endpoint_changes(self, monkeypatch):
+        """Test that memoization does not pin the configured endpoint."""
+        path_to_api_url("abc123", "osfstorage", "file.csv")
+        monkeypatch.setattr(Config, "API_BASE_URL", "https://test.osf.io/v2")
+
+        url = path_to_api_url("abc123", "osfstorage", "file.csv")
+
+        assert url.startswith("https://test.osf.io/v2/")
+
 
 class TestSerializePath:
     """Tests for serialize_path function."""
@@ -292,6 +305,22 @@ class TestValidateOSFUrl:
             validate_osf_url("osf:///osfstorage/file.csv")
 
 
+class TestJSONHelpers:
+    """Tests for load_json and dump_json."""
+
+    def test_round_trip(self):
+        """Test that payloads survive an encode/decode round trip."""
+        payload = {"data": [{"id": "abc", "attributes": {"size": 3}}], "links": {}}
+        encoded = dump_json(payload)
+        assert isinstance(encoded, bytes)
+        assert load_json(encoded) == payload
+
+    def test_load_invalid_raises_value_error(self):
+        """Test that malformed bodies raise ValueError for either backend."""
+        with pytest.raises(ValueError):
+            load_json(b"<html>")
+
+
 class TestComputeUploadChecksum:
     """Tests for compute_upload_checksum function."""
 
@@ -315,6 +344,40 @@ class TestComputeUploadChecksum:
         checksum = compute_upload_checksum(file_obj)
         assert len(checksum) == 32  # MD5 is 32 hex chars
 
+    def test_compute_checksum_from_current_position(self):
+        """Test that hashing starts at the current position and restores it."""
+        file_obj = io.BytesIO(b"Hello, World!")
+        file_obj.seek(7)
+        checksum = compute_upload_checksum(file_obj)
+        assert checksum == hashlib.md5(b"World!").hexdigest()
+        assert file_obj.tell() == 7
+
+    def test_compute_checksum_read_only_file_object(self):
+        """Test file-likes without readinto are hashed via read()."""
+
+        class Reader:
+            def __init__(self, data):
+                self._file = io.BytesIO(data)
+                self.read = self._file.read
+                self.seek = self._file.seek
+                self.tell = self._file.tell
+
+        checksum = compute_upload_checksum(Reader(b"Hello, World!"))
+        assert checksum == "65a8e27d8879283831b664bd8b7f0ad4"
+
+    @pytest.mark.parametrize("data", [b"Hello, World!", b""])
+    def test_compute_checksum_mmap_without_file_digest(
+        self, data, tmp_path, monkeypatch
+    ):
+        """Test the memory-mapped path used before Python 3.11."""
+        monkeypatch.setattr("dvc_osf.utils._file_digest", None)
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+
+        with open(path, "rb") as f:
+            assert compute_upload_checksum(f) == hashlib.md5(data).hexdigest()
+            assert f.tell() == 0
+
 
 class TestChunkFile:
     """Tests for chunk_file function."""